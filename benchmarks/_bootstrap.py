@@ -0,0 +1,87 @@
+"""
+Shared start-up for the benchmark scripts.
+
+The benchmarks are run with mayapy, eg.:
+    path/to/mayapy benchmarks/bench_nodeConvert.py --count 1000
+
+or headless with a plain python 2.7 against the in-memory stand-in of the standin package:
+    SHADERHELPER_STANDIN=1 python benchmarks/bench_nodeConvert.py --count 1000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+PLUGIN = os.path.join(ROOT, "shaderHelper.py")
+# -run against the stand-in instead of a maya session
+STANDIN = os.environ.get("SHADERHELPER_STANDIN", "") not in ("", "0")
+
+
+def initialize(plugins=("mtoa",)):
+    """
+    Start a standalone maya session and load the shaderHelper plug-in.
+    With SHADERHELPER_STANDIN set, the stand-in is installed in place of maya first.
+
+    Args:
+        plugins ([iterable], optional): Additional plug-ins which should be loaded. Defaults to ("mtoa",).
+    """
+    if SRC not in sys.path:
+        sys.path.insert(0, SRC)
+
+    if STANDIN:
+        import standin
+        standin.install()
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+
+    from maya import cmds
+    for p in plugins:
+        cmds.loadPlugin(p, quiet=True)
+    cmds.loadPlugin(PLUGIN, quiet=True)
+
+
+def new_scene():
+    """
+    Open a new, empty scene.
+    """
+    from maya import cmds
+    cmds.file(new=True, force=True)
+
+
+@contextmanager
+def timer(results, key):
+    """
+    Measure the wall time of the wrapped block and store it in results.
+
+    Args:
+        results ([Dict]): Dictionary to which the time gets written.
+        key ([String]): Key under which the time gets written.
+    """
+    start = time.time()
+    yield
+    results[key] = time.time() - start
+
+
+def report(title, results, baseline=None):
+    """
+    Print the results of a benchmark, optionally with the speed-up against a baseline key.
+
+    Args:
+        title ([String]): Title of the benchmark.
+        results ([Dict]): Key to seconds dictionary.
+        baseline ([String], optional): Key of the result the others are compared to. Defaults to None.
+    """
+    print("\n{0}".format(title))
+    width = len(max(results, key=len))
+    for key, secs in sorted(results.items(), key=lambda i: i[1]):
+        line = "  {0:<{width}} : {1:>10.4f}s".format(key, secs, width=width)
+        if baseline and key != baseline and secs:
+            line += "  ({0:.2f}x)".format(results[baseline] / secs)
+        print(line)
@@ -0,0 +1,245 @@
+"""
+Measuring, storing and comparing the results of the benchmark suite.
+
+A measurement holds the wall time, the peak memory and the calls made into the Maya API and cmds.
+Results are stored as JSON, a stored run can be given as baseline so regressions fail the run.
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+from collections import Counter
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # -python 2 builds of maya, the peak resident memory is used instead
+    tracemalloc = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class CallCounter(object):
+    """
+    Count the calls into the DG layer while active, through a profile function.
+    Only calls from outside of it are counted, not the ones it makes internally.
+    It slows down every python call, so counting and timing are separate runs.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __enter__(self):
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(None)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def _profile(self, frame, event, arg):
+        if event == "c_call":
+            owner = getattr(arg, "__self__", None)
+            module = getattr(arg, "__module__", None) or type(owner).__module__
+            if _is_dg(module):
+                name = getattr(owner, "__name__", None) or type(owner).__name__
+                self.counts["%s.%s" % (name, arg.__name__)] += 1
+
+        elif event == "call":
+            if not _is_dg(frame.f_globals.get("__name__")):
+                return
+            caller = frame.f_back
+            if caller is not None and _is_dg(caller.f_globals.get("__name__")):
+                return
+
+            code = frame.f_code
+            owner = frame.f_locals.get("self") if code.co_argcount else None
+            if owner is not None:
+                name = type(owner).__name__
+            else:
+                name = frame.f_globals["__name__"].rpartition(".")[2]
+            self.counts["%s.%s" % (name, code.co_name)] += 1
+
+
+def _is_dg(module):
+    return bool(module) and module.startswith(DG_MODULES)
+
+
+def measure(func, setup=None, count=True):
+    """
+    Run func once for the wall time and the peak memory, and once more for the DG calls if count is set.
+
+    Args:
+        func ([Callable]): Takes no arguments, called for every run.
+        setup ([Callable], optional): Called before every run, isn't measured. Defaults to None.
+        count ([Bool], optional): Determine if the calls should be counted. Defaults to True.
+
+    Returns:
+        [Dict]: seconds, peakMemory in bytes (None if it can't be measured) and
+                calls, name to count, and totalCalls if counted.
+    """
+    if setup is not None:
+        setup()
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+    rss = _peak_rss()
+
+    start = time.time()
+    func()
+    seconds = time.time() - start
+
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    elif rss is not None:
+        # -the peak of the process can't be reset, only its growth is attributed to the run
+        peak = _peak_rss() - rss
+    else:
+        peak = None
+
+    result = {"seconds": seconds, "peakMemory": peak}
+    if count:
+        if setup is not None:
+            setup()
+        with CallCounter() as counter:
+            func()
+        result["calls"] = dict(counter.counts)
+        result["totalCalls"] = counter.total
+    return result
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # -kilobytes on linux, bytes on macos
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def environment(standin):
+    """
+    Describe where the results were measured, only results of the same environment are compared.
+    """
+    return {"python": platform.python_version(),
+            "platform": sys.platform,
+            "memory": "tracemalloc" if tracemalloc is not None else "rss",
+            "standin": standin}
+
+
+# ----------------------------------Storage---------------------------------- #
+
+
+def save(path, environment, results):
+    """
+    Write the results of a run as JSON.
+
+    Args:
+        path ([String]): File which should be written.
+        environment ([Dict]): As given by environment.
+        results ([Dict]): Case name to nodes, as string, to measurement.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    with open(path, "w") as f:
+        json.dump({"environment": environment, "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                   "results": results}, f, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare(results, baseline, tolerance=0.25, floor=0.01):
+    """
+    Compare results against a stored baseline.
+
+    Wall time and memory regress if they grow by more than tolerance,
+    times below floor seconds are noise and aren't compared.
+    Call counts are exact, any growth fails, as does a changed case result.
+
+    Args:
+        results ([Dict]): Case name to nodes, as string, to measurement.
+        baseline ([Dict]): A stored run, as returned by load.
+        tolerance ([float], optional): Allowed growth, 0.25 is 25%. Defaults to 0.25.
+        floor ([float], optional): Seconds below which times aren't compared. Defaults to 0.01.
+
+    Returns:
+        [List]: Messages of every regression, empty if there are none.
+    """
+    regressions = []
+    for case, sizes in sorted(results.items()):
+        for nodes, new in sorted(sizes.items(), key=lambda i: int(i[0])):
+            old = baseline["results"].get(case, {}).get(nodes)
+            if old is None:
+                continue
+
+            label = "%s @ %s nodes" % (case, nodes)
+            if new.get("result") != old.get("result"):
+                regressions.append("%s: result changed %s -> %s" % (
+                    label, old.get("result"), new.get("result")))
+
+            if max(new["seconds"], old["seconds"]) >= floor and \
+                    new["seconds"] > old["seconds"] * (1 + tolerance):
+                regressions.append("%s: wall time %.4fs -> %.4fs (%+.0f%%)" % (
+                    label, old["seconds"], new["seconds"], _growth(old["seconds"], new["seconds"])))
+
+            if new["peakMemory"] is not None and old["peakMemory"] and \
+                    new["peakMemory"] > old["peakMemory"] * (1 + tolerance):
+                regressions.append("%s: peak memory %s -> %s (%+.0f%%)" % (
+                    label, _bytes(old["peakMemory"]), _bytes(new["peakMemory"]),
+                    _growth(old["peakMemory"], new["peakMemory"])))
+
+            if "calls" in new and "calls" in old:
+                for name in sorted(set(new["calls"]) | set(old["calls"])):
+                    before = old["calls"].get(name, 0)
+                    after = new["calls"].get(name, 0)
+                    if after > before:
+                        regressions.append("%s: %s called %d -> %d times" % (
+                            label, name, before, after))
+
+    return regressions
+
+
+def _growth(old, new):
+    return (new / float(old) - 1) * 100 if old else 0.0
+
+
+def _bytes(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if abs(value) < 1024:
+            return "%.1f%s" % (value, unit)
+        value /= 1024.0
+    return "%.1fGB" % value
+
+
+def report(results):
+    """
+    Print the results of a run, one line per case and scene size.
+    """
+    print("\n{0:<26} {1:>8} {2:>11} {3:>10} {4:>10}".format(
+        "case", "nodes", "seconds", "peak mem", "DG calls"))
+    for case, sizes in sorted(results.items()):
+        for nodes, r in sorted(sizes.items(), key=lambda i: int(i[0])):
+            print("{0:<26} {1:>8} {2:>10.4f}s {3:>10} {4:>10}".format(
+                case, nodes, r["seconds"], _bytes(r["peakMemory"]), r.get("totalCalls", "-")))
+
+
+# -modules whose calls are counted, api 2.0, cmds and the stand-in of both
+DG_MODULES = ("OpenMaya", "maya.api", "maya.cmds", "standin.OpenMaya", "standin.cmds")
@@ -0,0 +1,129 @@
+"""
+Synthetic scene generation for the benchmark scripts.
+Builds legacy shader networks with the usual file texture and place2dTexture setup.
+"""
+############# MAYA IMPORTS #############
+from maya import cmds
+
+
+# -place2dTexture to file connections as made by the hypershade
+PLACE2D_ATTRS = ("coverage", "translateFrame", "rotateFrame", "mirrorU", "mirrorV",
+                 "stagger", "wrapU", "wrapV", "repeatUV", "offset", "rotateUV",
+                 "noiseUV", "vertexUvOne", "vertexUvTwo", "vertexUvThree",
+                 "vertexCameraOne")
+PLACE2D_OUTS = (("outUV", "uvCoord"), ("outUvFilterSize", "uvFilterSize"))
+
+
+def build_fileTexture(name="file", placer=None):
+    """
+    Create a file texture node with a place2dTexture connected to it.
+
+    Args:
+        name ([String], optional): Name of the file node. Defaults to "file".
+        placer ([String], optional): Existing place2dTexture which should be used. Defaults to None.
+
+    Returns:
+        [tuple]: Name of the file node and the place2dTexture.
+    """
+    fileNode = cmds.shadingNode("file", asTexture=True, name=name)
+    placer = placer or cmds.shadingNode("place2dTexture", asUtility=True)
+
+    for attr in PLACE2D_ATTRS:
+        cmds.connectAttr("%s.%s" % (placer, attr), "%s.%s" % (fileNode, attr))
+    for src, dest in PLACE2D_OUTS:
+        cmds.connectAttr("%s.%s" % (placer, src), "%s.%s" % (fileNode, dest))
+
+    cmds.setAttr("%s.fileTextureName" % fileNode,
+                 "/textures/%s_BaseColor.exr" % name, type="string")
+    return fileNode, placer
+
+
+def build_shader(typ="lambert", textures=1, name=None):
+    """
+    Create a legacy shader with a shading group and texture its color.
+
+    Args:
+        typ ([String], optional): Shader type which should be created. Defaults to "lambert".
+        textures ([int], optional): Amount of textured attributes, 0 for none. Defaults to 1.
+        name ([String], optional): Name of the shader. Defaults to None.
+
+    Returns:
+        [String]: Name of the shader.
+    """
+    shader = cmds.shadingNode(typ, asShader=True, name=name or typ)
+    sg = cmds.sets(renderable=True, noSurfaceShader=True,
+                   empty=True, name="%sSG" % shader)
+    cmds.connectAttr("%s.outColor" % shader, "%s.surfaceShader" % sg)
+
+    targets = (("outColor", "color"), ("outAlpha", "diffuse"),
+               ("outColor", "incandescence"), ("outColor", "transparency"))
+    for src, dest in targets[:textures]:
+        fileNode, _ = build_fileTexture("%s_%s" % (shader, dest))
+        cmds.connectAttr("%s.%s" % (fileNode, src), "%s.%s" % (shader, dest))
+
+    return shader
+
+
+def build_shaders(count, typ="lambert", textures=1):
+    """
+    Create a number of textured legacy shaders.
+
+    Args:
+        count ([int]): Amount of shaders.
+        typ ([String], optional): Shader type which should be created. Defaults to "lambert".
+        textures ([int], optional): Amount of textured attributes per shader. Defaults to 1.
+
+    Returns:
+        [List]: Names of the created shaders.
+    """
+    return [build_shader(typ, textures) for _ in range(count)]
+
+
+def build_destinations(shaders, typ="aiStandardSurface"):
+    """
+    Create a destination shader for every given shader.
+
+    Args:
+        shaders ([iterable]): Names of the source shaders.
+        typ ([String], optional): Destination shader type. Defaults to "aiStandardSurface".
+
+    Returns:
+        [List]: Tuples of source and destination names.
+    """
+    return [(s, cmds.shadingNode(typ, asShader=True, name="ai_%s" % s)) for s in shaders]
+
+
+def build_clutter(count):
+    """
+    Create unrelated utility nodes, the bulk of a production scene a type filter should skip.
+
+    Args:
+        count ([int]): Amount of nodes.
+
+    Returns:
+        [List]: Names of the created nodes.
+    """
+    return [cmds.createNode("multiplyDivide") for _ in range(count)]
+
+
+def build_network(nodes=100000, shading=0.5, textures=2, types=("lambert", "blinn", "phong")):
+    """
+    Create a production sized scene, textured legacy shaders of mixed types padded with clutter.
+    Every shader has a shading group and its own file textures and place2dTextures.
+
+    Args:
+        nodes ([int], optional): Amount of nodes the scene should end up with. Defaults to 100000.
+        shading ([float], optional): Share of the nodes in shader networks. Defaults to 0.5.
+        textures ([int], optional): Amount of textured attributes per shader. Defaults to 2.
+        types ([iterable], optional): Shader types, used in turns. Defaults to ("lambert", "blinn", "phong").
+
+    Returns:
+        [tuple]: Names of the shaders and of the clutter nodes.
+    """
+    # -shader, shading group and a file and place2dTexture per texture
+    perShader = 2 + 2 * textures
+    count = max(1, int(nodes * shading) // perShader)
+
+    shaders = [build_shader(types[i % len(types)], textures) for i in range(count)]
+    clutter = build_clutter(max(0, nodes - count * perShader))
+    return shaders, clutter
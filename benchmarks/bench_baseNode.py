@@ -0,0 +1,62 @@
+"""
+Measure the construction cost of BaseNode for file texture nodes,
+lazy (only name and plugs are needed) against resolving every connection up front
+like BaseNode did before.
+
+    path/to/mayapy benchmarks/bench_baseNode.py --count 5000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000,
+                        help="Amount of file texture nodes.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How often every node gets wrapped.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize(plugins=())
+    from maya.api import OpenMaya as api2
+    from shaderHelper_plugin.scripts.baseClasses import BaseNode
+    import _scene
+
+    _bootstrap.new_scene()
+    for i in range(args.count):
+        _scene.build_fileTexture("file%s" % i)
+
+    it = api2.MItDependencyNodes(api2.MFn.kFileTexture)
+    mobjs = []
+    while not it.isDone():
+        mobjs.append(it.thisNode())
+        it.next()
+
+    def eager():
+        for mobj in mobjs:
+            node = BaseNode(mobj)
+            node.connectedNodes
+            node.get_plugFrStr("colorSpace")
+
+    def lazy():
+        for mobj in mobjs:
+            node = BaseNode(mobj)
+            node.get_plugFrStr("colorSpace")
+
+    results = {}
+    for key, func in (("eager (before)", eager), ("lazy", lazy)):
+        with _bootstrap.timer(results, key):
+            for _ in range(args.repeat):
+                func()
+
+    _bootstrap.report("BaseNode construction, {0} file nodes x {1}".format(args.count, args.repeat),
+                      results, baseline="eager (before)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare reading and writing the mapped attribute values plug by plug,
+like eval_attributes and queue_pair did before, against the grouped PlugValueBatch path.
+Both sides start from resolved plugs, fill a PairPlan per shader, apply the same value transforms
+and queue the values on a modifier, so only the reading and writing differs.
+
+    path/to/mayapy benchmarks/bench_bulkValues.py --count 2000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000,
+                        help="Amount of shaders.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize()
+    from maya.api import OpenMaya as api2
+    from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+    from shaderHelper_plugin.scripts import bulkValues
+    from shaderHelper_plugin.scripts import static_lib
+    from shaderHelper_plugin.scripts.baseClasses import BaseNode
+    from shaderHelper_plugin.scripts.conversionPlan import PairPlan
+    import _scene
+
+    _bootstrap.new_scene()
+    src_dest = _scene.build_destinations(
+        _scene.build_shaders(args.count, "blinn", textures=0))
+    mapping = static_lib.LEGALTYPES_MAPS["blinn"]
+    transforms = static_lib.LEGALTYPES_TRANSFORMS.get("blinn", {})
+
+    # -resolve the plugs up front, only reading and writing is measured
+    shaders = []
+    for s, d in src_dest:
+        src, dest = BaseNode(s), BaseNode(d)
+        shaders.append((src, dest, [(attr, newAttr, src.get_plugFrStr(attr), dest.get_plugFrStr(newAttr))
+                                    for attr, newAttr in mapping.items()]))
+
+    def per_plug():
+        plans = []
+        for src, dest, attrs in shaders:
+            plan = PairPlan(src.name, dest.name, dest.type)
+            plans.append((plan, {newAttr: destPlug for _, newAttr, _, destPlug in attrs}))
+            for attr, newAttr, srcPlug, _ in attrs:
+                value = MIO.get_plugValue(srcPlug)
+                transform = transforms.get(attr)
+                if transform is not None:
+                    value = transform(value)
+                plan.values.append((newAttr, value))
+
+        modi = api2.MDGModifier()
+        for plan, destPlugs in plans:
+            for attr, value in plan.values:
+                bulkValues._newPlugValue(modi, destPlugs[attr], value)
+        modi.doIt()
+
+    def batched():
+        batch = bulkValues.PlugValueBatch()
+        plans = []
+        for src, dest, attrs in shaders:
+            plan = PairPlan(src.name, dest.name, dest.type)
+            plans.append((plan, {newAttr: destPlug for _, newAttr, _, destPlug in attrs}))
+            for attr, newAttr, srcPlug, _ in attrs:
+                batch.add(plan, "blinn", attr, newAttr, srcPlug)
+        batch.read(static_lib.LEGALTYPES_TRANSFORMS)
+
+        # -regroup by attribute, like queue_values
+        writes = {}
+        for plan, destPlugs in plans:
+            for attr, value in plan.values:
+                writes.setdefault(attr, []).append((destPlugs[attr], value))
+
+        modi = api2.MDGModifier()
+        bulkValues.write_values(modi, writes)
+        modi.doIt()
+
+    results = {}
+    for key, func in (("per plug (before)", per_plug), ("batched", batched)):
+        with _bootstrap.timer(results, key):
+            func()
+
+    _bootstrap.report("Attribute values, {0} plugs (numpy: {1})".format(
+        len(shaders) * len(mapping), bulkValues.numpy is not None), results, baseline="per plug (before)")
+
+
+if __name__ == "__main__":
+    main()
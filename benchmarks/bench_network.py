@@ -0,0 +1,84 @@
+"""
+Run the conversion, search and edit paths of the ShaderHelper on a production sized scene
+and check there results, so they can be timed and regression-tested headless.
+
+    path/to/mayapy benchmarks/bench_network.py --nodes 100000
+    SHADERHELPER_STANDIN=1 python benchmarks/bench_network.py --nodes 100000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=100000,
+                        help="Amount of nodes in the scene.")
+    parser.add_argument("--textures", type=int, default=2,
+                        help="Amount of textured attributes per shader.")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="How often the indexed search runs.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize()
+    from maya import cmds
+    from shaderHelper_plugin.shaderHelper_main import ShaderHelper
+    from shaderHelper_plugin.scripts import searchIndex
+    from shaderHelper_plugin.scripts import targets
+    import _scene
+
+    results = {}
+
+    _bootstrap.new_scene()
+    with _bootstrap.timer(results, "build scene"):
+        shaders, _ = _scene.build_network(args.nodes, textures=args.textures)
+    textures = len(shaders) * args.textures
+
+    logic = ShaderHelper()
+    logic.convTo = targets.DEFAULT
+
+    # ----------------------------------Search---------------------------------- #
+
+    index = searchIndex.INDEX
+    with _bootstrap.timer(results, "search, index build"):
+        found = index.search(["file"], mode=0)
+    assert len(found) == textures, len(found)
+
+    with _bootstrap.timer(results, "search, indexed x %d" % args.repeat):
+        for _ in range(args.repeat):
+            found = index.search(["BaseColor"], mode=1)
+    assert len(found) == textures, len(found)
+
+    # ----------------------------------Conversion---------------------------------- #
+
+    with _bootstrap.timer(results, "convert all"):
+        logic.convert_all()
+    assert len(cmds.ls(type=targets.DEFAULT)) >= len(shaders)
+
+    with _bootstrap.timer(results, "convert all undo"):
+        cmds.undo()
+
+    # ----------------------------------Editing---------------------------------- #
+
+    with _bootstrap.timer(results, "change colorspace"):
+        logic.changeColorspace("ACEScg")
+    assert len(index.search(["ACEScg"], mode=2)) == textures
+
+    with _bootstrap.timer(results, "rename file nodes"):
+        logic.renameFileNodesToFileNames()
+    assert len(index.search(["_BaseColor"], mode=0)) == textures
+
+    with _bootstrap.timer(results, "merge place2dTextures"):
+        logic.replacePlace2DNodes()
+    assert len(cmds.ls(type="place2dTexture")) == 1
+
+    _bootstrap.report("ShaderHelper on {0} nodes, {1} shaders with {2} textures".format(
+        args.nodes, len(shaders), textures), results)
+
+
+if __name__ == "__main__":
+    main()
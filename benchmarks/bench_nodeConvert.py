@@ -0,0 +1,50 @@
+"""
+Compare converting shaders with one nodeConvert call per pair
+against a single batched nodeConvert call.
+
+    path/to/mayapy benchmarks/bench_nodeConvert.py --count 1000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500,
+                        help="Amount of shaders to convert.")
+    parser.add_argument("--textures", type=int, default=2,
+                        help="Amount of textured attributes per shader.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize()
+    from maya import cmds
+    import _scene
+
+    results = {}
+
+    _bootstrap.new_scene()
+    src_dest = _scene.build_destinations(
+        _scene.build_shaders(args.count, "blinn", args.textures))
+    with _bootstrap.timer(results, "per pair"):
+        for src, dest in src_dest:
+            cmds.nodeConvert(src, dest)
+
+    _bootstrap.new_scene()
+    src_dest = _scene.build_destinations(
+        _scene.build_shaders(args.count, "blinn", args.textures))
+    with _bootstrap.timer(results, "batched"):
+        cmds.nodeConvert(pair=src_dest)
+    with _bootstrap.timer(results, "batched undo"):
+        cmds.undo()
+
+    _bootstrap.report("nodeConvert, {0} shaders".format(args.count),
+                      results, baseline="per pair")
+
+
+if __name__ == "__main__":
+    main()
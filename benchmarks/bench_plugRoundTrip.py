@@ -0,0 +1,70 @@
+"""
+Measure the cost per connection of turning plugs into names and resolving them again,
+like nodeConvert did before, against carrying the MPlugs straight to the modifier.
+
+    path/to/mayapy benchmarks/bench_plugRoundTrip.py --count 500
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500,
+                        help="Amount of shaders.")
+    parser.add_argument("--textures", type=int, default=4,
+                        help="Amount of textured attributes per shader.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize(plugins=())
+    from maya.api import OpenMaya as api2
+    from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+    from shaderHelper_plugin.scripts.baseClasses import BaseNode
+    import _scene
+
+    _bootstrap.new_scene()
+    shaders = _scene.build_shaders(args.count, "blinn", args.textures)
+
+    connections = []
+    for s in shaders:
+        node = BaseNode(s)
+        for srcPlugs, destPlug in node.incomingConnections:
+            connections.extend((p, destPlug) for p in srcPlugs)
+
+    def round_trip():
+        modi = api2.MDGModifier()
+        for src, dest in connections:
+            items = (src.partialName(includeNodeName=True, useLongNames=True),
+                     dest.partialName(includeNodeName=True, useLongNames=True))
+            plugs = []
+            for item in items:
+                node, attr = item.split(".", 1)
+                mobj = MIO.get_mobj(node)
+                plugs.append(MIO.get_plug(
+                    mobj, api2.MFnDependencyNode(mobj), attr))
+            modi.connect(*plugs)
+
+    def plugs():
+        modi = api2.MDGModifier()
+        for src, dest in connections:
+            modi.connect(src, dest)
+
+    results = {}
+    for key, func in (("string round trip (before)", round_trip), ("plugs", plugs)):
+        with _bootstrap.timer(results, key):
+            func()
+
+    _bootstrap.report("Connection handling, {0} connections".format(len(connections)),
+                      results, baseline="string round trip (before)")
+    for key, secs in sorted(results.items()):
+        print("  {0}: {1:.2f}us per connection".format(
+            key, secs / max(len(connections), 1) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
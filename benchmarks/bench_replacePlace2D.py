@@ -0,0 +1,72 @@
+"""
+Measure merging duplicated place2dTextures by applying the planned moves with one
+connectAttr per connection in an undo chunk, like replacePlace2DNodes did before,
+against the replacePlace2D command which holds everything in a single MDGModifier.
+Every file node gets its own placer, every n'th placer gets a different repeatUV
+so the scene collapses into a few buckets.
+
+    path/to/mayapy benchmarks/bench_replacePlace2D.py --count 10000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000,
+                        help="Amount of file nodes, each with its own place2dTexture.")
+    parser.add_argument("--buckets", type=int, default=4,
+                        help="Amount of different placements.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize(plugins=())
+    from maya.api import OpenMaya as api2
+    from maya import cmds
+    from mayapyUtils import mahelper
+    from shaderHelper_plugin.scripts import place2dMerge
+    from shaderHelper_plugin.scripts import sceneUtils
+    import _scene
+
+    def build():
+        _bootstrap.new_scene()
+        for i in range(args.count):
+            _, placer = _scene.build_fileTexture("file%s" % i)
+            cmds.setAttr("%s.repeatU" % placer, 1 + i % args.buckets)
+
+    def per_connection():
+        groups = place2dMerge.group(sceneUtils.iter_place2dTextures())
+        moves, removed = place2dMerge.plan_merge(groups)
+        names = [api2.MFnDependencyNode(mobj).name() for mobj in removed]
+        with mahelper.undo_chunk():
+            for _, src, dest in moves:
+                cmds.connectAttr(src.name(), dest.name(), force=True)
+            cmds.delete(*names)
+
+    results = {}
+
+    build()
+    with _bootstrap.timer(results, "connectAttr per connection (before)"):
+        per_connection()
+    assert len(cmds.ls(type="place2dTexture")) == args.buckets
+
+    build()
+    with _bootstrap.timer(results, "replacePlace2D"):
+        cmds.replacePlace2D()
+    assert len(cmds.ls(type="place2dTexture")) == args.buckets
+    with _bootstrap.timer(results, "replacePlace2D undo"):
+        cmds.undo()
+    assert len(cmds.ls(type="place2dTexture")) == args.count
+    with _bootstrap.timer(results, "replacePlace2D redo"):
+        cmds.redo()
+
+    _bootstrap.report("Merging {0} place2dTextures into {1} buckets".format(args.count, args.buckets),
+                      results, baseline="connectAttr per connection (before)")
+
+
+if __name__ == "__main__":
+    main()
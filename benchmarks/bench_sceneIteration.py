@@ -0,0 +1,71 @@
+"""
+Measure how visiting the file and place2dTexture nodes scales with the scene size,
+walking every node and filtering by apiType like the editing functions did before
+against the MFn filtered iterators of sceneUtils.
+Every scene holds the same amount of texture nodes, only the unrelated nodes grow.
+
+    path/to/mayapy benchmarks/bench_sceneIteration.py --textures 500 --sizes 1000 10000 50000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--textures", type=int, default=500,
+                        help="Amount of file texture nodes, each with its own place2dTexture.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Amounts of unrelated nodes in the scene.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How often the scene gets iterated.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize(plugins=())
+    from maya.api import OpenMaya as api2
+    from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+    from shaderHelper_plugin.scripts import sceneUtils
+    import _scene
+
+    def walk():
+        found = 0
+        for s in MIO.get_selectionIter():
+            apiType = s.getDependNode().apiType()
+            if apiType == 497 or apiType == 454:
+                found += 1
+        return found
+
+    def typed():
+        found = 0
+        for _ in sceneUtils.iter_fileTextures():
+            found += 1
+        for _ in sceneUtils.iter_place2dTextures():
+            found += 1
+        return found
+
+    _bootstrap.new_scene()
+    for i in range(args.textures):
+        _scene.build_fileTexture("file%s" % i)
+
+    built = 0
+    for size in sorted(args.sizes):
+        _scene.build_clutter(size - built)
+        built = size
+
+        results = {}
+        for key, func in (("full walk (before)", walk), ("MFn filtered", typed)):
+            with _bootstrap.timer(results, key):
+                for _ in range(args.repeat):
+                    found = func()
+            assert found == args.textures * 2, (key, found)
+
+        _bootstrap.report("Texture node iteration, {0} texture + {1} other nodes x {2}".format(
+            args.textures * 2, size, args.repeat), results, baseline="full walk (before)")
+
+
+if __name__ == "__main__":
+    main()
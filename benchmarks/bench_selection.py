@@ -0,0 +1,58 @@
+"""
+Measure selecting search results by name through MIO.multiSelect, like select_slot did before,
+against building one MSelectionList from the cached handles and applying it in a single call.
+
+    path/to/mayapy benchmarks/bench_selection.py --sizes 1000 10000 50000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import argparse
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Amounts of selected nodes.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How often the nodes get selected.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize(plugins=())
+    from maya.api import OpenMaya as api2
+    from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+    from shaderHelper_plugin.scripts import sceneUtils
+    import _scene
+
+    _bootstrap.new_scene()
+
+    built = []
+    for size in sorted(args.sizes):
+        built.extend(_scene.build_clutter(size - len(built)))
+
+        sel = api2.MSelectionList()
+        for name in built:
+            sel.add(name)
+        handles = sceneUtils.get_handles(sel)
+        names = tuple(built)
+
+        results = {}
+        with _bootstrap.timer(results, "names (before)"):
+            for _ in range(args.repeat):
+                MIO.multiSelect(names)
+        assert api2.MGlobal.getActiveSelectionList().length() == size
+
+        with _bootstrap.timer(results, "handles"):
+            for _ in range(args.repeat):
+                sceneUtils.select(handles)
+        assert api2.MGlobal.getActiveSelectionList().length() == size
+
+        _bootstrap.report("Selecting {0} nodes x {1}".format(size, args.repeat),
+                          results, baseline="names (before)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Run the convert, search and edit entry points of the ShaderHelper over generated scenes
+and record the wall time, peak memory and DG calls of each as JSON.
+Given a stored run as baseline, every regression is listed and the run fails.
+
+    path/to/mayapy benchmarks/bench_suite.py --save results.json
+    path/to/mayapy benchmarks/bench_suite.py --baseline results.json
+    SHADERHELPER_STANDIN=1 python benchmarks/bench_suite.py --sizes 1000 10000
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import argparse
+import sys
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+import _harness
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Amounts of nodes of the generated scenes.")
+    parser.add_argument("--cases", nargs="+", default=None,
+                        help="Only run these cases, defaults to all.")
+    parser.add_argument("--save", default=None,
+                        help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", default=None,
+                        help="Compare against the results stored in this file.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed growth of wall time and memory against the baseline.")
+    parser.add_argument("--no-counts", dest="counts", action="store_false",
+                        help="Skip counting the DG calls, halves the run time.")
+    args = parser.parse_args()
+
+    _bootstrap.initialize()
+    from maya import cmds
+    from shaderHelper_plugin.shaderHelper_main import ShaderHelper
+    from shaderHelper_plugin.scripts import searchIndex
+    from shaderHelper_plugin.scripts import targets
+    import _scene
+
+    logic = ShaderHelper()
+    logic.convTo = targets.DEFAULT
+    index = searchIndex.INDEX
+
+    def colorspaces():
+        return sum(cmds.getAttr("%s.colorSpace" % n) == "ACEScg" for n in cmds.ls(type="file"))
+
+    # -case name -> (run, check), only run is measured, check gives the result stored with it
+    cases = OrderedDict((
+        ("convert_all", (logic.convert_all,
+                         lambda: len(cmds.ls(type=targets.DEFAULT)))),
+        ("search", (lambda: index.search(["file", "SG"], mode=0),
+                    lambda: len(index.search(["file", "SG"], mode=0)))),
+        ("get_nonACESTextureNodes", (logic.get_nonACESTextureNodes,
+                                     lambda: logic.get_nonACESTextureNodes().length())),
+        ("changeColorspace", (lambda: logic.changeColorspace("ACEScg"), colorspaces)),
+        ("replacePlace2DNodes", (logic.replacePlace2DNodes,
+                                 lambda: len(cmds.ls(type="place2dTexture")))),
+    ))
+
+    unknown = set(args.cases or ()) - set(cases)
+    if unknown:
+        parser.error("Unknown cases: %s" % ", ".join(sorted(unknown)))
+
+    def fresh(size):
+        # -every run starts on a new scene with an unbuilt index, like a freshly loaded plug-in
+        def setup():
+            _bootstrap.new_scene()
+            index.deregister_callbacks()
+            _scene.build_network(size)
+        return setup
+
+    results = {}
+    for name, (run, check) in cases.items():
+        if args.cases and name not in args.cases:
+            continue
+
+        for size in sorted(args.sizes):
+            print("{0} @ {1} nodes".format(name, size))
+            result = _harness.measure(run, setup=fresh(size), count=args.counts)
+            result["result"] = check()
+            results.setdefault(name, {})[str(size)] = result
+
+    _harness.report(results)
+    environment = _harness.environment(_bootstrap.STANDIN)
+    if args.save:
+        _harness.save(args.save, environment, results)
+        print("\nSaved to {0}".format(args.save))
+
+    if args.baseline:
+        baseline = _harness.load(args.baseline)
+        if baseline["environment"] != environment:
+            sys.exit("\nBaseline {0} was measured in another environment:\n  {1}\n  {2}".format(
+                args.baseline, baseline["environment"], environment))
+
+        regressions = _harness.compare(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("\n{0} REGRESSIONS against {1}:".format(len(regressions), args.baseline))
+            for r in regressions:
+                print("  " + r)
+            sys.exit(1)
+        print("\nNo regressions against {0}.".format(args.baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1107 @@
+"""
+Stand-in for maya.api.OpenMaya, covers the part of the API 2.0 the plug-in uses.
+Everything works on the in-memory scene of graph.
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import sys
+
+############ CUSTOM IMPORTS ############
+from . import graph
+from . import nodeTypes
+
+_SCENE = graph.SCENE
+
+
+# ----------------------------------Types---------------------------------- #
+
+
+class MFn(object):
+    kInvalid = 0
+    kBase = 1
+    kDependencyNode = nodeTypes.DEPENDENCY_NODE
+    kShadingEngine = nodeTypes.SHADING_ENGINE
+    kLambert = nodeTypes.LAMBERT
+    kBlinn = nodeTypes.BLINN
+    kPhong = nodeTypes.PHONG
+    kPlace2dTexture = nodeTypes.PLACE2D_TEXTURE
+    kPluginDependNode = nodeTypes.PLUGIN_DEPEND
+    kSet = nodeTypes.SET
+    kTexture2d = nodeTypes.TEXTURE_2D
+    kFileTexture = nodeTypes.FILE_TEXTURE
+    kAttribute = 554
+    kNumericAttribute = 566
+    kCompoundAttribute = 567
+    kTypedAttribute = 569
+    kEnumAttribute = 572
+    kMessageAttribute = 573
+
+
+class MFnNumericData(object):
+    kInvalid = 0
+    kBoolean = 1
+    kByte = 2
+    kChar = 3
+    kShort = 4
+    kInt = 7
+    kLong = 7
+    kFloat = 11
+    kDouble = 14
+
+
+class MFnData(object):
+    kInvalid = 0
+    kNumeric = 1
+    kString = 4
+
+
+class MTypeId(object):
+    __slots__ = ("_id",)
+
+    def __init__(self, id=0):
+        self._id = id
+
+    def id(self):
+        return self._id
+
+    def __eq__(self, other):
+        return isinstance(other, MTypeId) and other._id == self._id
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._id)
+
+
+_NUMERIC_TYPES = {"bool": MFnNumericData.kBoolean, "int": MFnNumericData.kInt,
+                  "float": MFnNumericData.kFloat, "double": MFnNumericData.kDouble}
+_ATTRIBUTE_MFN = {"enum": MFn.kEnumAttribute, "string": MFn.kTypedAttribute,
+                  "message": MFn.kMessageAttribute, "compound": MFn.kCompoundAttribute}
+
+
+# ----------------------------------Objects---------------------------------- #
+
+
+class MObject(object):
+    """
+    Reference to a node or an attribute, equal if they reference the same one.
+    """
+    __slots__ = ("_ref",)
+
+    def __init__(self, ref=None):
+        self._ref = ref._ref if isinstance(ref, MObject) else ref
+
+    def __eq__(self, other):
+        return isinstance(other, MObject) and other._ref is self._ref
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def isNull(self):
+        return self._ref is None or (isinstance(self._ref, graph.Node) and not self._ref.alive)
+
+    def apiType(self):
+        ref = self._ref
+        if ref is None:
+            return MFn.kInvalid
+        if isinstance(ref, graph.Node):
+            return ref.type.apiType
+        return _ATTRIBUTE_MFN.get(ref.kind, MFn.kNumericAttribute)
+
+    def hasFn(self, fn):
+        ref = self._ref
+        if ref is None:
+            return False
+        if isinstance(ref, graph.Node):
+            return fn == MFn.kBase or fn in ref.type.mfnTypes
+        return fn in (MFn.kBase, MFn.kAttribute, self.apiType())
+
+
+MObject.kNullObj = MObject()
+
+
+class MObjectHandle(object):
+    __slots__ = ("_ref",)
+
+    def __init__(self, mobj=None):
+        self._ref = mobj._ref if mobj is not None else None
+
+    def isValid(self):
+        return self._ref is not None and getattr(self._ref, "alive", True)
+
+    def isAlive(self):
+        return self._ref is not None
+
+    def hashCode(self):
+        ref = self._ref
+        return ref.uid if isinstance(ref, graph.Node) else id(ref)
+
+    def object(self):
+        return MObject(self._ref) if self.isValid() else MObject()
+
+    def objectRef(self):
+        return self.object()
+
+    def __eq__(self, other):
+        return isinstance(other, MObjectHandle) and other._ref is self._ref
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+
+def _node(mobj):
+    ref = mobj._ref if isinstance(mobj, MObject) else None
+    if not isinstance(ref, graph.Node) or not ref.alive:
+        raise RuntimeError("(kInvalidParameter): Object is incompatible with this method")
+    return ref
+
+
+def _attribute(mobj):
+    ref = mobj._ref if isinstance(mobj, MObject) else None
+    if not isinstance(ref, graph.Attribute):
+        raise RuntimeError("(kInvalidParameter): Object is incompatible with this method")
+    return ref
+
+
+# ----------------------------------Plugs---------------------------------- #
+
+
+class MPlug(object):
+    """
+    Plug of a node attribute, equal if it's the same attribute and logical index on the same node.
+    """
+    __slots__ = ("_node", "_attr", "_index")
+
+    kFreeToChange = 0
+    kNotFreeToChange = 1
+    kChildrenNotFreeToChange = 2
+
+    def __init__(self, node=None, attr=None, index=None):
+        if isinstance(node, MPlug):
+            node, attr, index = node._node, node._attr, node._index
+        elif isinstance(node, MObject):
+            node = _node(node)
+            attr = _attribute(attr)
+        self._node = node
+        self._attr = attr
+        self._index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, MPlug) and other._node is self._node and
+                other._attr is self._attr and other._index == self._index)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self._node), id(self._attr), self._index))
+
+    def __repr__(self):
+        return "MPlug(%s)" % (self.name() if not self.isNull else "")
+
+    @property
+    def _key(self):
+        return (self._attr, self._index)
+
+    # ----------------------------------Structure---------------------------------- #
+
+    @property
+    def isNull(self):
+        return self._node is None
+
+    @property
+    def info(self):
+        return self.name()
+
+    @property
+    def isCompound(self):
+        return self._attr.kind == "compound" and not self.isArray
+
+    @property
+    def isArray(self):
+        return self._attr.array and self._index is None
+
+    @property
+    def isElement(self):
+        return self._attr.array and self._index is not None
+
+    @property
+    def isChild(self):
+        return self._attr.parent is not None
+
+    @property
+    def isLocked(self):
+        return False
+
+    @property
+    def isKeyable(self):
+        return True
+
+    @property
+    def isNetworked(self):
+        return self.isConnected
+
+    def node(self):
+        return MObject(self._node)
+
+    def attribute(self):
+        return MObject(self._attr)
+
+    def name(self):
+        return graph.plug_name(self._node, self._key)
+
+    def partialName(self, includeNodeName=False, includeNonMandatoryIndices=False,
+                    includeInstancedIndices=False, useAlias=False,
+                    useFullAttributePath=False, useLongNames=False):
+        return graph.plug_name(self._node, self._key, longNames=useLongNames,
+                               includeNodeName=includeNodeName)
+
+    def numChildren(self):
+        return len(self._attr.children)
+
+    def child(self, index):
+        if isinstance(index, MObject):
+            attr = _attribute(index)
+        else:
+            attr = self._attr.children[index]
+        return MPlug(self._node, attr, self._index)
+
+    def parent(self):
+        parent = self._attr.parent
+        if parent is None:
+            raise RuntimeError("(kInvalidParameter): Plug has no parent")
+        index = self._index if parent.arrayAncestor() is not None else None
+        return MPlug(self._node, parent, index)
+
+    def array(self):
+        if not self.isElement:
+            raise RuntimeError("(kInvalidParameter): Plug is not an element")
+        return MPlug(self._node, self._attr, None)
+
+    def logicalIndex(self):
+        if self._index is None:
+            raise RuntimeError("(kInvalidParameter): Plug is not an element")
+        return self._index
+
+    def elementByLogicalIndex(self, index):
+        if not self.isArray:
+            raise RuntimeError("(kInvalidParameter): Plug is not an array")
+        return MPlug(self._node, self._attr, index)
+
+    def getExistingArrayAttributeIndices(self):
+        node = self._node
+        keys = set(node.values) | set(node.inputs) | set(node.outputs)
+        return sorted(set(i for a, i in keys if a is self._attr and i is not None))
+
+    def numElements(self):
+        return len(self.getExistingArrayAttributeIndices())
+
+    # ----------------------------------Connections---------------------------------- #
+
+    @property
+    def isSource(self):
+        return self._key in self._node.outputs
+
+    @property
+    def isDestination(self):
+        return self._key in self._node.inputs
+
+    @property
+    def isConnected(self):
+        return self.isSource or self.isDestination
+
+    def source(self):
+        conn = self._node.inputs.get(self._key)
+        if conn is None:
+            return MPlug()
+        src, (attr, index) = conn
+        return MPlug(src, attr, index)
+
+    def destinations(self):
+        dests = self._node.outputs.get(self._key, {})
+        return [MPlug(dest, attr, index)
+                for dest, (attr, index) in sorted(dests, key=dests.__getitem__)]
+
+    def connectedTo(self, asDst, asSrc):
+        plugs = []
+        if asDst and self.isDestination:
+            plugs.append(self.source())
+        if asSrc:
+            plugs.extend(self.destinations())
+        return plugs
+
+    def isFreeToChange(self, checkParents=True, checkChildren=True):
+        return self.kNotFreeToChange if self.isDestination else self.kFreeToChange
+
+    # ----------------------------------Values---------------------------------- #
+
+    def _value(self):
+        if self.isCompound:
+            raise RuntimeError("(kFailure): Unexpected Internal Failure, %s is a compound" % self.name())
+        return self._node.value(self._key)
+
+    def asBool(self):
+        return bool(self._value())
+
+    def asInt(self):
+        return int(self._value())
+
+    asShort = asInt
+    asChar = asInt
+
+    def asFloat(self):
+        return float(self._value())
+
+    def asDouble(self):
+        return float(self._value())
+
+    def asString(self):
+        value = self._value()
+        if self._attr.kind != "string":
+            raise RuntimeError("(kFailure): Unexpected Internal Failure, %s isn't a string" % self.name())
+        return value
+
+    def asMObject(self):
+        return MObject()
+
+    def _set(self, value):
+        _SCENE.set_value(self._node, self._key, value)
+
+    def setBool(self, value):
+        self._set(bool(value))
+
+    def setInt(self, value):
+        self._set(int(value))
+
+    setShort = setInt
+    setChar = setInt
+
+    def setFloat(self, value):
+        self._set(float(value))
+
+    def setDouble(self, value):
+        self._set(float(value))
+
+    def setString(self, value):
+        self._set(value)
+
+
+class MPlugArray(list):
+    pass
+
+
+# ----------------------------------Function Sets---------------------------------- #
+
+
+class MFnBase(object):
+
+    def __init__(self, mobj=None):
+        self._ref = None
+        if mobj is not None:
+            self.setObject(mobj)
+
+    def object(self):
+        return MObject(self._ref)
+
+    def hasObj(self, mobj):
+        return mobj is not None and not mobj.isNull()
+
+
+class MFnDependencyNode(MFnBase):
+
+    def setObject(self, mobj):
+        self._ref = _node(mobj)
+        return self
+
+    def name(self):
+        return self._ref.name
+
+    def setName(self, name):
+        return _SCENE.rename(self._ref, name)
+
+    @property
+    def typeName(self):
+        return self._ref.type.name
+
+    @property
+    def typeId(self):
+        return MTypeId(self._ref.type.typeId)
+
+    @property
+    def isDefaultNode(self):
+        return self._ref.name in _DEFAULT_NODES
+
+    @property
+    def isLocked(self):
+        return False
+
+    def attributeCount(self):
+        return len(self._ref.type.attributes)
+
+    def hasAttribute(self, name):
+        return self._ref.type.attribute(name) is not None
+
+    def attribute(self, name):
+        attr = self._ref.type.attribute(name)
+        if attr is None:
+            raise RuntimeError("(kInvalidParameter): No attribute %s" % name)
+        return MObject(attr)
+
+    def findPlug(self, attr, wantNetworkedPlug=True):
+        if isinstance(attr, MObject):
+            attr = _attribute(attr)
+            if self._ref.type.attributes.get(attr.name) is not attr:
+                raise RuntimeError("(kInvalidParameter): Attribute isn't on %s" % self._ref.name)
+            return MPlug(self._ref, attr, None)
+
+        attr = self._ref.type.attribute(attr)
+        if attr is None:
+            raise RuntimeError("(kInvalidParameter): Cannot find the plug")
+        return MPlug(self._ref, attr, None)
+
+    def getConnections(self):
+        node = self._ref
+        return MPlugArray(MPlug(node, attr, index) for attr, index in node.connectedKeys())
+
+
+class MFnAttribute(MFnBase):
+
+    def setObject(self, mobj):
+        self._ref = _attribute(mobj)
+        return self
+
+    @property
+    def name(self):
+        return self._ref.name
+
+    @property
+    def shortName(self):
+        return self._ref.shortName
+
+    @property
+    def array(self):
+        return self._ref.array
+
+    @property
+    def parent(self):
+        return MObject(self._ref.parent)
+
+
+class MFnNumericAttribute(MFnAttribute):
+
+    def numericType(self):
+        return _NUMERIC_TYPES.get(self._ref.kind, MFnNumericData.kInvalid)
+
+
+class MFnTypedAttribute(MFnAttribute):
+
+    def attrType(self):
+        return MFnData.kString if self._ref.kind == "string" else MFnData.kInvalid
+
+
+class MFnEnumAttribute(MFnAttribute):
+    pass
+
+
+class MFnCompoundAttribute(MFnAttribute):
+
+    def numChildren(self):
+        return len(self._ref.children)
+
+    def child(self, index):
+        return MObject(self._ref.children[index])
+
+
+class MNodeClass(object):
+    """
+    Attributes of a node type, without a node of it.
+
+    Args:
+        typeName ([String]): The node type.
+
+    Raises:
+        RuntimeError: If the type is unknown.
+    """
+
+    def __init__(self, typeName):
+        self._type = _SCENE.nodeType(typeName)
+
+    @property
+    def typeName(self):
+        return self._type.name
+
+    @property
+    def typeId(self):
+        return MTypeId(self._type.typeId)
+
+    def hasAttribute(self, name):
+        return self._type.attribute(name) is not None
+
+    def attribute(self, name):
+        attr = self._type.attribute(name)
+        return MObject(attr)
+
+    def getAttributes(self):
+        return [MObject(a) for a in self._type.attributes.values()]
+
+
+# ----------------------------------Selections---------------------------------- #
+
+
+class MSelectionList(object):
+    """
+    List of nodes and plugs, nodes are only held once.
+    """
+
+    def __init__(self, other=None):
+        self._items = list(other._items) if isinstance(other, MSelectionList) else []
+        self._uids = set(node.uid for node, _ in self._items)
+
+    def add(self, item, mergeWithExisting=True):
+        key = None
+        if isinstance(item, MPlug):
+            node, key = item._node, item._key
+        elif isinstance(item, MObject):
+            node = _node(item)
+        elif isinstance(item, MObjectHandle):
+            node = _node(item.object())
+        else:
+            item = str(item)
+            try:
+                if "." in item:
+                    node, key = _SCENE.plug(item)
+                else:
+                    node = _SCENE.node(item)
+            except RuntimeError:
+                raise RuntimeError("(kInvalidParameter): Object does not exist")
+
+        if key is None and mergeWithExisting and node.uid in self._uids:
+            return self
+        self._uids.add(node.uid)
+        self._items.append((node, key))
+        return self
+
+    def merge(self, other, strategy=0):
+        for node, key in other._items:
+            self.add(MPlug(node, *key) if key is not None else MObject(node))
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def isEmpty(self):
+        return not self._items
+
+    def clear(self):
+        self._items = []
+        self._uids = set()
+        return self
+
+    def getDependNode(self, index):
+        node, _ = self._items[index]
+        if not node.alive:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        return MObject(node)
+
+    def getPlug(self, index):
+        node, key = self._items[index]
+        if key is None:
+            raise RuntimeError("(kInvalidParameter): Item is not a plug")
+        return MPlug(node, *key)
+
+    def getSelectionStrings(self, index=None):
+        items = self._items if index is None else [self._items[index]]
+        return [graph.plug_name(n, k) if k is not None else n.name for n, k in items]
+
+    def hasItem(self, item):
+        return _node(item).uid in self._uids
+
+
+class MItDependencyNodes(object):
+
+    def __init__(self, filter=MFn.kInvalid):
+        nodes = _SCENE.nodes.values()
+        if filter not in (MFn.kInvalid, MFn.kDependencyNode):
+            nodes = [n for n in nodes if filter in n.type.mfnTypes]
+        self._nodes = list(nodes)
+        self._i = 0
+
+    def isDone(self):
+        return self._i >= len(self._nodes)
+
+    def next(self):
+        self._i += 1
+
+    def reset(self):
+        self._i = 0
+
+    def thisNode(self):
+        return MObject(self._nodes[self._i])
+
+
+class MItSelectionList(object):
+
+    def __init__(self, selection, filter=MFn.kInvalid):
+        items = selection._items
+        if filter not in (MFn.kInvalid, MFn.kDependencyNode):
+            items = [i for i in items if filter in i[0].type.mfnTypes]
+        self._items = list(items)
+        self._i = 0
+
+    def isDone(self):
+        return self._i >= len(self._items)
+
+    def next(self):
+        self._i += 1
+
+    def reset(self):
+        self._i = 0
+
+    def getDependNode(self):
+        return MObject(self._items[self._i][0])
+
+    def hasComponents(self):
+        return False
+
+
+# ----------------------------------Modifier---------------------------------- #
+
+
+class MDGModifier(object):
+    """
+    Queue of DG changes, done and undone as one.
+    """
+
+    def __init__(self):
+        self._transaction = graph.Transaction(_SCENE)
+
+    def createNode(self, typeName):
+        return MObject(self._transaction.create_node(typeName))
+
+    def deleteNode(self, mobj):
+        self._transaction.delete_node(_node(mobj))
+        return self
+
+    def renameNode(self, mobj, name):
+        self._transaction.rename(_node(mobj), name)
+        return self
+
+    def connect(self, *args):
+        src, dest = _plugPair(args)
+        self._transaction.connect(src._node, src._key, dest._node, dest._key)
+        return self
+
+    def disconnect(self, *args):
+        src, dest = _plugPair(args)
+        self._transaction.disconnect(src._node, src._key, dest._node, dest._key)
+        return self
+
+    def _newValue(self, plug, value):
+        if plug.isNull:
+            raise RuntimeError("(kInvalidParameter): Plug is null")
+        self._transaction.set_value(plug._node, plug._key, value)
+        return self
+
+    def newPlugValueBool(self, plug, value):
+        return self._newValue(plug, bool(value))
+
+    def newPlugValueInt(self, plug, value):
+        return self._newValue(plug, int(value))
+
+    newPlugValueShort = newPlugValueInt
+    newPlugValueChar = newPlugValueInt
+
+    def newPlugValueFloat(self, plug, value):
+        return self._newValue(plug, float(value))
+
+    def newPlugValueDouble(self, plug, value):
+        return self._newValue(plug, float(value))
+
+    def newPlugValueString(self, plug, value):
+        return self._newValue(plug, value)
+
+    def doIt(self):
+        self._transaction.do()
+
+    def undoIt(self):
+        self._transaction.undo()
+
+
+def _plugPair(args):
+    if len(args) == 4:
+        src = MFnDependencyNode(args[0]).findPlug(args[1], False)
+        dest = MFnDependencyNode(args[2]).findPlug(args[3], False)
+    else:
+        src, dest = args
+    if src.isNull or dest.isNull:
+        raise RuntimeError("(kInvalidParameter): Plug is null")
+    return src, dest
+
+
+# ----------------------------------Global---------------------------------- #
+
+
+class MGlobal(object):
+    kReplaceList = 0
+    kAddToList = 2
+
+    @staticmethod
+    def displayError(msg):
+        print("# Error: %s" % msg, file=sys.stderr)
+
+    @staticmethod
+    def displayWarning(msg):
+        print("# Warning: %s" % msg, file=sys.stderr)
+
+    @staticmethod
+    def displayInfo(msg):
+        print(msg)
+
+    @staticmethod
+    def getActiveSelectionList(orderedSelectionIfAvailable=False):
+        sel = MSelectionList()
+        for node in _SCENE.selection:
+            sel.add(MObject(node))
+        return sel
+
+    @staticmethod
+    def setActiveSelectionList(selection, listAdjustment=0):
+        nodes = [node for node, _ in selection._items if node.alive]
+        if listAdjustment == MGlobal.kAddToList:
+            known = set(n.uid for n in _SCENE.selection)
+            nodes = _SCENE.selection + [n for n in nodes if n.uid not in known]
+        _SCENE.selection = nodes
+
+    @staticmethod
+    def getSelectionListByName(name):
+        return MSelectionList().add(name)
+
+    @staticmethod
+    def mayaState():
+        return MGlobal.kBatch
+
+    kBatch = 1
+    kInteractive = 0
+
+
+# ----------------------------------Messages---------------------------------- #
+
+
+class MMessage(object):
+
+    @staticmethod
+    def removeCallback(cid):
+        _SCENE.callbacks.remove(cid)
+
+    @staticmethod
+    def removeCallbacks(ids):
+        for cid in ids:
+            _SCENE.callbacks.remove(cid)
+
+
+class MDGMessage(MMessage):
+
+    @staticmethod
+    def addNodeAddedCallback(func, nodeType="dependNode", clientData=None):
+        return _SCENE.callbacks.add("nodeAdded", _typed(func, nodeType, clientData))
+
+    @staticmethod
+    def addNodeRemovedCallback(func, nodeType="dependNode", clientData=None):
+        return _SCENE.callbacks.add("nodeRemoved", _typed(func, nodeType, clientData))
+
+    @staticmethod
+    def addConnectionCallback(func, clientData=None):
+        def callback(src, srcKey, dest, destKey, made):
+            func(MPlug(src, *srcKey), MPlug(dest, *destKey), made, clientData)
+        return _SCENE.callbacks.add("connection", callback)
+
+
+class MNodeMessage(MMessage):
+    kConnectionMade = graph.CONNECTION_MADE
+    kConnectionBroken = graph.CONNECTION_BROKEN
+    kAttributeSet = graph.ATTRIBUTE_SET
+    kIncomingDirection = graph.INCOMING_DIRECTION
+    kOtherPlugSet = graph.OTHER_PLUG_SET
+
+    @staticmethod
+    def addNameChangedCallback(mobj, func, clientData=None):
+        node = None if mobj.isNull() else _node(mobj)
+
+        def callback(changed, prevName):
+            func(MObject(changed), prevName, clientData)
+        return _SCENE.callbacks.add("nameChanged", callback, node)
+
+    @staticmethod
+    def addAttributeChangedCallback(mobj, func, clientData=None):
+        def callback(msg, node, key, other, otherKey):
+            otherPlug = MPlug(other, *otherKey) if other is not None else MPlug()
+            func(msg, MPlug(node, *key), otherPlug, clientData)
+        return _SCENE.callbacks.add("attributeChanged", callback, _node(mobj))
+
+
+class MSceneMessage(MMessage):
+    kBeforeNew = 1
+    kAfterNew = 2
+    kBeforeImport = 3
+    kAfterImport = 4
+    kBeforeOpen = 5
+    kAfterOpen = 6
+    kBeforeCreateReference = 31
+    kAfterCreateReference = 32
+
+    @staticmethod
+    def addCallback(msg, func, clientData=None):
+        return _SCENE.callbacks.add(("scene", msg), lambda: func(clientData))
+
+
+class MEventMessage(MMessage):
+
+    @staticmethod
+    def addEventCallback(event, func, clientData=None):
+        return _SCENE.callbacks.add(("event", event), lambda: func(clientData))
+
+
+def _typed(func, nodeType, clientData):
+    def callback(node):
+        if nodeType == "dependNode" or node.type.isA(nodeType):
+            func(MObject(node), clientData)
+    return callback
+
+
+# ----------------------------------Commands---------------------------------- #
+
+
+class MSyntax(object):
+    kNoArg = 1
+    kBoolean = 2
+    kLong = 3
+    kDouble = 4
+    kString = 5
+    kUnsigned = 6
+    kDistance = 7
+    kAngle = 8
+    kTime = 9
+    kSelectionItem = 10
+
+    kNone = 1
+    kStringObjects = 2
+    kSelectionList = 3
+
+    def __init__(self):
+        self._flags = {}
+        self._objectType = MSyntax.kNone
+        self._objectRange = (0, None)
+
+    def addFlag(self, shortName, longName, *argTypes):
+        flag = _Flag(shortName, longName, tuple(a for a in argTypes if a != MSyntax.kNoArg))
+        self._flags[shortName] = self._flags[longName] = flag
+        return self
+
+    def makeFlagMultiUse(self, flag):
+        self._flags[flag].multiUse = True
+        return self
+
+    def setObjectType(self, objectType, minimum=0, maximum=None):
+        self._objectType = objectType
+        self._objectRange = (minimum, maximum)
+        return self
+
+    def setMinObjects(self, minimum):
+        self._objectRange = (minimum, self._objectRange[1])
+
+    def setMaxObjects(self, maximum):
+        self._objectRange = (self._objectRange[0], maximum)
+
+    def enableQuery(self, value=True):
+        pass
+
+    def enableEdit(self, value=True):
+        pass
+
+    def useSelectionAsDefault(self, value=True):
+        pass
+
+
+class _Flag(object):
+    __slots__ = ("shortName", "longName", "argTypes", "multiUse")
+
+    def __init__(self, shortName, longName, argTypes):
+        self.shortName = shortName
+        self.longName = longName
+        self.argTypes = argTypes
+        self.multiUse = False
+
+
+class MArgList(object):
+    """
+    Arguments of a command call, the positional ones and the flags as given to cmds.
+    """
+
+    def __init__(self, args=(), flags=None):
+        self._args = list(args)
+        self._flags = flags or {}
+
+    def length(self):
+        return len(self._args)
+
+    def asString(self, index):
+        return str(self._args[index])
+
+    def asInt(self, index):
+        return int(self._args[index])
+
+    def asDouble(self, index):
+        return float(self._args[index])
+
+    def asBool(self, index):
+        return bool(self._args[index])
+
+    def asStringArray(self, index):
+        return [str(a) for a in self._args[index]]
+
+
+class MArgDatabase(object):
+    """
+    Arguments of a command call checked against its syntax.
+
+    Raises:
+        RuntimeError: For unknown flags or wrong amounts of flag arguments.
+    """
+
+    def __init__(self, syntax, argList):
+        self._uses = {}
+        for name, value in argList._flags.items():
+            flag = syntax._flags.get("-" + name)
+            if flag is None:
+                raise RuntimeError("Invalid flag '%s'" % name)
+
+            if not flag.argTypes:
+                uses = [()] if value else []
+            elif flag.multiUse and isinstance(value, list):
+                uses = [_flagArgs(flag, v) for v in value]
+            else:
+                uses = [_flagArgs(flag, value)]
+            self._uses[flag.shortName] = uses
+
+        self._objects = []
+        for arg in argList._args:
+            if isinstance(arg, (list, tuple)):
+                self._objects.extend(str(a) for a in arg)
+            else:
+                self._objects.append(str(arg))
+
+        minimum, maximum = syntax._objectRange
+        if syntax._objectType == MSyntax.kNone and self._objects:
+            raise RuntimeError("Too many objects or values.")
+        if len(self._objects) < minimum or (maximum is not None and len(self._objects) > maximum):
+            raise RuntimeError("Wrong number of objects or values.")
+
+    def isFlagSet(self, flag):
+        return bool(self._uses.get(flag))
+
+    def numberOfFlagUses(self, flag):
+        return len(self._uses.get(flag, ()))
+
+    def getFlagArgumentList(self, flag, use):
+        return MArgList(self._uses[flag][use])
+
+    def flagArgumentString(self, flag, index):
+        return str(self._uses[flag][0][index])
+
+    def flagArgumentInt(self, flag, index):
+        return int(self._uses[flag][0][index])
+
+    def flagArgumentDouble(self, flag, index):
+        return float(self._uses[flag][0][index])
+
+    def flagArgumentBool(self, flag, index):
+        return bool(self._uses[flag][0][index])
+
+    def getObjectStrings(self):
+        return list(self._objects)
+
+    def getObjectList(self):
+        sel = MSelectionList()
+        for name in self._objects:
+            sel.add(name)
+        return sel
+
+
+def _flagArgs(flag, value):
+    args = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+    if len(args) != len(flag.argTypes):
+        raise RuntimeError("Flag '%s' takes %d arguments, %d given." % (
+            flag.longName, len(flag.argTypes), len(args)))
+    return args
+
+
+class MPxCommand(object):
+
+    def __init__(self):
+        self._syntax = None
+        self._result = None
+
+    def doIt(self, args):
+        pass
+
+    def redoIt(self):
+        pass
+
+    def undoIt(self):
+        pass
+
+    def isUndoable(self):
+        return False
+
+    def hasSyntax(self):
+        return self._syntax is not None
+
+    def syntax(self):
+        return self._syntax
+
+    def setResult(self, result):
+        self._result = result
+
+    def appendToResult(self, result):
+        if self._result is None:
+            self._result = []
+        self._result.append(result)
+
+    def clearResult(self):
+        self._result = None
+
+    @staticmethod
+    def displayError(msg):
+        MGlobal.displayError(msg)
+
+    @staticmethod
+    def displayWarning(msg):
+        MGlobal.displayWarning(msg)
+
+
+class MFnPlugin(object):
+    """
+    Registers the commands of a plug-in with the cmds stand-in.
+    """
+
+    def __init__(self, plugin=None, vendor="", version="", apiVersion="Any"):
+        self.vendor = vendor
+        self.version = version
+
+    def registerCommand(self, name, creator, syntaxCreator=None):
+        from . import cmds
+        cmds._register_command(name, creator, syntaxCreator)
+
+    def deregisterCommand(self, name):
+        from . import cmds
+        cmds._deregister_command(name)
+
+
+# -nodes every new scene holds, see cmds.file
+_DEFAULT_NODES = ("lambert1", "standardSurface1", "initialShadingGroup")
@@ -0,0 +1,61 @@
+"""
+In-memory stand-in for the parts of Maya the plug-in uses, so the benchmarks run without mayapy.
+
+    SHADERHELPER_STANDIN=1 python benchmarks/bench_replacePlace2D.py --count 10000
+
+The stand-in only holds the scene graph, nodes are never evaluated and connections don't
+push values downstream. Timings are for the plug-in's own Python, not for Maya.
+"""
+####### Standard Library IMPORTS #######
+import sys
+import types
+
+############ CUSTOM IMPORTS ############
+from . import graph
+from . import nodeTypes
+
+
+def install():
+    """
+    Register the stand-in as the maya, mayapyUtils and, if it's missing, the PySide2 modules.
+    Does nothing if it's already installed.
+    """
+    if getattr(sys.modules.get("maya"), "STANDIN", False):
+        return
+
+    for nodeType in nodeTypes.build(nodeTypes.SCHEMA):
+        graph.SCENE.register_type(nodeType)
+
+    from . import OpenMaya, cmds, mayapyUtils
+
+    modules = {}
+    maya = modules["maya"] = _module("maya", STANDIN=True)
+    api = modules["maya.api"] = _module("maya.api", OpenMaya=OpenMaya)
+    modules["maya.api.OpenMaya"] = OpenMaya
+    modules["maya.cmds"] = cmds
+    mel = modules["maya.mel"] = _module("maya.mel", eval=lambda cmd: "")
+    standalone = modules["maya.standalone"] = _module(
+        "maya.standalone", initialize=lambda name="python": None, uninitialize=lambda: None)
+    maya.api, maya.cmds, maya.mel, maya.standalone = api, cmds, mel, standalone
+
+    basicMayaIO = modules["mayapyUtils.basicMayaIO"] = _module(
+        "mayapyUtils.basicMayaIO", MIO_BasicIO=mayapyUtils.MIO_BasicIO)
+    modules["mayapyUtils.mahelper"] = mayapyUtils.mahelper
+    modules["mayapyUtils.customTypes"] = mayapyUtils.customTypes
+    modules["mayapyUtils"] = _module("mayapyUtils", basicMayaIO=basicMayaIO,
+                                     mahelper=mayapyUtils.mahelper,
+                                     customTypes=mayapyUtils.customTypes)
+
+    try:
+        import PySide2  # noqa: F401
+    except ImportError:
+        from . import qt
+        modules.update(qt.modules())
+
+    sys.modules.update(modules)
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
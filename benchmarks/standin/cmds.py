@@ -0,0 +1,400 @@
+"""
+Stand-in for maya.cmds, the commands the plug-in and the benchmarks call.
+
+Every command which changes the scene runs through a graph.Transaction which is put on the undo queue,
+commands registered by a plug-in are added to this module and queued if they are undoable.
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import imp
+import os
+import sys
+
+############ CUSTOM IMPORTS ############
+from . import graph
+from . import OpenMaya as api2
+
+_SCENE = graph.SCENE
+
+
+# ----------------------------------Undo---------------------------------- #
+
+
+class UndoQueue(object):
+    """
+    Undo and redo stacks, entries are (undo, redo) callables.
+    Entries pushed while a chunk is open are grouped into one.
+    """
+
+    def __init__(self):
+        self.state = True
+        self._undos = []
+        self._redos = []
+        self._chunks = []
+
+    def push(self, undo, redo):
+        if not self.state:
+            return
+        if self._chunks:
+            self._chunks[-1].append((undo, redo))
+        else:
+            self._undos.append((undo, redo))
+        self._redos = []
+
+    def open_chunk(self):
+        self._chunks.append([])
+
+    def close_chunk(self):
+        entries = self._chunks.pop()
+        if not entries:
+            return
+
+        def undo():
+            for u, _ in reversed(entries):
+                u()
+
+        def redo():
+            for _, r in entries:
+                r()
+        self.push(undo, redo)
+
+    def undo(self):
+        if not self._undos:
+            api2.MGlobal.displayWarning("There are no more commands to undo.")
+            return
+        entry = self._undos.pop()
+        entry[0]()
+        self._redos.append(entry)
+
+    def redo(self):
+        if not self._redos:
+            api2.MGlobal.displayWarning("There are no more commands to redo.")
+            return
+        entry = self._redos.pop()
+        entry[1]()
+        self._undos.append(entry)
+
+    def flush(self):
+        self._undos = []
+        self._redos = []
+
+
+_UNDO = UndoQueue()
+
+
+def _run(fill):
+    """
+    Do the changes fill adds to a new Transaction and queue it.
+    If one of them fails, the done ones are undone and the error is raised.
+    """
+    transaction = graph.Transaction(_SCENE)
+    result = fill(transaction)
+    try:
+        transaction.do()
+    except Exception:
+        transaction.undo()
+        raise
+    _UNDO.push(transaction.undo, transaction.do)
+    return result
+
+
+def undo():
+    _UNDO.undo()
+
+
+def redo():
+    _UNDO.redo()
+
+
+def undoInfo(query=False, q=False, state=None, st=None, openChunk=False, ock=False,
+             closeChunk=False, cck=False, flush=False, **kwargs):
+    if query or q:
+        return _UNDO.state
+    if openChunk or ock:
+        _UNDO.open_chunk()
+    if closeChunk or cck:
+        _UNDO.close_chunk()
+    if flush:
+        _UNDO.flush()
+    state = state if state is not None else st
+    if state is not None:
+        _UNDO.state = bool(state)
+
+
+# ----------------------------------Nodes---------------------------------- #
+
+
+def createNode(typeName, name=None, n=None, skipSelect=False, ss=False, **kwargs):
+    return _run(lambda t: t.create_node(typeName, name or n)).name
+
+
+def shadingNode(typeName, asShader=False, asTexture=False, asUtility=False, asLight=False,
+                name=None, n=None, **kwargs):
+    return createNode(typeName, name=name or n)
+
+
+def sets(*args, **kwargs):
+    renderable = kwargs.get("renderable") or kwargs.get("r")
+    name = kwargs.get("name") or kwargs.get("n")
+    typeName = "shadingEngine" if renderable else "objectSet"
+    return createNode(typeName, name=name)
+
+
+def delete(*args, **kwargs):
+    nodes = [_SCENE.node(n) for n in _names(args)]
+
+    def fill(t):
+        for node in nodes:
+            t.delete_node(node)
+    _run(fill)
+
+
+def rename(*args, **kwargs):
+    if len(args) == 1:
+        node, name = _SCENE.selection[-1], args[0]
+    else:
+        node, name = _SCENE.node(str(args[0])), args[1]
+
+    _run(lambda t: t.rename(node, name))
+    return node.name
+
+
+def objExists(name):
+    try:
+        if "." in name:
+            _SCENE.plug(name)
+        else:
+            _SCENE.node(name)
+    except RuntimeError:
+        return False
+    return True
+
+
+def nodeType(name, **kwargs):
+    return _SCENE.node(name.split(".")[0]).type.name
+
+
+def ls(*args, **kwargs):
+    typeName = kwargs.get("type") or kwargs.get("typ")
+    if kwargs.get("selection") or kwargs.get("sl"):
+        nodes = list(_SCENE.selection)
+    elif args:
+        nodes = [_SCENE.nodes[n] for n in _names(args) if n in _SCENE.nodes]
+    else:
+        nodes = list(_SCENE.nodes.values())
+
+    if typeName:
+        types = typeName if isinstance(typeName, (list, tuple)) else [typeName]
+        nodes = [n for n in nodes if any(n.type.isA(t) for t in types)]
+    return [n.name for n in nodes]
+
+
+def select(*args, **kwargs):
+    if kwargs.get("clear") or kwargs.get("cl"):
+        _SCENE.selection = []
+        return
+
+    nodes = [_SCENE.node(n) for n in _names(args)]
+    if kwargs.get("add") or kwargs.get("af") or kwargs.get("addFirst"):
+        known = set(n.uid for n in _SCENE.selection)
+        nodes = _SCENE.selection + [n for n in nodes if n.uid not in known]
+    elif kwargs.get("deselect") or kwargs.get("d"):
+        drop = set(n.uid for n in nodes)
+        nodes = [n for n in _SCENE.selection if n.uid not in drop]
+    _SCENE.selection = nodes
+
+
+# ----------------------------------Attributes---------------------------------- #
+
+
+def connectAttr(src, dest, force=False, f=False, **kwargs):
+    srcNode, srcKey = _SCENE.plug(src)
+    destNode, destKey = _SCENE.plug(dest)
+
+    current = destNode.inputs.get(destKey)
+    if current == (srcNode, srcKey):
+        api2.MGlobal.displayWarning("'%s' is already connected to '%s'." % (src, dest))
+        return
+    if current is not None and not (force or f):
+        raise RuntimeError("The destination attribute '%s' is already connected." % dest)
+
+    def fill(t):
+        if current is not None:
+            t.disconnect(current[0], current[1], destNode, destKey)
+        t.connect(srcNode, srcKey, destNode, destKey)
+    _run(fill)
+
+
+def disconnectAttr(src, dest, **kwargs):
+    srcNode, srcKey = _SCENE.plug(src)
+    destNode, destKey = _SCENE.plug(dest)
+    _run(lambda t: t.disconnect(srcNode, srcKey, destNode, destKey))
+
+
+def setAttr(path, *values, **kwargs):
+    node, key = _SCENE.plug(path)
+    attr, index = key
+    if attr.kind == "compound":
+        items = [((child, index), v) for child, v in zip(attr.children, values)]
+    else:
+        items = [(key, values[0])]
+
+    for (a, _), value in items:
+        if a.kind == "compound":
+            raise RuntimeError("Wrong amount of values given to %s." % path)
+
+    def fill(t):
+        for k, value in items:
+            t.set_value(node, k, _cast(k[0], value))
+    _run(fill)
+
+
+def getAttr(path, **kwargs):
+    node, key = _SCENE.plug(path)
+    attr, index = key
+    if attr.kind == "compound":
+        return [tuple(node.value((child, index)) for child in attr.children)]
+    return node.value(key)
+
+
+def _cast(attr, value):
+    if attr.kind in ("float", "double"):
+        return float(value)
+    if attr.kind in ("int", "enum"):
+        return int(value)
+    if attr.kind == "bool":
+        return bool(value)
+    return value
+
+
+def _names(args):
+    names = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            names.extend(str(a) for a in arg)
+        else:
+            names.append(str(arg))
+    return names
+
+
+# ----------------------------------Scene---------------------------------- #
+
+
+def file(*args, **kwargs):
+    """
+    Only new scenes are supported, fires the scene messages like Maya.
+    """
+    if not kwargs.get("new"):
+        raise RuntimeError("The stand-in file command only supports new=True.")
+
+    _SCENE.callbacks.fire(("scene", api2.MSceneMessage.kBeforeNew), None)
+    _SCENE.clear()
+    state = _UNDO.state
+    _UNDO.state = False
+    for typeName, name in _DEFAULT_NODES:
+        createNode(typeName, name=name)
+    connectAttr("lambert1.outColor", "initialShadingGroup.surfaceShader")
+    _UNDO.state = state
+    _UNDO.flush()
+    _SCENE.callbacks.fire(("scene", api2.MSceneMessage.kAfterNew), None)
+
+
+# ----------------------------------Plug-ins---------------------------------- #
+
+
+_PLUGINS = {}
+_COMMANDS = {}
+
+
+def loadPlugin(path, quiet=False, qt=False, **kwargs):
+    """
+    Load a python plug-in from its path, other plug-ins are only marked as loaded.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name in _PLUGINS:
+        return [name]
+
+    module = None
+    if path.endswith(".py"):
+        module = imp.load_source(name, path)
+        module.initializePlugin(api2.MObject())
+    _PLUGINS[name] = module
+    return [name]
+
+
+def unloadPlugin(name, force=False, f=False, **kwargs):
+    name = os.path.splitext(os.path.basename(name))[0]
+    module = _PLUGINS.pop(name, None)
+    if module is not None:
+        module.uninitializePlugin(api2.MObject())
+        sys.modules.pop(name, None)
+    return [name]
+
+
+def pluginInfo(name, query=False, q=False, loaded=False, l=False, **kwargs):
+    return os.path.splitext(os.path.basename(name))[0] in _PLUGINS
+
+
+def _register_command(name, creator, syntaxCreator=None):
+    """
+    Add a command of a plug-in to this module, calls are given to a new instance of it.
+    """
+    def command(*args, **flags):
+        cmd = creator()
+        if syntaxCreator is not None:
+            cmd._syntax = syntaxCreator()
+        cmd.doIt(api2.MArgList(args, flags))
+        if cmd.isUndoable():
+            _UNDO.push(cmd.undoIt, cmd.redoIt)
+        return cmd._result
+
+    command.__name__ = name
+    _COMMANDS[name] = command
+    setattr(sys.modules[__name__], name, command)
+
+
+def _deregister_command(name):
+    _COMMANDS.pop(name, None)
+    if hasattr(sys.modules[__name__], name):
+        delattr(sys.modules[__name__], name)
+
+
+# ----------------------------------Color Management---------------------------------- #
+
+
+def colorManagementPrefs(query=False, q=False, cmConfigFileEnabled=False, inputSpaceNames=False, **kwargs):
+    if inputSpaceNames:
+        return list(_COLORSPACES)
+    return False
+
+
+def colorManagementFileRules(*args, **kwargs):
+    if kwargs.get("lsr") or kwargs.get("listRules"):
+        return ["Default"]
+    return "sRGB"
+
+
+# ----------------------------------UI---------------------------------- #
+
+
+def tabLayout(*args, **kwargs):
+    return [] if kwargs.get("query") or kwargs.get("q") else None
+
+
+def shelfLayout(*args, **kwargs):
+    return None if kwargs.get("query") or kwargs.get("q") else (args[0] if args else "shelfLayout1")
+
+
+def shelfButton(*args, **kwargs):
+    return None if kwargs.get("query") or kwargs.get("q") else "shelfButton1"
+
+
+def deleteUI(*args, **kwargs):
+    pass
+
+
+_DEFAULT_NODES = (("lambert", "lambert1"),
+                  ("standardSurface", "standardSurface1"),
+                  ("shadingEngine", "initialShadingGroup"))
+_COLORSPACES = ("Raw", "sRGB", "Utility - Raw", "Utility - sRGB - Texture", "ACEScg")
@@ -0,0 +1,483 @@
+"""
+In-memory dependency graph behind the stand-in modules.
+
+Holds the node types, nodes, plug values and connections of the scene and
+fires the callbacks the plug-in registers. There is no evaluation,
+values are only what was set on a plug, connections don't push values downstream.
+"""
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import itertools
+import re
+
+
+class Attribute(object):
+    """
+    Attribute of a node type.
+
+    Args:
+        name ([String]): Long name.
+        kind ([String]): One of double, float, bool, int, enum, string, message or compound.
+        default ([Object], optional): Value of unset plugs. Defaults to the kinds default.
+        children ([iterable], optional): Child attributes of a compound. Defaults to ().
+        array ([Bool], optional): Determine if the attribute is a multi. Defaults to False.
+        shortName ([String], optional): Short name. Defaults to the long name.
+    """
+    __slots__ = ("name", "shortName", "kind", "default",
+                 "children", "parent", "array", "index")
+
+    def __init__(self, name, kind, default=None, children=(), array=False, shortName=None):
+        self.name = name
+        self.shortName = shortName or name
+        self.kind = kind
+        self.default = _DEFAULTS.get(kind) if default is None else default
+        self.children = tuple(children)
+        self.parent = None
+        self.array = array
+        self.index = 0
+
+        for i, child in enumerate(self.children):
+            child.parent = self
+            child.index = i
+
+    def __repr__(self):
+        return "<Attribute %s>" % self.name
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            for attr in child.walk():
+                yield attr
+
+    def arrayAncestor(self):
+        attr = self
+        while attr is not None:
+            if attr.array:
+                return attr
+            attr = attr.parent
+        return None
+
+
+class NodeType(object):
+    """
+    Node type with its attributes.
+
+    Args:
+        name ([String]): Type name.
+        attributes ([iterable]): Top level Attributes.
+        mfnTypes ([iterable]): MFn types the nodes are compatible with, the first one is the apiType.
+        typeId ([int]): Id of the type.
+        parents ([iterable], optional): Names of the types this one inherits from. Defaults to ().
+    """
+
+    def __init__(self, name, attributes, mfnTypes, typeId, parents=()):
+        self.name = name
+        self.apiType = mfnTypes[0]
+        self.mfnTypes = frozenset(mfnTypes)
+        self.typeId = typeId
+        self.parents = frozenset(parents) | set((name,))
+
+        self.top = tuple(attributes)
+        self.attributes = OrderedDict()
+        self._byName = {}
+        for top in self.top:
+            for attr in top.walk():
+                self.attributes[attr.name] = attr
+                self._byName[attr.name] = attr
+                self._byName.setdefault(attr.shortName, attr)
+
+    def attribute(self, name):
+        return self._byName.get(name)
+
+    def isA(self, name):
+        return name in self.parents
+
+
+class Node(object):
+    """
+    A node of the scene.
+    Plugs are addressed by (Attribute, logical index) keys,
+    the index is None unless the attribute or one of its parents is a multi.
+    """
+    __slots__ = ("uid", "type", "name", "alive", "values", "inputs", "outputs")
+
+    def __init__(self, uid, nodeType, name):
+        self.uid = uid
+        self.type = nodeType
+        self.name = name
+        self.alive = False
+        self.values = {}
+        # -dest key -> (source node, source key)
+        self.inputs = {}
+        # -source key -> dict of (dest node, dest key) -> connection order
+        self.outputs = OrderedDict()
+
+    def __repr__(self):
+        return "<Node %s (%s)>" % (self.name, self.type.name)
+
+    def value(self, key):
+        return self.values.get(key, key[0].default)
+
+    def connectedKeys(self):
+        """
+        Get the keys of every connected plug, destinations first.
+        """
+        keys = list(self.inputs)
+        keys.extend(k for k in self.outputs if k not in self.inputs)
+        return keys
+
+
+class Callbacks(object):
+    """
+    Registered callbacks by kind, optionally bound to a single node.
+    """
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._byId = {}
+        # -kind -> node uid or None -> list of (id, func)
+        self._byKind = {}
+
+    def add(self, kind, func, node=None):
+        cid = next(self._ids)
+        uid = node.uid if node is not None else None
+        self._byKind.setdefault(kind, {}).setdefault(uid, []).append((cid, func))
+        self._byId[cid] = (kind, uid)
+        return cid
+
+    def remove(self, cid):
+        try:
+            kind, uid = self._byId.pop(cid)
+        except KeyError:
+            raise RuntimeError("(kInvalidParameter): Unknown callback id %s" % cid)
+        funcs = self._byKind[kind][uid]
+        funcs[:] = [(i, f) for i, f in funcs if i != cid]
+
+    def fire(self, kind, node, *args):
+        byNode = self._byKind.get(kind)
+        if not byNode:
+            return
+
+        funcs = list(byNode.get(None, ()))
+        if node is not None:
+            funcs.extend(byNode.get(node.uid, ()))
+        for _, func in funcs:
+            func(*args)
+
+
+class Scene(object):
+    """
+    The nodes and connections of the open scene.
+    Every change goes through the methods below, so the callbacks are fired like Maya does.
+    """
+
+    def __init__(self):
+        self.types = {}
+        self.nodes = OrderedDict()
+        self.callbacks = Callbacks()
+        self.selection = []
+        self._uids = itertools.count(1)
+        self._connections = itertools.count()
+        # -base name -> last suffix handed out, so numbering doesn't restart at 1 every time
+        self._suffixes = {}
+
+    # ----------------------------------Types---------------------------------- #
+
+    def register_type(self, nodeType):
+        self.types[nodeType.name] = nodeType
+
+    def nodeType(self, name):
+        nodeType = self.types.get(name)
+        if nodeType is None:
+            raise RuntimeError("(kInvalidParameter): Unknown node type %s" % name)
+        return nodeType
+
+    # ----------------------------------Lookups---------------------------------- #
+
+    def node(self, name):
+        """
+        Get a live node by its name.
+
+        Raises:
+            RuntimeError: If no node has the name.
+        """
+        node = self.nodes.get(name)
+        if node is None:
+            raise RuntimeError("(kInvalidParameter): Object %s does not exist" % name)
+        return node
+
+    def plug(self, path):
+        """
+        Resolve a node.attribute path, eg. file1.outColorR, file1.uvCoord.uCoord or set1.dsm[3].
+
+        Returns:
+            [tuple]: The node and the plug key.
+        """
+        name, _, attrPath = path.partition(".")
+        node = self.node(name)
+        return node, self.key(node, attrPath)
+
+    def key(self, node, attrPath):
+        """
+        Resolve an attribute path on a node into a plug key.
+
+        Raises:
+            RuntimeError: If the attribute doesn't exist.
+        """
+        attr = None
+        index = None
+        for part in attrPath.split("."):
+            match = _PART.match(part)
+            if match is None:
+                attr = None
+                break
+
+            attrName, i = match.groups()
+            attr = node.type.attribute(attrName)
+            if attr is None:
+                break
+            if i is not None:
+                index = int(i)
+
+        if attr is None:
+            raise RuntimeError("(kInvalidParameter): No attribute %s on %s" % (attrPath, node.name))
+        return attr, index
+
+    def unique_name(self, name):
+        """
+        Get a name no live node has, trailing numbers are increased until it's free.
+        """
+        if name not in self.nodes:
+            return name
+
+        base = name.rstrip("0123456789")
+        for i in itertools.count(self._suffixes.get(base, 0) + 1):
+            candidate = "%s%d" % (base, i)
+            if candidate not in self.nodes:
+                self._suffixes[base] = i
+                return candidate
+
+    # ----------------------------------Changes---------------------------------- #
+
+    def create_node(self, typeName, name=None):
+        nodeType = self.nodeType(typeName)
+        node = Node(next(self._uids), nodeType, None)
+        self.add_node(node, name or "%s1" % typeName)
+        return node
+
+    def add_node(self, node, name=None):
+        node.name = self.unique_name(name or node.name)
+        node.alive = True
+        self.nodes[node.name] = node
+        self.callbacks.fire("nodeAdded", None, node)
+
+    def remove_node(self, node):
+        """
+        Disconnect and remove a node.
+
+        Returns:
+            [list]: (source node, source key, dest node, dest key) of every removed connection.
+        """
+        self.callbacks.fire("nodeRemoved", None, node)
+
+        removed = []
+        for key in list(node.inputs):
+            src, srcKey = node.inputs[key]
+            removed.append((src, srcKey, node, key))
+        for key, dests in list(node.outputs.items()):
+            for dest, destKey in sorted(dests, key=dests.get):
+                removed.append((node, key, dest, destKey))
+        for conn in removed:
+            self.disconnect(*conn)
+
+        del self.nodes[node.name]
+        node.alive = False
+        self.selection = [n for n in self.selection if n is not node]
+        return removed
+
+    def rename(self, node, name):
+        prevName = node.name
+        del self.nodes[prevName]
+        node.name = self.unique_name(name)
+        self.nodes[node.name] = node
+        self.callbacks.fire("nameChanged", node, node, prevName)
+        return node.name
+
+    def connect(self, src, srcKey, dest, destKey):
+        if destKey in dest.inputs:
+            raise RuntimeError("(kInvalidParameter): %s already has an incoming connection" %
+                               plug_name(dest, destKey))
+
+        dest.inputs[destKey] = (src, srcKey)
+        src.outputs.setdefault(srcKey, {})[(dest, destKey)] = next(self._connections)
+        self._connectionChanged(src, srcKey, dest, destKey, True)
+
+    def disconnect(self, src, srcKey, dest, destKey):
+        if dest.inputs.get(destKey) != (src, srcKey):
+            raise RuntimeError("(kInvalidParameter): %s isn't connected to %s" % (
+                plug_name(src, srcKey), plug_name(dest, destKey)))
+
+        del dest.inputs[destKey]
+        dests = src.outputs[srcKey]
+        del dests[(dest, destKey)]
+        if not dests:
+            del src.outputs[srcKey]
+        self._connectionChanged(src, srcKey, dest, destKey, False)
+
+    def set_value(self, node, key, value):
+        node.values[key] = value
+        self.callbacks.fire("attributeChanged", node, ATTRIBUTE_SET, node, key, None, None)
+
+    def clear(self):
+        for node in list(reversed(self.nodes.values())):
+            node.alive = False
+        self.nodes.clear()
+        self.selection = []
+        self._suffixes = {}
+
+    def _connectionChanged(self, src, srcKey, dest, destKey, made):
+        self.callbacks.fire("connection", None, src, srcKey, dest, destKey, made)
+
+        msg = CONNECTION_MADE if made else CONNECTION_BROKEN
+        self.callbacks.fire("attributeChanged", src, msg | OTHER_PLUG_SET,
+                            src, srcKey, dest, destKey)
+        self.callbacks.fire("attributeChanged", dest, msg | INCOMING_DIRECTION | OTHER_PLUG_SET,
+                            dest, destKey, src, srcKey)
+
+
+class Transaction(object):
+    """
+    Queue of changes, done and undone as one, the core of MDGModifier and the cmds.
+    Every operation is a callable which changes the scene and returns the callable undoing it.
+    If an operation fails the ones done before stay done, undo rolls them back.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._ops = []
+        self._undos = []
+
+    def __len__(self):
+        return len(self._ops)
+
+    def add(self, op):
+        self._ops.append(op)
+
+    def do(self):
+        while len(self._undos) < len(self._ops):
+            self._undos.append(self._ops[len(self._undos)]())
+
+    def undo(self):
+        while self._undos:
+            self._undos.pop()()
+
+    # ----------------------------------Operations---------------------------------- #
+
+    def create_node(self, typeName, name=None):
+        """
+        Queue the creation of a node, the node exists right away but is only added on do.
+
+        Returns:
+            [Node]: The queued node.
+        """
+        scene = self.scene
+        node = Node(next(scene._uids), scene.nodeType(typeName), name or "%s1" % typeName)
+
+        def op():
+            scene.add_node(node)
+            return lambda: scene.remove_node(node)
+        self.add(op)
+        return node
+
+    def delete_node(self, node):
+        scene = self.scene
+
+        def op():
+            if not node.alive:
+                raise RuntimeError("(kInvalidParameter): %s was already deleted" % node.name)
+            values = dict(node.values)
+            removed = scene.remove_node(node)
+
+            def undo():
+                node.values = values
+                scene.add_node(node)
+                for conn in removed:
+                    scene.connect(*conn)
+            return undo
+        self.add(op)
+
+    def rename(self, node, name):
+        scene = self.scene
+
+        def op():
+            prevName = node.name
+            scene.rename(node, name)
+            return lambda: scene.rename(node, prevName)
+        self.add(op)
+
+    def connect(self, src, srcKey, dest, destKey):
+        scene = self.scene
+
+        def op():
+            scene.connect(src, srcKey, dest, destKey)
+            return lambda: scene.disconnect(src, srcKey, dest, destKey)
+        self.add(op)
+
+    def disconnect(self, src, srcKey, dest, destKey):
+        scene = self.scene
+
+        def op():
+            scene.disconnect(src, srcKey, dest, destKey)
+            return lambda: scene.connect(src, srcKey, dest, destKey)
+        self.add(op)
+
+    def set_value(self, node, key, value):
+        scene = self.scene
+
+        def op():
+            had = key in node.values
+            old = node.values.get(key)
+            scene.set_value(node, key, value)
+
+            def undo():
+                if had:
+                    scene.set_value(node, key, old)
+                else:
+                    node.values.pop(key, None)
+            return undo
+        self.add(op)
+
+
+def plug_name(node, key, longNames=False, includeNodeName=True):
+    """
+    Get the name of a plug, eg. file1.outColorR or set1.dsm[3].
+    Like Maya, the parents of a child are only part of the name if one of them holds the index.
+    """
+    attr, index = key
+    parts = []
+    # -eg. file1.outColorR, but ramp1.colorEntryList[0].color
+    last = None if attr.arrayAncestor() is not None else attr.parent
+    while attr is not last:
+        part = attr.name if longNames else attr.shortName
+        if attr.array and index is not None:
+            part = "%s[%d]" % (part, index)
+        parts.append(part)
+        attr = attr.parent
+
+    path = ".".join(reversed(parts))
+    return "%s.%s" % (node.name, path) if includeNodeName else path
+
+
+# -MNodeMessage.AttributeMessage bits
+CONNECTION_MADE = 0x01
+CONNECTION_BROKEN = 0x02
+ATTRIBUTE_SET = 0x08
+INCOMING_DIRECTION = 0x800
+OTHER_PLUG_SET = 0x4000
+
+_DEFAULTS = {"double": 0.0, "float": 0.0, "bool": False, "int": 0,
+             "enum": 0, "string": "", "message": None, "compound": None}
+_PART = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+
+# -the scene of the session
+SCENE = Scene()
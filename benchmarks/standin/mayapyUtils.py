@@ -0,0 +1,182 @@
+"""
+Stand-in for the mayapyUtils package, the basicMayaIO, mahelper and customTypes modules
+are the classes below and get registered as modules by install.
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+import bisect
+import os
+from contextlib import contextmanager
+
+############ CUSTOM IMPORTS ############
+from . import OpenMaya as api2
+
+
+class MIO_BasicIO(object):
+
+    @staticmethod
+    def get_mobj(name):
+        return api2.MSelectionList().add(name).getDependNode(0)
+
+    @staticmethod
+    def get_plug(mobj, mfn, attr):
+        mfn = mfn or api2.MFnDependencyNode(mobj)
+        return mfn.findPlug(attr, False)
+
+    @staticmethod
+    def get_connectedTo_plugs(plugs, incoming=True):
+        """
+        Get the plugs connected to each of the given plugs in one direction.
+
+        Returns:
+            [List]: (source plugs, destination plug) if incoming else (source plug, destination plugs).
+        """
+        if incoming:
+            return [(p.connectedTo(True, False), p) for p in plugs if p.isDestination]
+        return [(p, p.connectedTo(False, True)) for p in plugs if p.isSource]
+
+    @staticmethod
+    def get_plugValue(plug):
+        if plug.isCompound:
+            return [MIO_BasicIO.get_plugValue(plug.child(i)) for i in range(plug.numChildren())]
+
+        value = plug._value()
+        if isinstance(value, float):
+            return plug.asDouble()
+        return value
+
+    @staticmethod
+    def set_plugValue(plug, value):
+        if isinstance(value, (list, tuple)):
+            for i, v in enumerate(value):
+                MIO_BasicIO.set_plugValue(plug.child(i), v)
+            return
+
+        plug._set(value)
+
+    @staticmethod
+    def get_selection():
+        return api2.MGlobal.getActiveSelectionList()
+
+    @staticmethod
+    def get_selectionIter(selection=None):
+        """
+        Iterate a selection, the whole scene if none is given, yields the iterator at every item.
+        """
+        if selection is None:
+            selection = api2.MSelectionList()
+            it = api2.MItDependencyNodes()
+            while not it.isDone():
+                selection.add(it.thisNode())
+                it.next()
+
+        it = api2.MItSelectionList(selection)
+        while not it.isDone():
+            yield it
+            it.next()
+
+    @staticmethod
+    def get_names(selection=None, check=None):
+        """
+        Get the names of the nodes of a selection, the whole scene if none is given.
+
+        Args:
+            selection ([MSelectionList], optional): Nodes which should be named. Defaults to None.
+            check ([Callable], optional): Called with mobj and mfn, only nodes it returns True for are named.
+                                          Defaults to None.
+
+        Returns:
+            [List]: Names of the nodes.
+        """
+        names = []
+        mfn = api2.MFnDependencyNode()
+        for it in MIO_BasicIO.get_selectionIter(selection):
+            mobj = it.getDependNode()
+            mfn.setObject(mobj)
+            if check is None or check(mobj=mobj, mfn=mfn):
+                names.append(mfn.name())
+        return names
+
+    @staticmethod
+    def get_fileTextureName(mobj, mfn=None):
+        mfn = mfn or api2.MFnDependencyNode(mobj)
+        path = mfn.findPlug("fileTextureName", False).asString()
+        return os.path.splitext(os.path.basename(path))[0] or mfn.name()
+
+    @staticmethod
+    def multiSelect(names):
+        api2.MGlobal.setActiveSelectionList(api2.MSelectionList())
+        for name in names:
+            api2.MGlobal.setActiveSelectionList(api2.MGlobal.getSelectionListByName(name),
+                                                api2.MGlobal.kAddToList)
+
+    @staticmethod
+    def multiConnect(pairs):
+        from . import cmds
+        for src, dest in pairs:
+            cmds.connectAttr(src, dest, force=True)
+
+    @staticmethod
+    def registerCallback(func, event):
+        return api2.MEventMessage.addEventCallback(event, lambda *args: func())
+
+    @staticmethod
+    def deregisterCallback(cid):
+        api2.MMessage.removeCallback(cid)
+
+
+class mahelper(object):
+
+    @staticmethod
+    @contextmanager
+    def undo_chunk():
+        from . import cmds
+        cmds.undoInfo(openChunk=True)
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    @staticmethod
+    @contextmanager
+    def block_signals(widget):
+        blocked = widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            widget.blockSignals(blocked)
+
+    @staticmethod
+    def prefix_name(name, prefix):
+        return "%s_%s" % (prefix, name)
+
+    @staticmethod
+    def is_plugin_loaded(name):
+        from . import cmds
+        return cmds.pluginInfo(name, query=True, loaded=True)
+
+    @staticmethod
+    def reload_plugin(name):
+        from . import cmds
+        if cmds.pluginInfo(name, query=True, loaded=True):
+            cmds.unloadPlugin(name)
+        cmds.loadPlugin(name, quiet=True)
+
+    class WorkspaceControl(object):
+
+        @staticmethod
+        def create_workspaceControl(widget):
+            pass
+
+
+class customTypes(object):
+
+    class LinkedList(list):
+        pass
+
+    class Array(list):
+        pass
+
+    bisect_left = staticmethod(bisect.bisect_left)
+    insort = staticmethod(bisect.insort)
@@ -0,0 +1,164 @@
+"""
+Node types known to the stand-in.
+
+The shaders are built from the attribute lists of scripts/maps/schema.json,
+names with RGB or XYZ children in the list become float3 compounds.
+Textures, placers and shading groups are described here with the attributes the plug-in touches.
+"""
+####### Standard Library IMPORTS #######
+import json
+import os
+
+############ CUSTOM IMPORTS ############
+from .graph import Attribute, NodeType
+
+
+def _float2(name, suffixes, default=0.0, kind="float", shortName=None):
+    return Attribute(name, "compound", shortName=shortName,
+                     children=[Attribute(name[:-2] + s if name.endswith("UV") else name + s, kind, default)
+                               for s in suffixes])
+
+
+def _float3(name, suffixes="RGB", default=0.0, shortName=None):
+    return Attribute(name, "compound", shortName=shortName,
+                     children=[Attribute(name + s, "float", default) for s in suffixes])
+
+
+def _common():
+    return [Attribute("message", "message", shortName="msg"),
+            Attribute("caching", "bool", shortName="cch"),
+            Attribute("nodeState", "enum", shortName="nds")]
+
+
+def _placement():
+    # -place2dTexture outputs which the file node takes as inputs of the same name
+    return [_float2("coverage", "UV", 1.0, shortName="c"),
+            _float2("translateFrame", "UV", shortName="tf"),
+            Attribute("rotateFrame", "double", shortName="rf"),
+            Attribute("mirrorU", "bool", shortName="mu"),
+            Attribute("mirrorV", "bool", shortName="mv"),
+            Attribute("stagger", "bool", shortName="s"),
+            Attribute("wrapU", "bool", True, shortName="wu"),
+            Attribute("wrapV", "bool", True, shortName="wv"),
+            _float2("repeatUV", "UV", 1.0, kind="double", shortName="re"),
+            _float2("offset", "UV", kind="double", shortName="of"),
+            Attribute("rotateUV", "double", shortName="ro"),
+            _float2("noiseUV", "UV", kind="double", shortName="n"),
+            _float2("vertexUvOne", "UV", kind="double", shortName="vt1"),
+            _float2("vertexUvTwo", "UV", kind="double", shortName="vt2"),
+            _float2("vertexUvThree", "UV", kind="double", shortName="vt3"),
+            _float3("vertexCameraOne", "XYZ", shortName="vc1")]
+
+
+def _uvInputs():
+    return [Attribute("uvCoord", "compound", shortName="uv",
+                      children=[Attribute("uCoord", "float"), Attribute("vCoord", "float")]),
+            Attribute("uvFilterSize", "compound", shortName="fs",
+                      children=[Attribute("uvFilterSizeX", "float"), Attribute("uvFilterSizeY", "float")])]
+
+
+def _uvOutputs():
+    return [Attribute("outUV", "compound", shortName="ouv",
+                      children=[Attribute("outU", "float"), Attribute("outV", "float")]),
+            Attribute("outUvFilterSize", "compound", shortName="ofs",
+                      children=[Attribute("outUvFilterSizeX", "float"), Attribute("outUvFilterSizeY", "float")])]
+
+
+def _schemaAttributes(names):
+    """
+    Build the attributes of a shader from its attribute list.
+    """
+    names = list(names)
+    known = set(names)
+    children = set()
+    attrs = []
+    for name in names:
+        if name in children:
+            continue
+
+        for suffixes in ("RGB", "XYZ"):
+            if all(name + s in known for s in suffixes):
+                attrs.append(_float3(name, suffixes))
+                children.update(name + s for s in suffixes)
+                break
+        else:
+            kind = "bool" if name in _BOOLS else "float"
+            attrs.append(Attribute(name, kind))
+    return attrs
+
+
+def build(schemaPath):
+    """
+    Get every node type of the stand-in.
+
+    Args:
+        schemaPath ([String]): Path of schema.json.
+
+    Returns:
+        [list]: The NodeTypes.
+    """
+    with open(schemaPath, "r") as f:
+        schema = json.load(f)
+    schema.pop("_comment", None)
+    # -the arnold and maya surface share there attribute names
+    schema.setdefault("standardSurface", schema["aiStandardSurface"])
+
+    types = []
+    for i, (name, names) in enumerate(sorted(schema.items())):
+        mfnTypes = _SHADER_MFN.get(name, (PLUGIN_DEPEND,))
+        parents = ("lambert",) if name in ("blinn", "phong") else ()
+        types.append(NodeType(name, _common() + _schemaAttributes(names),
+                              mfnTypes + (DEPENDENCY_NODE,), 0x80000 + i, parents))
+
+    types.append(NodeType("file", _common() + _placement() + _uvInputs() + [
+        Attribute("fileTextureName", "string", shortName="ftn"),
+        Attribute("colorSpace", "string", "sRGB", shortName="cs"),
+        Attribute("ignoreColorSpaceFileRules", "bool", shortName="ifr"),
+        _float3("outColor", shortName="oc"),
+        Attribute("outAlpha", "float", shortName="oa")],
+        (FILE_TEXTURE, TEXTURE_2D, DEPENDENCY_NODE), 0x52544654))
+
+    types.append(NodeType("place2dTexture", _common() + _placement() + _uvInputs() + _uvOutputs() + [
+        Attribute("fast", "bool", shortName="fa")],
+        (PLACE2D_TEXTURE, DEPENDENCY_NODE), 0x52504c32))
+
+    types.append(NodeType("shadingEngine", _common() + [
+        _float3("surfaceShader", shortName="ss"),
+        _float3("volumeShader", shortName="vs"),
+        _float3("displacementShader", shortName="ds"),
+        Attribute("dagSetMembers", "message", array=True, shortName="dsm")],
+        (SHADING_ENGINE, SET, DEPENDENCY_NODE), 0x53484144))
+
+    types.append(NodeType("objectSet", _common() + [
+        Attribute("dagSetMembers", "message", array=True, shortName="dsm")],
+        (SET, DEPENDENCY_NODE), 0x4f425354))
+
+    types.append(NodeType("multiplyDivide", _common() + [
+        Attribute("operation", "enum", 1, shortName="op"),
+        _float3("input1", "XYZ", shortName="i1"),
+        _float3("input2", "XYZ", 1.0, shortName="i2"),
+        _float3("output", "XYZ", shortName="o")],
+        (DEPENDENCY_NODE,), 0x524d4456))
+
+    return types
+
+
+# -MFn type values, the file texture and place2dTexture ones match Maya
+DEPENDENCY_NODE = 4
+SET = 460
+SHADING_ENGINE = 320
+LAMBERT = 366
+BLINN = 367
+PHONG = 369
+TEXTURE_2D = 493
+PLACE2D_TEXTURE = 454
+FILE_TEXTURE = 497
+PLUGIN_DEPEND = 456
+
+_SHADER_MFN = {"lambert": (LAMBERT,),
+               "blinn": (BLINN, LAMBERT),
+               "phong": (PHONG, LAMBERT)}
+_BOOLS = ("hideSource", "thinWalled")
+
+SCHEMA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                      "src", "shaderHelper_plugin", "scripts", "maps", "schema.json")
@@ -0,0 +1,229 @@
+"""
+Headless stand-in for PySide2, only installed if PySide2 can't be imported.
+
+Signals and the list model work without an event loop, so the models of the plug-in can be driven directly.
+Every other class is a placeholder which accepts any call, widgets are never shown.
+"""
+####### Standard Library IMPORTS #######
+import types
+
+
+class _BoundSignal(object):
+    __slots__ = ("_slots",)
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots = []
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class Signal(object):
+    """
+    Signal descriptor, every instance gets its own bound signal.
+    """
+
+    def __init__(self, *types):
+        self._name = "_signal_%d" % id(self)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self._name)
+        if bound is None:
+            bound = instance.__dict__[self._name] = _BoundSignal()
+        return bound
+
+
+class _Placeholder(object):
+    """
+    Accepts any construction, call and attribute access.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Placeholder()
+
+    def __call__(self, *args, **kwargs):
+        return _Placeholder()
+
+    def __iter__(self):
+        return iter(())
+
+    def __nonzero__(self):
+        return False
+
+    __bool__ = __nonzero__
+
+
+class QObject(_Placeholder):
+
+    def __init__(self, parent=None, *args, **kwargs):
+        self._parent = parent
+        self._blocked = False
+
+    def parent(self):
+        return self._parent
+
+    def blockSignals(self, block):
+        blocked, self._blocked = self._blocked, block
+        return blocked
+
+
+class QModelIndex(object):
+
+    def __init__(self, row=-1, column=-1, model=None):
+        self._row = row
+        self._column = column
+        self._model = model
+
+    def isValid(self):
+        return self._row >= 0 and self._model is not None
+
+    def row(self):
+        return self._row
+
+    def column(self):
+        return self._column
+
+    def model(self):
+        return self._model
+
+    def data(self, role=0):
+        return self._model.data(self, role) if self.isValid() else None
+
+
+class QAbstractListModel(QObject):
+    layoutAboutToBeChanged = Signal()
+    layoutChanged = Signal()
+    modelAboutToBeReset = Signal()
+    modelReset = Signal()
+    rowsInserted = Signal()
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        return QModelIndex(row, column, self)
+
+    def beginInsertRows(self, parent, first, last):
+        pass
+
+    def endInsertRows(self):
+        self.rowsInserted.emit()
+
+    def beginRemoveRows(self, parent, first, last):
+        pass
+
+    def endRemoveRows(self):
+        pass
+
+    def beginResetModel(self):
+        self.modelAboutToBeReset.emit()
+
+    def endResetModel(self):
+        self.modelReset.emit()
+
+
+class QTimer(QObject):
+    """
+    Timer without an event loop, start does nothing and singleShot calls right away.
+    """
+    timeout = Signal()
+
+    def __init__(self, parent=None):
+        super(QTimer, self).__init__(parent)
+        self._active = False
+        self._interval = 0
+
+    def setSingleShot(self, value):
+        pass
+
+    def setInterval(self, msec):
+        self._interval = msec
+
+    def interval(self):
+        return self._interval
+
+    def start(self, msec=None):
+        self._active = True
+
+    def stop(self):
+        self._active = False
+
+    def isActive(self):
+        return self._active
+
+    @staticmethod
+    def singleShot(msec, func):
+        func()
+
+
+class Qt(object):
+    DisplayRole = 0
+    DecorationRole = 1
+    EditRole = 2
+    ToolTipRole = 3
+    UserRole = 256
+    AscendingOrder = 0
+    DescendingOrder = 1
+
+
+class QApplication(_Placeholder):
+
+    @staticmethod
+    def translate(context, text, disambiguation=None, n=-1):
+        return text
+
+    @staticmethod
+    def instance():
+        return None
+
+
+class _Module(types.ModuleType):
+    """
+    Module which hands out placeholder classes for every name it doesn't define.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = type(name, (_Placeholder,), {})
+        setattr(self, name, cls)
+        return cls
+
+
+def modules():
+    """
+    Build the PySide2 modules.
+
+    Returns:
+        [Dict]: Module name to module.
+    """
+    QtCore = _Module("PySide2.QtCore")
+    for obj in (Signal, QObject, QModelIndex, QAbstractListModel, QTimer, Qt):
+        setattr(QtCore, obj.__name__, obj)
+
+    QtGui = _Module("PySide2.QtGui")
+    QtWidgets = _Module("PySide2.QtWidgets")
+    QtWidgets.QApplication = QApplication
+    QtWidgets.QWidget = QtWidgets.QMainWindow = QObject
+
+    PySide2 = types.ModuleType("PySide2")
+    PySide2.QtCore = QtCore
+    PySide2.QtGui = QtGui
+    PySide2.QtWidgets = QtWidgets
+
+    return {"PySide2": PySide2, "PySide2.QtCore": QtCore,
+            "PySide2.QtGui": QtGui, "PySide2.QtWidgets": QtWidgets}
@@ -39,7 +39,8 @@ package = "shaderHelper_plugin"
 here = os.path.abspath(os.path.dirname(__file__))
 long_description = read("README.md")
 packages = ['shaderHelper_plugin',
-            'shaderHelper_plugin.ui', 'shaderHelper_plugin.scripts']
+            'shaderHelper_plugin.ui', 'shaderHelper_plugin.scripts',
+            'shaderHelper_plugin.scripts.targetTypes']
 requires = [
     "mayapyUtils @ https://github.com/fsImageries/mayapyUtils/tarball/master#egg=mayapyUtils"]
 required_links = [
@@ -51,6 +52,7 @@ attrs = {"name": package,
          "author_email": "imageries@mail.de",
          "package_dir": {"": "src"},
          "packages": find_packages(where="src") if find_packages else packages,
+         "package_data": {"shaderHelper_plugin.scripts": ["maps/*.json"]},
          "install_requires": requires,
          # "dependency_links": required_links,
          "license": "GPL2",
@@ -1,6 +1,8 @@
 import maya.api.OpenMaya as api2
 from maya import cmds, mel
-from shaderHelper_plugin.customCmds import NodeConvertCmd
+from shaderHelper_plugin.customCmds import NodeConvertCmd, ReplacePlace2DCmd
+from shaderHelper_plugin.scripts import nodeRegistry
+from shaderHelper_plugin.scripts import searchIndex
 
 
 SHELF_NAME = "Custom"
@@ -37,10 +39,18 @@ def initializePlugin(plugin):
 
     try:
         pluginMfn.registerCommand(*NodeConvertCmd.create_register())
+        pluginMfn.registerCommand(*ReplacePlace2DCmd.create_register())
         _set_shelfBTN()
     except Exception as e:
         print e
 
+    try:
+        nodeRegistry.REGISTRY.register_callbacks()
+    except Exception as e:
+        # -the cache can't be kept in sync without every callback, turn it off
+        nodeRegistry.REGISTRY.deregister_callbacks()
+        print e
+
 
 def uninitializePlugin(plugin):
     """
@@ -56,6 +66,9 @@ def uninitializePlugin(plugin):
 
     try:
         pluginMfn.deregisterCommand(NodeConvertCmd.COMMAND_NAME)
+        pluginMfn.deregisterCommand(ReplacePlace2DCmd.COMMAND_NAME)
+        nodeRegistry.REGISTRY.deregister_callbacks()
+        searchIndex.INDEX.deregister_callbacks()
         _remove_shelfBTN()
     except Exception as e:
         print e
@@ -2,8 +2,15 @@
 from maya.api import OpenMaya as api2
 
 ############ CUSTOM IMPORTS ############
-from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
-from scripts.baseClasses import BaseNode
+from scripts import instrument
+from scripts import nodeRegistry
+from scripts import place2dMerge
+from scripts import sceneUtils
+from scripts import static_lib
+from scripts import targets
+from scripts.baseClasses import PlugCache, get_corrospondingAttrName
+from scripts.conversionPlan import ConversionPlan, PairPlan, TEMPLATES
+from scripts.bulkValues import PlugValueBatch, write_values
 from mayapyUtils import customTypes as ct
 
 ####### Standard Library IMPORTS #######
@@ -19,50 +26,103 @@ class NodeConvertCmd(api2.MPxCommand):
     After that go over the given attributes, get the needed mapping
     and set all values which aren't connected.
 
+    Any number of source/ destination pairs can be given, either as positional
+    arguments (src1 dst1 src2 dst2 ...) or through the multi-use pair flag.
+    Every pair is collected into a single MDGModifier, so the whole batch
+    is executed and undone at once.
+
+        eg. nodeConvert -pair lambert1 aiStandardSurface1 -pair blinn1 aiStandardSurface2;
+            cmds.nodeConvert(pair=[("lambert1", "aiStandardSurface1"), ("blinn1", "aiStandardSurface2")])
+
+    With dryRun nothing is changed, the command returns the conversion plan as JSON instead.
+    The destinations don't need to exist for a dry run if destType is given.
+    A plan can be applied later with applyPlan.
+
+        eg. plan = cmds.nodeConvert(pair=[("lambert1", "ai_lambert1")], dryRun=True, destType="aiStandardSurface")
+            cmds.nodeConvert(applyPlan=plan)
+
     Args:
         source ([String]): The source node which should be converted.
         dest ([String]): The destionation node which will get converted to.
 
+    Flags:
+        -p -pair ([String, String]): Multi-use, a source and destination node pair.
+        -v -verbose ([Bool]): Print the planned connections and how many plug lookups were saved.
+        -dr -dryRun ([Bool]): Only evaluate the conversion and return the plan as JSON.
+        -dt -destType ([String]): Destination type used for destinations that don't exist in a dry run.
+        -ap -applyPlan ([String]): Apply a plan, as returned by a dry run, instead of evaluating pairs.
+
     Raises:
         RuntimeError: When wrong arguments are given or any of the nodes don't exist.
     """
     COMMAND_NAME = "nodeConvert"
 
+    PAIR_FLAG = ("-p", "-pair")
+    VERBOSE_FLAG = ("-v", "-verbose")
+    DRYRUN_FLAG = ("-dr", "-dryRun")
+    DESTTYPE_FLAG = ("-dt", "-destType")
+    APPLYPLAN_FLAG = ("-ap", "-applyPlan")
+
     def __init__(self):
         super(NodeConvertCmd, self).__init__()
         self.undo = True
+        self.verbose = False
+        self.dryRun = False
+        self.destType = None
+        self.planJson = None
         self.modi = api2.MDGModifier()
-
-        self.new_src_dest_items = ct.LinkedList()
-        self.old_src_dest_items = ct.LinkedList()
-        self.connected_attrs = ct.LinkedList()
-        self.plugs = None
+        self.plugCache = PlugCache()
+        self.values = PlugValueBatch()
 
     def doIt(self, arg_list):
         """
-        Get the source and dest nodes and retrieve all the needed connections and attribute
-        conversions.
+        Get the source and dest nodes of every pair and evaluate the needed connections
+        and attribute conversions into a plan. Every pair of the plan is then added to the
+        shared modifier, unless it's a dry run.
         If any of the functions return False it will return without calling redoIt.
 
         Args:
             arg_list ([MArgList]): Maya Object containing all the data given to the command.
         """
-        src, dst = self.parse_args(arg_list)
+        pairs = self.parse_args(arg_list)
 
-        self.srcNode = BaseNode(MIO.get_mobj(src))
-        self.destNode = BaseNode(MIO.get_mobj(dst))
+        if pairs is None:
+            self.undo = False
+            raise RuntimeError()
 
-        result_conns = self.eval_connections()
-        result_attrs = self.eval_attributes()
+        if self.planJson:
+            try:
+                plan = ConversionPlan.from_json(self.planJson)
+            except (ValueError, KeyError) as e:
+                self.runtimeErr(RuntimeError("Invalid conversion plan: %s" % e))
+                raise RuntimeError()
+        else:
+            plan = ConversionPlan(self.eval_pair(src, dst)
+                                  for src, dst in pairs)
 
-        if not result_conns or not result_attrs:
-            self.undo = False
+            if not self.read_attributes():
+                raise RuntimeError()
+
+        if not plan:
+            self.runtimeErr(RuntimeError(
+                "No nodes given to %s." % self.COMMAND_NAME))
             raise RuntimeError()
+        # -counted from the plan, an applied plan doesn't give any pairs
+        instrument.INSTRUMENT.count("pairs", len(plan))
 
-        connections = self.parse_connections()
-        self.parse_disconnections(connections)
-        for src, dest in connections:
-            self.modi.connect(src, dest)
+        if self.dryRun:
+            self.undo = False
+            self.setResult(plan.to_json())
+            return
+
+        for pair in plan:
+            self.queue_pair(pair)
+        self.queue_values(plan)
+
+        if self.verbose:
+            print("%s: %s plug/node lookups, %s resolved from strings, %s saved by the cache." % (
+                self.COMMAND_NAME, self.plugCache.hits + self.plugCache.misses,
+                self.plugCache.misses, self.plugCache.hits))
 
         self.redoIt()
 
@@ -70,11 +130,8 @@ class NodeConvertCmd(api2.MPxCommand):
         """
         Connect all new connections and set all needed plugs.
         """
-        self.modi.doIt()
-
-        if self.plugs:
-            for plug, value in self.plugs[1]:
-                MIO.set_plugValue(plug, value)
+        with instrument.INSTRUMENT.phase("modifier doIt"):
+            self.modi.doIt()
 
     def undoIt(self):
         """
@@ -82,49 +139,139 @@ class NodeConvertCmd(api2.MPxCommand):
         """
         self.modi.undoIt()
 
-        if self.plugs:
-            for plug, value in self.plugs[0]:
-                MIO.set_plugValue(plug, value)
-
     def isUndoable(self):
         return self.undo
 
-    def eval_connections(self):
+    def eval_pair(self, src, dst):
+        """
+        Evaluate a single source/ destination pair into a plan.
+        The destination only has to exist if no destType is given.
+
+        Args:
+            src ([String]): The source node which should be converted.
+            dst ([String]): The destination node which will get converted to.
+
+        Raises:
+            RuntimeError: If the connections or attributes couldn't be evaluated.
+
+        Returns:
+            [PairPlan]: Connections and attribute values of the pair.
+        """
+        self.srcNode = nodeRegistry.get_node(src)
+
+        exists = sceneUtils.exists(dst)
+        if exists:
+            destType = nodeRegistry.get_node(dst).type
+        elif self.dryRun and self.destType:
+            destType = self.destType
+        else:
+            self.runtimeErr(RuntimeError("(%s) : Node doesn't exist." % dst))
+            raise RuntimeError()
+
+        pair = PairPlan(self.srcNode.name, dst, destType)
+        pair.create = not exists
+
+        template = self.eval_template(destType)
+        result_conns = template and self.eval_connections(pair, template)
+        result_attrs = result_conns and self.eval_attributes(pair, template)
+
+        if not result_conns or not result_attrs:
+            self.undo = False
+            raise RuntimeError()
+
+        if self.dryRun and exists:
+            pair.disconnections = self.parse_disconnections(
+                self.parse_connections(pair))
+
+        return pair
+
+    @instrument.timed("eval_template")
+    def eval_template(self, destType):
+        """
+        Get the attribute level mapping of the srcNode network.
+        Networks with the same types and connected attributes share the same template,
+        so it's only evaluated once per target and maps.
+
+        Args:
+            destType ([String]): Node type of the destination.
+
+        Returns:
+            [Dict, None]: The template or None if it couldn't be evaluated.
+        """
+        incoming = [destPlug.partialName(useLongNames=True)
+                    for _, destPlug in self.srcNode.incomingConnections]
+        outgoing = [srcPlug.partialName(useLongNames=True)
+                    for srcPlug, _ in self.srcNode.outgoingConnections]
+
+        connected_attrs = set()
+        try:
+            # -raises NotImplementedError if destType is no conversion target
+            key = TEMPLATES.key(self.srcNode.type, targets.get_target(destType),
+                                incoming, outgoing)
+            template = TEMPLATES.get(key)
+            if template is not None:
+                return template
+
+            template = {"incoming": {}, "outgoing": {}, "values": []}
+            for direction, attrs in (("incoming", incoming), ("outgoing", outgoing)):
+                for attr in attrs:
+                    newAttr = get_corrospondingAttrName(
+                        self.srcNode, attr, destType)
+                    template[direction][attr] = newAttr
+                    # -unmapped attributes count too, eg. a dropped parent of a mapped child
+                    connected_attrs.add(attr)
+
+            mapping = self.srcNode.get_map(destType)
+            relatives = self.srcNode.get_relatives(destType)
+            for attr in mapping.keys():
+                # -check if attr is connected,
+                #   - if yes - skip attribute and component attributes
+                #   - if component attribute is connected - skip main attribute
+                #     and the connected component
+                if not connected_attrs.isdisjoint(relatives[attr]):
+                    continue
+
+                template["values"].append((attr, mapping[attr]))
+
+        except Exception as e:
+            _, _, tb = sys.exc_info()
+            val = traceback.extract_tb(tb, 1)[0]
+
+            self.runtimeErr(error=e, tb=val)
+            return None
+
+        TEMPLATES.set(key, template)
+        return template
+
+    @instrument.timed("eval_connections")
+    def eval_connections(self, pair, template):
         """
         Goes over the incoming/ outgoing attributes on the srcNode and
-        retrieves the corrosponding plugs on the destNode.
+        retrieves the corrosponding attributes on the destination.
+
+        Args:
+            pair ([PairPlan]): Plan the connections are added to.
+            template ([Dict]): Attribute level mapping of the network.
 
         Returns:
             [Bool]: True if everything succeeded, else False.
         """
         try:
+            incoming = template["incoming"]
             for srcPlugs, destPlug in self.srcNode.incomingConnections:
-                newDestPlug = self.destNode.get_corrospondingAttr(
-                    self.srcNode, destPlug)
-
-                if not newDestPlug.isNull:
-                    self.connected_attrs.append(
-                        destPlug.partialName(useLongNames=True))
+                newAttr = incoming[destPlug.partialName(useLongNames=True)]
 
+                if newAttr:
                     for plug in srcPlugs:
-                        self.old_src_dest_items.append(
-                            (plug.partialName(includeNodeName=True, useLongNames=True), destPlug.partialName(includeNodeName=True, useLongNames=True)))
-                        self.new_src_dest_items.append(
-                            (plug.partialName(includeNodeName=True, useLongNames=True), newDestPlug.partialName(includeNodeName=True, useLongNames=True)))
+                        pair.incoming.append((plug, newAttr))
 
+            outgoing = template["outgoing"]
             for srcPlug, destPlugs in self.srcNode.outgoingConnections:
-                newSrcPlug = self.destNode.get_corrospondingAttr(
-                    self.srcNode, srcPlug)
-
-                if not newSrcPlug.isNull:
-                    self.connected_attrs.append(
-                        srcPlug.partialName(useLongNames=True))
+                newAttr = outgoing[srcPlug.partialName(useLongNames=True)]
 
+                if newAttr:
                     for plug in destPlugs:
-                        self.old_src_dest_items.append(
-                            (srcPlug.partialName(includeNodeName=True, useLongNames=True), plug.partialName(includeNodeName=True, useLongNames=True)))
-                        self.new_src_dest_items.append(
-                            (newSrcPlug.partialName(includeNodeName=True, useLongNames=True), plug.partialName(includeNodeName=True, useLongNames=True)))
+                        pair.outgoing.append((newAttr, plug))
 
         except Exception as e:
             _, _, tb = sys.exc_info()
@@ -135,38 +282,47 @@ class NodeConvertCmd(api2.MPxCommand):
         else:
             return True
 
-    def eval_attributes(self):
+    @instrument.timed("eval_attributes")
+    def eval_attributes(self, pair, template):
         """
-        Goes over the Attributes given by the mapping and
-        retrieves all newPlugs and there new Values and
-        the oldPlugs and there Values (for undo).
+        Goes over the unconnected Attributes given by the template and
+        collects there plugs on the srcNode.
+        The Values are read for the whole batch at once by read_attributes.
+
+        Args:
+            pair ([PairPlan]): Plan the values are added to.
+            template ([Dict]): Attribute level mapping of the network.
 
         Returns:
             [Bool]: True if everything succeeded, else False.
         """
-        newPlugs_oldVal_items = ct.LinkedList()
-        newPlugs_newVal_items = ct.LinkedList()
-
         try:
-            mapping = self.srcNode.get_map()
-            for attr in mapping.keys():
-                # -check if attr is connected,
-                #   - if yes - skip attribute and component attributes
-                #   - if component attribute is connected - skip main attribute
-                #     and the connected component
-                if any(attr in c for c in self.connected_attrs) or any(
-                        c in attr for c in self.connected_attrs):
-                    continue
+            for attr, newAttr in template["values"]:
+                oldAttr = self.srcNode.get_plugFrStr(attr, self.plugCache)
+                self.values.add(pair, str(self.srcNode.type).lower(),
+                                attr, newAttr, oldAttr)
 
-                oldAttr = self.srcNode.get_plugFrStr(attr)
-                newAttr = self.destNode.get_plugFrStr(mapping[attr])
-                attrVal = MIO.get_plugValue(oldAttr)
-                oldAttrVal = MIO.get_plugValue(newAttr)
+        except Exception as e:
+            _, _, tb = sys.exc_info()
+            val = traceback.extract_tb(tb, 1)[0]
 
-                newPlugs_oldVal_items.append((newAttr, oldAttrVal))
-                newPlugs_newVal_items.append((newAttr, attrVal))
+            self.runtimeErr(error=e, tb=val)
+            return False
+        else:
+            return True
 
-            self.plugs = (newPlugs_oldVal_items, newPlugs_newVal_items)
+    @instrument.timed("read_attributes")
+    def read_attributes(self):
+        """
+        Read the Values of every collected Attribute of the batch, grouped by attribute,
+        and add them to there pairs.
+        The old Values don't need to be stored, the modifier keeps them for undo.
+
+        Returns:
+            [Bool]: True if everything succeeded, else False.
+        """
+        try:
+            self.values.read(static_lib.LEGALTYPES_TRANSFORMS)
         except Exception as e:
             _, _, tb = sys.exc_info()
             val = traceback.extract_tb(tb, 1)[0]
@@ -176,104 +332,174 @@ class NodeConvertCmd(api2.MPxCommand):
         else:
             return True
 
-    def parse_connections(self):
+    def queue_pair(self, pair):
         """
-        Extract the actual MObjects and MPlugs from the strings given to the command.
+        Add the connections and disconnections of a planned pair to the modifier.
 
         Args:
-            arg_list ([MArgList]): Maya Object containing all the data given to the command.
-
-        Raises:
-            RuntimeError: If any given Node or attribute Name is wrong.
+            pair ([PairPlan]): The planned pair.
+        """
+        connections = self.parse_connections(pair)
+        disconnections = self.parse_disconnections(connections)
+        for srcPlug, destPlug in disconnections:
+            self.modi.disconnect(srcPlug, destPlug)
+        for srcPlug, destPlug in connections:
+            self.modi.connect(srcPlug, destPlug)
+
+        instrument.INSTRUMENT.count("connections", len(connections))
+        instrument.INSTRUMENT.count("disconnections", len(disconnections))
+
+    @instrument.timed("queue_values")
+    def queue_values(self, plan):
+        """
+        Add the plug values of every planned pair to the modifier in one pass, grouped by attribute.
 
-        Returns:
-            [List]: Containing Tuples of Source, Destination MPlugs.
+        Args:
+            plan ([ConversionPlan]): The planned pairs.
         """
-        connections = self.new_src_dest_items
+        items = {}
+        for pair in plan:
+            destMobj = self.plugCache.get_mobj(pair.dest)
+            for attr, value in pair.values:
+                items.setdefault(attr, []).append(
+                    (self._resolve(attr, destMobj), value))
 
-        # -loop over the connections and split every name by . character
-        # -store it as a tuple comprised of 2 Lists with the node and attribute names
-        #   of the sources and destinations
-        srcDest_NodeConns_str = [(src.split(".", 1), dest.split(".", 1))
-                                 for src, dest in connections]
+        write_values(self.modi, items)
 
-        # -I append to the List with a for-loop instead of a List Comprehension
-        #   because of readability
-        srcDest_plugs = ct.LinkedList()
+    @instrument.timed("parse_connections")
+    def parse_connections(self, pair):
+        """
+        Get the MPlugs of the planned connections.
+        Plugs collected by eval_connections are carried over as they are, names are only resolved
+        for plans read from JSON and only built for verbose and error output.
 
-        for src, dest in srcDest_NodeConns_str:
-            try:
-                # -get the MObjects of the source and destination Nodes
-                # -get the MPlugs of the source and destination attributes
-                # -if any of the needed objects don't exist,
-                #   the functions will raise a RunTime Error
-                srcMobj = MIO.get_mobj(src[0])
-                srcPlug = MIO.get_plug(
-                    srcMobj, api2.MFnDependencyNode(srcMobj), src[1])
-
-                destMobj = MIO.get_mobj(dest[0])
-                destPlug = MIO.get_plug(
-                    destMobj, api2.MFnDependencyNode(destMobj), dest[1])
-
-            except RuntimeError as re:
-                # -override the Runtime Error to display the object that is throwing the Error
-                #   and raise it afterwards
-
-                # -check if the variable names are NOT in the local namespace,
-                #   if False check which one is missing and store the corrosponding names
-                if bool("srcMobj" and "srcPlug" not in locals()):
-                    result = src[0] if "srcMobj" not in locals() else src[1]
-
-                elif bool("destMobj" and "destPlug" not in locals()):
-                    result = dest[0] if "destMobj" not in locals() else dest[1]
-
-                # -split the Error message and swap the kInvalidParameter with the
-                #   first object that throwed an Error
-                err_arg = re.message.split(":")[1]
-                endResult = "(%s) :%s" % (result, err_arg)
-                re.message = endResult
-                raise
-
-            else:
-                # -append the source and destination MPlgs if no Error occured
-                srcDest_plugs.append((srcPlug, destPlug))
-
-        return srcDest_plugs
+        Args:
+            pair ([PairPlan]): The planned pair.
 
+        Raises:
+            RuntimeError: If any given Node or attribute Name is wrong or a plug is null.
+
+        Returns:
+            [List]: Containing Tuples of Source, Destination MPlugs.
+        """
+        destMobj = self.plugCache.get_mobj(pair.dest)
+
+        connections = ct.LinkedList()
+        for plug, attr in pair.incoming:
+            connections.append((self._resolve(plug),
+                                self._resolve(attr, destMobj)))
+        for attr, plug in pair.outgoing:
+            connections.append((self._resolve(attr, destMobj),
+                                self._resolve(plug)))
+
+        for srcPlug, destPlug in connections:
+            if srcPlug.isNull or destPlug.isNull:
+                # -name the plug that is still valid, the null one has no name
+                valid = destPlug if srcPlug.isNull else srcPlug
+                raise RuntimeError("(%s) : Connection with an invalid plug." % (
+                    _plugName(valid) if not valid.isNull else pair.source))
+
+            if self.verbose:
+                print("Connect: %s --> %s" % (_plugName(srcPlug),
+                                              _plugName(destPlug)))
+
+        return connections
+
+    @instrument.timed("parse_disconnections")
     def parse_disconnections(self, connections):
         """
         Check every destination Plug if its changeable,
         yes- get every plug its connected to, as source, and disconnect it
         no- do nothing, is can be connected to
+
+        Returns:
+            [List]: Containing Tuples of Source, Destination MPlugs which need to be disconnected.
         """
+        disconnections = ct.LinkedList()
         for _, dest in connections:
             if dest.isFreeToChange():  # -if True no changes can be made
                 for plug in dest.connectedTo(True, False):
-                    self.modi.disconnect(plug, dest)
+                    disconnections.append((plug, dest))
+        return disconnections
+
+    def _resolve(self, plug, mobj=None):
+        """
+        Get the MPlug of a plug given by the plan.
+
+        Args:
+            plug ([MPlug, String]): An MPlug, a node.attribute name or an attribute name if mobj is given.
+            mobj ([MObject], optional): Node on which the attribute lives. Defaults to None.
+
+        Raises:
+            RuntimeError: If the node or attribute doesn't exist.
+
+        Returns:
+            [MPlug]: The resolved plug.
+        """
+        if isinstance(plug, api2.MPlug):
+            return plug
+
+        if mobj is None:
+            node, plug = plug.split(".", 1)
+            try:
+                mobj = self.plugCache.get_mobj(node)
+            except RuntimeError:
+                raise RuntimeError("(%s) : Node doesn't exist." % node)
+
+        try:
+            return self.plugCache.get_plug(mobj, plug)
+        except RuntimeError:
+            raise RuntimeError("(%s.%s) : Attribute doesn't exist." % (
+                api2.MFnDependencyNode(mobj).name(), plug))
 
+    @instrument.timed("parse_args")
     def parse_args(self, arg_list):
         """
-        Extract the argument data and pass it as 2 Strings.
+        Extract the argument data and pass it as source/ destination pairs.
+        Positional arguments are grouped in twos, pair flags are appended after them.
 
         Args:
             arg_list ([MArgList]): Maya Object containing all the data given to the command.
 
         Returns:
-            [String]: Return 2 Strings, the Source and Destination Node.
+            [List]: Containing Tuples of Source and Destination Node names.
         """
+        signature = "Signature: %s(Str(srcNode), Str(dstNode), ...) or %s(pair=[(Str(srcNode), Str(dstNode)), ...])" % (
+            self.COMMAND_NAME, self.COMMAND_NAME)
+
         try:
             arg_parse = api2.MArgDatabase(self.syntax(), arg_list)
         except RuntimeError as re:
-            re.message = "Wrong arguments given to %s.\nSignature: %s(Str(srcNode), Str(dstNode))" % (
-                self.COMMAND_NAME, self.COMMAND_NAME)
+            re.message = "Wrong arguments given to %s.\n%s" % (
+                self.COMMAND_NAME, signature)
 
             self.runtimeErr(re)
             return None  # -raises unexpected Failure when raising the error
 
-        srcNode_str = arg_parse.commandArgumentString(0)
-        dstNode_str = arg_parse.commandArgumentString(1)
+        self.verbose = arg_parse.isFlagSet(self.VERBOSE_FLAG[0])
+        self.dryRun = arg_parse.isFlagSet(self.DRYRUN_FLAG[0])
+        if arg_parse.isFlagSet(self.DESTTYPE_FLAG[0]):
+            self.destType = arg_parse.flagArgumentString(
+                self.DESTTYPE_FLAG[0], 0)
+        if arg_parse.isFlagSet(self.APPLYPLAN_FLAG[0]):
+            self.planJson = arg_parse.flagArgumentString(
+                self.APPLYPLAN_FLAG[0], 0)
+
+        names = arg_parse.getObjectStrings()
+        if len(names) % 2 != 0:
+            self.runtimeErr(RuntimeError("Uneven number of nodes given to %s.\n%s" % (
+                self.COMMAND_NAME, signature)))
+            return None
+
+        # -group the positional names into n'th item plus the next item
+        pairs = [(n, names[i+1]) for i, n in enumerate(names) if not i % 2]
+
+        flag = self.PAIR_FLAG[0]
+        for i in range(arg_parse.numberOfFlagUses(flag)):
+            flag_args = arg_parse.getFlagArgumentList(flag, i)
+            pairs.append((flag_args.asString(0), flag_args.asString(1)))
 
-        return srcNode_str, dstNode_str
+        return pairs
 
     def runtimeErr(self, error, raise_err=False, tb=None):
         """
@@ -307,8 +533,18 @@ class NodeConvertCmd(api2.MPxCommand):
         """
         syntax = api2.MSyntax()
 
-        syntax.addArg(api2.MSyntax.kString)
-        syntax.addArg(api2.MSyntax.kString)
+        # -positional source/ destination names, any even number of them
+        syntax.setObjectType(api2.MSyntax.kStringObjects, 0)
+
+        syntax.addFlag(cls.PAIR_FLAG[0], cls.PAIR_FLAG[1],
+                       api2.MSyntax.kString, api2.MSyntax.kString)
+        syntax.makeFlagMultiUse(cls.PAIR_FLAG[0])
+        syntax.addFlag(cls.VERBOSE_FLAG[0], cls.VERBOSE_FLAG[1])
+        syntax.addFlag(cls.DRYRUN_FLAG[0], cls.DRYRUN_FLAG[1])
+        syntax.addFlag(cls.DESTTYPE_FLAG[0], cls.DESTTYPE_FLAG[1],
+                       api2.MSyntax.kString)
+        syntax.addFlag(cls.APPLYPLAN_FLAG[0], cls.APPLYPLAN_FLAG[1],
+                       api2.MSyntax.kString)
 
         return syntax
 
@@ -331,3 +567,166 @@ class NodeConvertCmd(api2.MPxCommand):
             [List]: Containing the Cmd-Name, creator- and syntax creator function.
         """
         return [cls.COMMAND_NAME, cls.create_cmd, cls.create_syntax]
+
+
+class ReplacePlace2DCmd(api2.MPxCommand):
+    """
+    Replace place2dTexture commandline command.
+    Bucket the place2dTextures by there placement signature and collapse every bucket
+    into its first placer, the outgoing connections of the others are moved to it and they are deleted.
+
+    Every reconnection and deletion is collected into a single MDGModifier,
+    so the whole merge is one undo step and is rolled back if any of it fails.
+
+        eg. replacePlace2D;
+            cmds.replacePlace2D("place2dTexture1", "place2dTexture2", mergeAll=True)
+
+    Args:
+        place2dTexture ([String]): Optional, placers which should be merged. Defaults to every placer in the scene.
+
+    Flags:
+        -v -verbose ([Bool]): Print the moved connections.
+        -ma -mergeAll ([Bool]): Merge every placer into the first, whatever there placement.
+
+    Returns:
+        [List]: Names of the deleted placers.
+
+    Raises:
+        RuntimeError: When wrong arguments are given or the merge failed.
+    """
+    COMMAND_NAME = "replacePlace2D"
+
+    VERBOSE_FLAG = ("-v", "-verbose")
+    MERGEALL_FLAG = ("-ma", "-mergeAll")
+
+    def __init__(self):
+        super(ReplacePlace2DCmd, self).__init__()
+        self.undo = True
+        self.modi = api2.MDGModifier()
+
+    def doIt(self, arg_list):
+        """
+        Plan the merge of the given or all placers and add it to the modifier.
+
+        Args:
+            arg_list ([MArgList]): Maya Object containing all the data given to the command.
+        """
+        try:
+            arg_parse = api2.MArgDatabase(self.syntax(), arg_list)
+        except RuntimeError:
+            self.undo = False
+            api2.MGlobal.displayError("Wrong arguments given to %s." % self.COMMAND_NAME)
+            raise
+
+        verbose = arg_parse.isFlagSet(self.VERBOSE_FLAG[0])
+        mergeAll = arg_parse.isFlagSet(self.MERGEALL_FLAG[0])
+
+        selection = None
+        names = arg_parse.getObjectStrings()
+        if names:
+            selection = api2.MSelectionList()
+            for n in names:
+                try:
+                    selection.add(n)
+                except RuntimeError:
+                    self.undo = False
+                    api2.MGlobal.displayError("(%s) : Node doesn't exist." % n)
+                    raise
+
+        groups = place2dMerge.group(sceneUtils.iter_place2dTextures(selection),
+                                    byAttributes=not mergeAll)
+        moves, removed = place2dMerge.plan_merge(groups)
+
+        # -disconnect first, a destination only takes one incoming connection
+        for old, src, dest in moves:
+            self.modi.disconnect(old, dest)
+            self.modi.connect(src, dest)
+
+            if verbose:
+                print("Connect: %s --> %s" % (_plugName(src), _plugName(dest)))
+
+        deleted = []
+        for mobj in removed:
+            deleted.append(api2.MFnDependencyNode(mobj).name())
+            self.modi.deleteNode(mobj)
+
+        if not deleted:
+            self.undo = False
+        instrument.INSTRUMENT.count("moved connections", len(moves))
+        instrument.INSTRUMENT.count("deleted placers", len(deleted))
+
+        self.redoIt()
+        self.setResult(deleted)
+
+    def redoIt(self):
+        """
+        Move the connections and delete the merged placers, undo what was done if any of it fails.
+        """
+        try:
+            with instrument.INSTRUMENT.phase("modifier doIt"):
+                self.modi.doIt()
+        except RuntimeError as e:
+            self.undo = False
+            self.modi.undoIt()
+            api2.MGlobal.displayError("%s failed, nothing was changed: %s" % (
+                self.COMMAND_NAME, e))
+            raise
+
+    def undoIt(self):
+        """
+        Restore the deleted placers and there connections.
+        """
+        self.modi.undoIt()
+
+    def isUndoable(self):
+        return self.undo
+
+    @classmethod
+    def create_syntax(cls):
+        """
+        Command syntax creator Function.
+
+        Returns:
+            [MSyntax]: Syntax object containing the definition of the commands syntax.
+        """
+        syntax = api2.MSyntax()
+        syntax.setObjectType(api2.MSyntax.kStringObjects, 0)
+
+        syntax.addFlag(cls.VERBOSE_FLAG[0], cls.VERBOSE_FLAG[1])
+        syntax.addFlag(cls.MERGEALL_FLAG[0], cls.MERGEALL_FLAG[1])
+
+        return syntax
+
+    @classmethod
+    def create_cmd(cls):
+        """
+        Command creator Funtion.
+
+        Returns:
+            [ReplacePlace2DCmd]: Instance of the command.
+        """
+        return ReplacePlace2DCmd()
+
+    @classmethod
+    def create_register(cls):
+        """
+        Helper method to get a register-ready List containing all needed data.
+
+        Returns:
+            [List]: Containing the Cmd-Name, creator- and syntax creator function.
+        """
+        return [cls.COMMAND_NAME, cls.create_cmd, cls.create_syntax]
+
+
+def _plugName(plug):
+    """
+    Get the full name of a plug, only used for verbose and error output.
+
+    Args:
+        plug ([MPlug]): The plug which should be named.
+
+    Returns:
+        [String]: The node.attribute name of the plug.
+    """
+    return plug.partialName(includeNodeName=True, useLongNames=True)
+
@@ -1,10 +1,15 @@
 ############# MAYA IMPORTS #############
 from maya.api import OpenMaya as api2
-from PySide2 import QtCore, QtWidgets
+from PySide2 import QtCore, QtGui, QtWidgets
 
 ############ CUSTOM IMPORTS ############
 from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+import instrument
 import static_lib
+import targets
+
+####### Standard Library IMPORTS #######
+import os
 
 
 class BaseNode(object):
@@ -12,10 +17,17 @@ class BaseNode(object):
     Helper Object-representation of a Dependency Node.
     Used for easy access of node information.
 
+    The connection information is only queried when it's first accessed
+    and cached afterwards, call invalidate to query it again.
+
     Args:
         node ([MObject, String]): Maya object representing the Dependency Node or Name of it.
     """
+    __slots__ = ("mobject", "nodeMfn", "name", "type", "typeID",
+                 "_connections", "_incomingConnections", "_outgoingConnections",
+                 "_connectedNodes")
 
+    @instrument.timed("BaseNode")
     def __init__(self, node):
         self.mobject = node if isinstance(
             node, api2.MObject) else MIO.get_mobj(node)
@@ -24,27 +36,60 @@ class BaseNode(object):
         self.name = self.nodeMfn.name()
         self.type = self.nodeMfn.typeName
         self.typeID = self.nodeMfn.typeId
-        self.connections = self.nodeMfn.getConnections()
-        self.incomingConnections = MIO.get_connectedTo_plugs(
-            self.connections, incoming=True)
-        self.outgoingConnections = MIO.get_connectedTo_plugs(
-            self.connections, incoming=False)
-        self.connectedNodes = self.get_connectedNodes()
+        self.invalidate()
+
+    @property
+    def connections(self):
+        if self._connections is None:
+            self._connections = self.nodeMfn.getConnections()
+        return self._connections
+
+    @property
+    def incomingConnections(self):
+        if self._incomingConnections is None:
+            self._incomingConnections = MIO.get_connectedTo_plugs(
+                self.connections, incoming=True)
+        return self._incomingConnections
+
+    @property
+    def outgoingConnections(self):
+        if self._outgoingConnections is None:
+            self._outgoingConnections = MIO.get_connectedTo_plugs(
+                self.connections, incoming=False)
+        return self._outgoingConnections
+
+    @property
+    def connectedNodes(self):
+        if self._connectedNodes is None:
+            self._connectedNodes = self.get_connectedNodes()
+        return self._connectedNodes
+
+    def invalidate(self):
+        """
+        Drop the cached connection information, it gets queried again on the next access.
+        """
+        self._connections = None
+        self._incomingConnections = None
+        self._outgoingConnections = None
+        self._connectedNodes = None
 
     def __str__(self):
         return self.name
 
-    def get_plugFrStr(self, attrName):
+    def get_plugFrStr(self, attrName, cache=None):
         """
         Get plug from attribute string.
         Pass needed informaton from the BaseNode class.
 
         Args:
             attrName ([String]): The attribute which should be retrieved.
+            cache ([PlugCache], optional): Cache the plug should be resolved through. Defaults to None.
 
         Returns:
             [MPlug]: Returns the wanted plug.
         """
+        if cache is not None:
+            return cache.get_plug(self.mobject, attrName, self.nodeMfn)
         return MIO.get_plug(self.mobject, self.nodeMfn, attrName)
 
     def get_connectedNodes(self):
@@ -71,48 +116,123 @@ class BaseNode(object):
 
     # ----------------------------------Converting Methods---------------------------------- #
 
-    def get_map(self):
+    def get_map(self, destType=targets.DEFAULT):
         """
         Gets the corrosponding conversion map to convert the attributes on this node.
 
+        Args:
+            destType ([String], optional): Conversion target. Defaults to targets.DEFAULT.
+
         Returns:
             [Dict]: A Src-Attribute to Dest-Attribute Dictionary.
         """
-        return static_lib.LEGALTYPES_MAPS[str(self.type).lower()]
+        return targets.get_target(destType).get_map(str(self.type).lower())
+
+    def get_relatives(self, destType=targets.DEFAULT):
+        """
+        Gets the related attributes index of the conversion map of this node.
+
+        Args:
+            destType ([String], optional): Conversion target. Defaults to targets.DEFAULT.
+
+        Returns:
+            [Dict]: A Src-Attribute to frozenset of itself, its parent and child attributes.
+        """
+        return targets.get_target(destType).get_relatives(str(self.type).lower())
+
+
+def get_corrospondingAttrName(srcNode, attrName, destType):
+    """
+    Gets the name of the corrosponding Attribute of a given Attribute on a destination node type.
+    Works on the node type, so the destination node doesn't need to exist.
+
+    Args:
+        srcNode ([shader.BaseNode]): BaseNode of the Node from which the Attribute is taken.
+        attrName ([String]): Long name of the source Attribute.
+        destType ([String]): Node type of the destination.
+
+    Returns:
+        [String, None]: The attribute name or None if None can be found.
+    """
+    # -raises NotImplementedError if destType is no conversion target
+    target = targets.get_target(destType)
+    nodeType = str(srcNode.type).lower()
+
+    if nodeType in static_lib.LEGALTYPES:
+        newAttr = target.get_map(nodeType).get(attrName)
+
+        if newAttr:
+            return newAttr
+
+    if target.nodeClass.hasAttribute(attrName):
+        return attrName
+
+    print "(%s.%s) : Attribute not implemented yet." % (
+        srcNode.name, attrName)
+    return None
+
+
+class PlugCache(object):
+    """
+    Cache of plugs resolved by their attribute name, keyed on the node handle and
+    the long attribute name. Node names are cached too, so every plug and node
+    only has to be resolved from a string once.
 
-    def get_corrospondingAttr(self, srcNode, attrPlug):
+    Used for the lifetime of a single command, the cache doesn't track changes in the scene.
+    """
+    __slots__ = ("_plugs", "_mobjs", "hits", "misses")
+
+    def __init__(self):
+        self._plugs = {}
+        self._mobjs = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_mobj(self, name):
         """
-        Gets the corrosponding Plug of a given Attribute on this Shader instance and returns it.
-        If None can be found an empty MPlug is returned.
+        Get the MObject of the given node name.
 
         Args:
-            srcNode ([shader.BaseNode]): BaseNode of the Node from which the Attribute is taken.
-            attrPlug ([MPlug]): Source Attribute from which the new Attribute should be retrieved.
+            name ([String]): Name of the node.
 
         Returns:
-            [MPlug]: The newly found MPlug or an empty one if None can be found.
+            [MObject]: The node.
+        """
+        mobj = self._mobjs.get(name)
+        if mobj is None:
+            self.misses += 1
+            mobj = self._mobjs[name] = MIO.get_mobj(name)
+        else:
+            self.hits += 1
+        return mobj
+
+    def get_plug(self, mobj, attrName, mfn=None):
         """
-        if self.type != "aiStandardSurface":
-            raise NotImplementedError(
-                "Mapping is only for aiStandardSurface as Destination implemented.")
+        Get the plug of the given attribute on the given node.
 
-        attrName = attrPlug.partialName(useLongNames=True)
-        nodeType = str(srcNode.type).lower()
+        Args:
+            mobj ([MObject]): The node on which the attribute lives.
+            attrName ([String]): The long name of the attribute.
+            mfn ([MFnDependencyNode], optional): Function set of the node, created when needed. Defaults to None.
 
-        if nodeType in static_lib.LEGALTYPES:
-            mapping = srcNode.get_map()
-            newAttr = mapping.get(attrName)
+        Raises:
+            RuntimeError: If the attribute doesn't exist on the node.
 
-            if newAttr:
-                return MIO.get_plug(self.mobject, self.nodeMfn, newAttr)
+        Returns:
+            [MPlug]: The wanted plug.
+        """
+        key = (api2.MObjectHandle(mobj).hashCode(), attrName)
+        cached = self._plugs.get(key)
 
-        try:
-            return MIO.get_plug(self.mobject, self.nodeMfn, attrName)
-        except RuntimeError:
-            print "(%s.%s) : Attribute not implemented yet." % (
-                srcNode.name, attrName)
+        # -hash codes aren't unique, make sure it's the same node
+        if cached is not None and cached[0] == mobj:
+            self.hits += 1
+            return cached[1]
 
-            return api2.MPlug()
+        self.misses += 1
+        plug = MIO.get_plug(mobj, mfn or api2.MFnDependencyNode(mobj), attrName)
+        self._plugs[key] = (mobj, plug)
+        return plug
 
 
 class CustomLineEdit(QtWidgets.QLineEdit):
@@ -121,3 +241,264 @@ class CustomLineEdit(QtWidgets.QLineEdit):
     def focusInEvent(self, event):
         self.focusChange.emit()
         super(CustomLineEdit, self).focusInEvent(event)
+
+
+class HandleListModel(QtCore.QAbstractListModel):
+    """
+    List model over node handles for the selection listView.
+    Names are only resolved when a row is shown or the rows are filtered or sorted,
+    rows are handed to the view in batches through canFetchMore/fetchMore.
+    Sorting and filtering reorder a list of row indices, the handles aren't copied.
+    Both are kept for rows that get appended.
+
+    Args:
+        parent ([QObject], optional): Parent of the model. Defaults to None.
+        batch ([int], optional): Rows per fetch. Defaults to 500.
+    """
+    HandleRole = QtCore.Qt.UserRole
+
+    def __init__(self, parent=None, batch=500):
+        super(HandleListModel, self).__init__(parent)
+        self.batch = batch
+
+        self._handles = []
+        # -rows of _handles in display order, None shows all in order
+        self._view = None
+        self._loaded = 0
+        # -lower case filter text and sort order, appended rows are matched and sorted too
+        self._filter = ""
+        self._order = None
+        # -lower case names of the rows, only resolved for filtering and sorting
+        self._names = {}
+
+    def __len__(self):
+        return len(self._handles) if self._view is None else len(self._view)
+
+    # ----------------------------------Qt Interface---------------------------------- #
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        handle = self.handle(index.row())
+        if role == QtCore.Qt.DisplayRole:
+            return _handleName(handle)
+        if role == self.HandleRole:
+            return handle
+        return None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        count = min(self.batch, len(self) - self._loaded)
+        if parent.isValid() or count <= 0:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def sort(self, column=0, order=QtCore.Qt.AscendingOrder):
+        """
+        Sort the rows by node name, a negative column restores the original order
+        like it does for a QSortFilterProxyModel.
+        Resolves the name of every row in the current view, a filtered view only resolves its own rows.
+        """
+        self.layoutAboutToBeChanged.emit()
+        self._order = order if column >= 0 else None
+        rows = range(len(self._handles)) if self._view is None else self._view
+        self._view = self._arranged(rows)
+        self.layoutChanged.emit()
+
+    # ----------------------------------Handles---------------------------------- #
+
+    def set_handles(self, handles):
+        """
+        Replace the rows, the current filter is kept. Only the first batch is handed to the view.
+
+        Args:
+            handles ([iterable]): MObjectHandles of the nodes, copied into the model.
+        """
+        self.beginResetModel()
+        self._handles = list(handles)
+        self._names = {}
+        self._view = self._arranged(self._matching(range(len(self._handles))))
+        self._loaded = min(self.batch, len(self))
+        self.endResetModel()
+
+    def append_handles(self, handles):
+        """
+        Append rows, the ones matching the filter are shown right away
+        if the view already shows every row. In a sorted view they are merged into place.
+
+        Args:
+            handles ([iterable]): MObjectHandles of the nodes.
+        """
+        complete = self._loaded == len(self)
+        start = len(self._handles)
+        self._handles.extend(handles)
+        if self._view is not None:
+            rows = self._matching(range(start, len(self._handles)))
+            if self._order is None:
+                self._view.extend(rows)
+            elif rows:
+                # -the sort only has to merge the new rows into the sorted ones
+                self.layoutAboutToBeChanged.emit()
+                self._view = self._arranged(self._view + rows)
+                self.layoutChanged.emit()
+
+        if complete:
+            self.fetchMore()
+
+    def set_filter(self, text):
+        """
+        Only show rows whose name contains the text, an empty text shows every row.
+
+        Args:
+            text ([String]): Case insensitive substring of the names.
+        """
+        self.beginResetModel()
+        self._filter = text.lower()
+        self._view = self._arranged(self._matching(range(len(self._handles))))
+        self._loaded = min(self.batch, len(self))
+        self.endResetModel()
+
+    def handle(self, row):
+        return self._handles[row if self._view is None else self._view[row]]
+
+    def _name(self, row):
+        name = self._names.get(row)
+        if name is None:
+            name = self._names[row] = _handleName(self._handles[row]).lower()
+        return name
+
+    def _matching(self, rows):
+        """
+        Get the rows matching the filter.
+
+        Args:
+            rows ([iterable]): Rows of the handles.
+
+        Returns:
+            [list]: The matching rows, every row if there is no filter.
+        """
+        if not self._filter:
+            return list(rows)
+        return [r for r in rows if self._filter in self._name(r)]
+
+    def _arranged(self, rows):
+        """
+        Put the shown rows in the sort order.
+
+        Args:
+            rows ([list]): Rows of the handles which are shown.
+
+        Returns:
+            [list, None]: The rows in display order, None if every row is shown in order.
+        """
+        if self._order is None:
+            return sorted(rows) if self._filter else None
+        return sorted(rows, key=self._name,
+                      reverse=self._order == QtCore.Qt.DescendingOrder)
+
+    def handles(self, indexes=None):
+        """
+        Get the handles of the given model indexes.
+
+        Args:
+            indexes ([iterable], optional): Model indexes. Defaults to None and returns every row, loaded or not.
+
+        Returns:
+            [list]: MObjectHandles of the rows.
+        """
+        if indexes is None:
+            return [self.handle(r) for r in range(len(self))]
+        return [self.handle(i.row()) for i in indexes]
+
+
+class PhaseSummary(QtWidgets.QDialog):
+    """
+    Panel with the per-phase timings and counters recorded by the instrumentation.
+
+    Args:
+        parent ([QWidget], optional): Parent of the panel. Defaults to None.
+    """
+
+    def __init__(self, parent=None):
+        super(PhaseSummary, self).__init__(parent)
+        self.setWindowTitle("Phase Timings")
+        self.resize(520, 320)
+
+        self.summary_text = QtWidgets.QPlainTextEdit(self)
+        self.summary_text.setReadOnly(True)
+        self.summary_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.summary_text.setFont(QtGui.QFont("Courier New", 9))
+
+        self.reset_BTN = QtWidgets.QPushButton("Reset", self)
+        self.reset_BTN.pressed.connect(self.reset)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.summary_text)
+        layout.addWidget(self.reset_BTN)
+
+    def refresh(self):
+        summary = instrument.INSTRUMENT.summary()
+        if not summary:
+            summary = "Nothing recorded.\nActivate verbosity and run a conversion or edit."
+        self.summary_text.setPlainText(summary)
+
+    def reset(self):
+        instrument.INSTRUMENT.reset()
+        self.refresh()
+
+
+class ProfileReport(QtWidgets.QDialog):
+    """
+    Panel with the hot functions of a profiled operation and where its profile was saved.
+
+    Args:
+        parent ([QWidget], optional): Parent of the panel. Defaults to None.
+    """
+
+    def __init__(self, parent=None):
+        super(ProfileReport, self).__init__(parent)
+        self.setWindowTitle("Profile")
+        self.resize(760, 420)
+        self.directory = None
+
+        self.report_text = QtWidgets.QPlainTextEdit(self)
+        self.report_text.setReadOnly(True)
+        self.report_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.report_text.setFont(QtGui.QFont("Courier New", 9))
+
+        self.openFolder_BTN = QtWidgets.QPushButton("Open Folder", self)
+        self.openFolder_BTN.pressed.connect(self.open_folder)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.report_text)
+        layout.addWidget(self.openFolder_BTN)
+
+    def set_report(self, report):
+        """
+        Args:
+            report ([profiling.Report]): The profiled operation.
+        """
+        self.report_text.setPlainText(report.summary())
+        self.directory = os.path.dirname(report.paths[0]) if report.paths else None
+        self.openFolder_BTN.setEnabled(self.directory is not None)
+
+    def open_folder(self):
+        if self.directory:
+            QtGui.QDesktopServices.openUrl(
+                QtCore.QUrl.fromLocalFile(self.directory))
+
+
+def _handleName(handle):
+    if not handle.isValid():
+        return ""
+    return api2.MFnDependencyNode(handle.object()).name()
@@ -0,0 +1,308 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import math
+
+# -numpy is optional, without it the values are kept as lists
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PlugValueBatch(object):
+    """
+    Collects the mapped attribute values of many shaders grouped by attribute.
+    Every group is read with a reader chosen once for its attribute type instead of
+    dispatching on every plug. Numeric groups are gathered into arrays
+    (NumPy if available), so value transforms work on the whole group at once.
+    """
+
+    def __init__(self):
+        # -(srcType, srcAttr, destAttr) -> ([PairPlan], [MPlug])
+        self._groups = OrderedDict()
+
+    def __len__(self):
+        return sum(len(pairs) for pairs, _ in self._groups.values())
+
+    def add(self, pair, srcType, srcAttr, destAttr, srcPlug):
+        """
+        Add a source plug whose value should be read for the given pair.
+
+        Args:
+            pair ([PairPlan]): Plan the value is added to.
+            srcType ([String]): Node type of the source, lower case.
+            srcAttr ([String]): Attribute name on the source.
+            destAttr ([String]): Attribute name on the destination.
+            srcPlug ([MPlug]): Plug the value is read from.
+        """
+        pairs, plugs = self._groups.setdefault(
+            (srcType, srcAttr, destAttr), ([], []))
+        pairs.append(pair)
+        plugs.append(srcPlug)
+
+    def read(self, transforms=None):
+        """
+        Read the values of every group and add them to there pairs.
+
+        Args:
+            transforms ([Dict], optional): Source type to a Dict of source attribute to a callable
+                                           that takes and returns the values of a whole group.
+                                           Defaults to None.
+        """
+        transforms = transforms or {}
+
+        for (srcType, srcAttr, destAttr), (pairs, plugs) in self._groups.items():
+            reader, numeric = _reader(plugs[0])
+            values = [reader(p) for p in plugs]
+
+            if numeric:
+                values = to_array(values)
+
+                transform = transforms.get(srcType, {}).get(srcAttr)
+                if transform is not None:
+                    values = transform(values)
+
+                values = to_list(values)
+
+            for pair, value in zip(pairs, values):
+                pair.values.append((destAttr, value))
+
+    def clear(self):
+        self._groups.clear()
+
+
+def to_array(values):
+    """
+    Gather numeric values into an array, a NumPy array if available.
+
+    Args:
+        values ([List]): Scalars or equally sized value lists.
+
+    Returns:
+        [ndarray, List]: The values as array.
+    """
+    if numpy is not None:
+        return numpy.asarray(values, dtype=numpy.float64)
+    return values
+
+
+def to_list(values):
+    """
+    Turn an array made by to_array back into python values.
+
+    Args:
+        values ([ndarray, List]): The array.
+
+    Returns:
+        [List]: The values as python floats or lists of floats.
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.tolist()
+    return values
+
+
+def compile_transform(expr):
+    """
+    Compile a transform expression of x into a callable.
+    With NumPy the expression is evaluated once on the whole array,
+    without it the values are transformed one by one.
+
+    Args:
+        expr ([String]): The expression, eg. "1.0 - x".
+
+    Returns:
+        [Callable]: Taking and returning the values of a batch.
+    """
+    code = compile(expr, "<transform: %s>" % expr, "eval")
+
+    def transform(x):
+        if numpy is not None and isinstance(x, numpy.ndarray):
+            return eval(code, NUMPY_NAMESPACE, {"x": x})
+        return _map_values(lambda v: eval(code, TRANSFORM_NAMESPACE, {"x": v}), x)
+
+    transform.expression = expr
+    return transform
+
+
+def _map_values(func, values):
+    if isinstance(values, (list, tuple)):
+        return [_map_values(func, v) for v in values]
+    return func(values)
+
+
+def write_values(modi, items):
+    """
+    Add the given plug values to the modifier, grouped by attribute.
+    Every group uses a writer chosen once for its attribute type.
+
+    Args:
+        modi ([MDGModifier]): The modifier which should hold the changes.
+        items ([Dict]): Destination attribute name to a List of (MPlug, value) tuples.
+    """
+    for plugs_values in items.values():
+        if not plugs_values:
+            continue
+
+        writer = _writer(plugs_values[0][0])
+        for plug, value in plugs_values:
+            writer(modi, plug, value)
+
+
+# ----------------------------------Readers/ Writers---------------------------------- #
+
+def _kind(plug):
+    """
+    Get the kind of value an attribute holds.
+
+    Args:
+        plug ([MPlug]): Plug of the attribute.
+
+    Returns:
+        [String, None]: One of compound, bool, int, float, double, string or None if unknown.
+    """
+    if plug.isCompound:
+        return "compound"
+
+    attr = plug.attribute()
+    if attr.hasFn(api2.MFn.kNumericAttribute):
+        numericType = api2.MFnNumericAttribute(attr).numericType()
+        if numericType == api2.MFnNumericData.kBoolean:
+            return "bool"
+        if numericType in _INT_TYPES:
+            return "int"
+        if numericType == api2.MFnNumericData.kFloat:
+            return "float"
+        if numericType == api2.MFnNumericData.kDouble:
+            return "double"
+
+    elif attr.hasFn(api2.MFn.kEnumAttribute):
+        return "int"
+
+    elif attr.hasFn(api2.MFn.kTypedAttribute):
+        if api2.MFnTypedAttribute(attr).attrType() == api2.MFnData.kString:
+            return "string"
+
+    return None
+
+
+def _reader(plug):
+    """
+    Get the fastest reader for the attribute of the given plug.
+
+    Args:
+        plug ([MPlug]): Plug of the attribute.
+
+    Returns:
+        [tuple]: Callable taking a plug and returning its value, and True if the value is numeric.
+    """
+    kind = _kind(plug)
+
+    if kind == "compound":
+        children = [_reader(plug.child(i))
+                    for i in range(plug.numChildren())]
+        if all(numeric for _, numeric in children):
+            readers = [r for r, _ in children]
+            return (lambda p: [r(p.child(i)) for i, r in enumerate(readers)]), True
+
+    elif kind in _READERS:
+        return _READERS[kind]
+
+    return MIO.get_plugValue, False
+
+
+def _writer(plug):
+    """
+    Get the fastest writer for the attribute of the given plug.
+
+    Args:
+        plug ([MPlug]): Plug of the attribute.
+
+    Returns:
+        [Callable]: Taking the modifier, a plug and the value.
+    """
+    kind = _kind(plug)
+
+    if kind == "compound":
+        writers = [_writer(plug.child(i)) for i in range(plug.numChildren())]
+
+        def write(modi, p, value):
+            # -a scalar mapped onto a compound, eg. a float opacity onto a color, sets every child
+            if not isinstance(value, (list, tuple)):
+                value = [value] * len(writers)
+            for i, v in enumerate(value):
+                writers[i](modi, p.child(i), v)
+        return write
+
+    return _WRITERS.get(kind, _newPlugValue)
+
+
+def _newPlugValue(modi, plug, value):
+    """
+    Add a plug value change to the given modifier, so it gets done and undone with it.
+    Compound values are split over the child plugs, a scalar is set on every child of a compound.
+    Fallback for attributes of an unknown kind.
+
+    Args:
+        modi ([MDGModifier]): The modifier which should hold the change.
+        plug ([MPlug]): The plug which should be changed.
+        value ([Object]): The new value, as returned by MIO.get_plugValue.
+    """
+    if isinstance(value, (list, tuple)):
+        for i, v in enumerate(value):
+            _newPlugValue(modi, plug.child(i), v)
+
+    elif plug.isCompound:
+        for i in range(plug.numChildren()):
+            _newPlugValue(modi, plug.child(i), value)
+
+    elif isinstance(value, bool):
+        modi.newPlugValueBool(plug, value)
+
+    elif isinstance(value, int):
+        modi.newPlugValueInt(plug, value)
+
+    elif isinstance(value, float):
+        if _kind(plug) == "float":
+            modi.newPlugValueFloat(plug, value)
+        else:
+            modi.newPlugValueDouble(plug, value)
+
+    else:
+        modi.newPlugValueString(plug, value)
+
+
+# -functions available in transform expressions, single values use the python ones
+TRANSFORM_NAMESPACE = {"__builtins__": {},
+                       "sqrt": math.sqrt,
+                       "clip": lambda x, lo, hi: min(max(x, lo), hi),
+                       "pow": math.pow}
+
+# -the same functions for whole arrays
+if numpy is not None:
+    NUMPY_NAMESPACE = {"__builtins__": {},
+                       "sqrt": numpy.sqrt,
+                       "clip": numpy.clip,
+                       "pow": numpy.power}
+else:
+    NUMPY_NAMESPACE = None
+
+_INT_TYPES = (api2.MFnNumericData.kByte, api2.MFnNumericData.kChar,
+              api2.MFnNumericData.kShort, api2.MFnNumericData.kInt)
+
+_READERS = {"bool": (lambda p: p.asBool(), True),
+            "int": (lambda p: p.asInt(), True),
+            "float": (lambda p: p.asFloat(), True),
+            "double": (lambda p: p.asDouble(), True),
+            "string": (lambda p: p.asString(), False)}
+
+_WRITERS = {"bool": lambda m, p, v: m.newPlugValueBool(p, bool(v)),
+            "int": lambda m, p, v: m.newPlugValueInt(p, int(v)),
+            "float": lambda m, p, v: m.newPlugValueFloat(p, v),
+            "double": lambda m, p, v: m.newPlugValueDouble(p, v),
+            "string": lambda m, p, v: m.newPlugValueString(p, v)}
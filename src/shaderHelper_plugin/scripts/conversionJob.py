@@ -0,0 +1,99 @@
+############ CUSTOM IMPORTS ############
+from mayapyUtils import mahelper
+import instrument
+
+
+class ConversionJob(object):
+    """
+    Converts shaders chunk by chunk, call step from a timer so Maya stays responsive in between.
+    Every chunk is converted in its own undo chunk, so a finished chunk undoes as a unit
+    and a cancelled job leaves the chunks which were done converted.
+
+    Args:
+        items ([list]): Work items of the convert function, eg. shader names or source, destination pairs.
+        convert ([Callable]): Converts a list of items,
+                              returns the converted source, destination pairs or None if it failed.
+        chunkSize ([int], optional): Items per chunk. Defaults to None, which converts all items in one chunk.
+        finished ([Callable], optional): Called once with all converted pairs when the job stops. Defaults to None.
+    """
+
+    def __init__(self, items, convert, chunkSize=None, finished=None):
+        self.items = list(items)
+        self.convert = convert
+        self.chunkSize = chunkSize or max(len(self.items), 1)
+        self.finished = finished
+
+        self.converted = []
+        self.position = 0
+        self.chunks = 0
+        self.failed = False
+        self.cancelled = False
+        self._stopped = False
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def done(self):
+        return self.failed or self.cancelled or self.position >= len(self.items)
+
+    def step(self):
+        """
+        Convert the next chunk.
+
+        Returns:
+            [list]: The source, destination pairs converted by this chunk, empty if the job is done.
+        """
+        if self.done:
+            self._stop()
+            return []
+
+        chunk = self.items[self.position:self.position + self.chunkSize]
+        with instrument.INSTRUMENT.phase("conversion chunk"):
+            with mahelper.undo_chunk():
+                try:
+                    pairs = self.convert(chunk)
+                except Exception:
+                    # -an unexpected error stops the job, the chunk isn't retried
+                    self.failed = True
+                    self._stop()
+                    raise
+
+        if pairs is None:
+            self.failed = True
+            self._stop()
+            return []
+
+        self.position += len(chunk)
+        self.chunks += 1
+        self.converted.extend(pairs)
+
+        if self.done:
+            self._stop()
+        return pairs
+
+    def run(self):
+        """
+        Block until every chunk is converted.
+
+        Returns:
+            [ConversionJob]: This job.
+        """
+        while not self.done:
+            self.step()
+        self._stop()
+        return self
+
+    def cancel(self):
+        """
+        Stop the job after the current chunk, converted chunks are kept.
+        """
+        self.cancelled = True
+        self._stop()
+
+    def _stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        if self.finished is not None and self.converted:
+            self.finished(self.converted)
@@ -0,0 +1,227 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import json
+
+
+class PairPlan(object):
+    """
+    Conversion plan of a single source/ destination pair.
+    Connections to other nodes are kept as MPlugs while the plan lives in memory
+    and are only turned into names when it gets serialised.
+
+    Args:
+        source ([String]): Name of the node which should be converted.
+        dest ([String]): Name of the node it gets converted to, doesn't need to exist yet.
+        destType ([String]): Node type of the destination.
+    """
+    __slots__ = ("source", "dest", "destType", "create", "incoming",
+                 "outgoing", "disconnections", "values")
+
+    def __init__(self, source, dest, destType):
+        self.source = source
+        self.dest = dest
+        self.destType = destType
+        # -the destination didn't exist when planned, a new node is created for it
+        self.create = False
+
+        # -(external plug, dest attribute)
+        self.incoming = []
+        # -(dest attribute, external plug)
+        self.outgoing = []
+        # -(external source plug, external dest plug), only filled when the dest exists
+        self.disconnections = []
+        # -(dest attribute, value)
+        self.values = []
+
+    def to_dict(self):
+        """
+        Get the JSON-serialisable representation of the plan.
+
+        Returns:
+            [Dict]: Plan with every plug given by its name.
+        """
+        return {"source": self.source,
+                "dest": self.dest,
+                "destType": self.destType,
+                "create": self.create,
+                "incoming": [[_plugName(p), a] for p, a in self.incoming],
+                "outgoing": [[a, _plugName(p)] for a, p in self.outgoing],
+                "disconnections": [[_plugName(s), _plugName(d)] for s, d in self.disconnections],
+                "values": [[a, v] for a, v in self.values]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a plan from its serialised representation.
+
+        Args:
+            data ([Dict]): Representation as given by to_dict.
+
+        Returns:
+            [PairPlan]: The rebuilt plan, plugs are given by their names.
+        """
+        plan = cls(data["source"], data["dest"], data["destType"])
+        plan.create = data.get("create", False)
+        plan.incoming = [tuple(i) for i in data.get("incoming", ())]
+        plan.outgoing = [tuple(i) for i in data.get("outgoing", ())]
+        plan.disconnections = [tuple(i)
+                               for i in data.get("disconnections", ())]
+        plan.values = [tuple(i) for i in data.get("values", ())]
+        return plan
+
+
+class ConversionPlan(object):
+    """
+    Plan of a conversion as produced by nodeConvert -dryRun.
+    It lists every connection and attribute value that will change without touching the DG
+    and can be applied later in one batch with nodeConvert -applyPlan.
+
+    Args:
+        pairs ([iterable], optional): PairPlans of the conversion. Defaults to None.
+    """
+    VERSION = 1
+
+    def __init__(self, pairs=None):
+        self.pairs = list(pairs or ())
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def append(self, pair):
+        self.pairs.append(pair)
+
+    def to_json(self, **kwargs):
+        """
+        Serialise the plan.
+
+        Args:
+            **kwargs: Passed on to json.dumps, eg. indent.
+
+        Returns:
+            [String]: The plan as JSON.
+        """
+        return json.dumps({"version": self.VERSION,
+                           "pairs": [p.to_dict() for p in self.pairs]}, **kwargs)
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Rebuild a plan from its JSON representation.
+
+        Args:
+            data ([String]): The plan as JSON.
+
+        Raises:
+            ValueError: If the plan was written by an unknown version.
+
+        Returns:
+            [ConversionPlan]: The rebuilt plan.
+        """
+        data = json.loads(data)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(
+                "Unsupported conversion plan version: %s" % data.get("version"))
+
+        return cls(PairPlan.from_dict(p) for p in data["pairs"])
+
+    def save(self, path):
+        """
+        Write the plan to disk.
+
+        Args:
+            path ([String]): File the plan is written to.
+        """
+        with open(path, "w") as f:
+            f.write(self.to_json(indent=2))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a plan from disk.
+
+        Args:
+            path ([String]): File the plan is read from.
+
+        Returns:
+            [ConversionPlan]: The loaded plan.
+        """
+        with open(path) as f:
+            return cls.from_json(f.read())
+
+
+class TemplateCache(object):
+    """
+    Cache of the attribute level evaluation of shader networks.
+    Networks with the same source type, conversion target and connected attributes
+    map their attributes identically, so the mapping is only evaluated once per network shape.
+    The oldest template is dropped once the cache is full.
+
+    Args:
+        size ([int], optional): Amount of templates kept. Defaults to 1024.
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self._templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(srcType, target, incoming, outgoing):
+        """
+        Build the cache key of a network.
+
+        Args:
+            srcType ([String]): Type of the source node.
+            target ([Target]): Compiled conversion target, re-registering the target
+                               or reloading the maps compiles a new one.
+            incoming ([iterable]): Connected destination attributes of the source node.
+            outgoing ([iterable]): Connected source attributes of the source node.
+
+        Returns:
+            [tuple]: Hashable key of the network shape.
+        """
+        return (srcType, target, frozenset(incoming), frozenset(outgoing))
+
+    def get(self, key):
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return template
+
+    def set(self, key, template):
+        if key not in self._templates and len(self._templates) >= self.size:
+            self._templates.popitem(last=False)
+        self._templates[key] = template
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# -per session template cache, shared by every nodeConvert call
+TEMPLATES = TemplateCache()
+
+
+def _plugName(plug):
+    """
+    Get the full name of a plug, names are passed through as they are.
+
+    Args:
+        plug ([MPlug, String]): The plug which should be named.
+
+    Returns:
+        [String]: The node.attribute name of the plug.
+    """
+    if isinstance(plug, api2.MPlug):
+        return plug.partialName(includeNodeName=True, useLongNames=True)
+    return plug
@@ -0,0 +1,130 @@
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+from functools import wraps
+from timeit import default_timer
+
+
+class Instrument(object):
+    """
+    Per-phase call counts and timings of the hot paths, aggregated until reset.
+    Phases are inclusive, the time of a nested phase is also part of the outer one.
+
+    While disabled a phase is a single attribute check, so the instrumented code
+    doesn't need to be removed for production.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # -phase name -> [calls, seconds]
+        self._phases = OrderedDict()
+        # -counter name -> amount
+        self._counters = OrderedDict()
+
+    def __len__(self):
+        return len(self._phases)
+
+    def reset(self):
+        self._phases = OrderedDict()
+        self._counters = OrderedDict()
+
+    def phase(self, name):
+        """
+        Get a context manager which adds the time spent in it to the phase.
+
+        Args:
+            name ([String]): Name of the phase.
+
+        Returns:
+            [ContextManager]: Times the phase, does nothing while disabled.
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self._phases.setdefault(name, [0, 0.0]))
+
+    def count(self, name, amount=1):
+        """
+        Add to a counter, eg. the amount of pairs or connections of a batch.
+        """
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def stats(self):
+        """
+        Get the aggregated phases and counters.
+
+        Returns:
+            [tuple]: OrderedDict of phase name to (calls, seconds) and OrderedDict of counter name to amount,
+                     both in the order they were first hit.
+        """
+        phases = OrderedDict((name, tuple(stats)) for name, stats in self._phases.items())
+        return phases, OrderedDict(self._counters)
+
+    def summary(self):
+        """
+        Get a table of the phases and counters.
+
+        Returns:
+            [String]: One line per phase and counter, empty if nothing was recorded.
+        """
+        phases, counters = self.stats()
+        if not phases and not counters:
+            return ""
+
+        width = max(len(n) for n in list(phases) + list(counters))
+        lines = ["{0:<{w}} {1:>8} {2:>11} {3:>10}".format(
+            "phase", "calls", "total ms", "mean ms", w=width)]
+        for name, (calls, secs) in phases.items():
+            lines.append("{0:<{w}} {1:>8} {2:>11.2f} {3:>10.3f}".format(
+                name, calls, secs * 1000, secs * 1000 / calls if calls else 0.0, w=width))
+        for name, amount in counters.items():
+            lines.append("{0:<{w}} {1:>8}".format(name, amount, w=width))
+        return "\n".join(lines)
+
+
+class _Phase(object):
+    __slots__ = ("_stats", "_start")
+
+    def __init__(self, stats):
+        self._stats = stats
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, *exc):
+        self._stats[0] += 1
+        self._stats[1] += default_timer() - self._start
+
+
+class _NullPhase(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def timed(name):
+    """
+    Decorator which records every call of the function as the given phase.
+
+    Args:
+        name ([String]): Name of the phase.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not INSTRUMENT.enabled:
+                return func(*args, **kwargs)
+            with INSTRUMENT.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_NULL_PHASE = _NullPhase()
+
+# -per session instrumentation, enabled by the verbose mode of the ShaderHelper_app
+INSTRUMENT = Instrument()
@@ -0,0 +1,401 @@
+"""
+Loads the conversion maps from there JSON files and compiles them.
+
+The compiled maps are cached with marshal and keyed on the mtime and hash of every source file,
+so warm starts skip the parsing and the child attribute expansion.
+Setting SHADERHELPER_CACHE_DIR to an empty string turns the cache off.
+Studios can override the maps per show by pointing SHADERHELPER_MAPS to one or more
+JSON files (separated by os.pathsep), they are merged over the default maps in order.
+
+Doesn't depend on Maya, so the maps can be validated from any python:
+    python mapLoader.py validate [--schema schema.json] [maps.json ...]
+"""
+from __future__ import print_function
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import argparse
+import hashlib
+import marshal
+import json
+import sys
+import os
+
+
+def load(paths=None, cache=True):
+    """
+    Get the compiled conversion maps, from the cache if no source file changed.
+
+    Args:
+        paths ([list], optional): Map files, later ones are merged over earlier ones.
+                                  Defaults to the default maps plus the SHADERHELPER_MAPS overrides.
+        cache (bool, optional): Determine if the cache should be used. Defaults to True.
+
+    Returns:
+        [Dict]: The compiled maps, see compile_maps.
+    """
+    paths = source_paths() if paths is None else paths
+    if not cache or not CACHE_DIR:
+        return compile_maps(_merge(paths))
+
+    cachePath = _cache_path(paths)
+    cached = _read_cache(cachePath)
+    if cached is not None:
+        sources, dirty = _check_sources(cached["sources"], paths)
+        if sources is not None:
+            if dirty:
+                cached["sources"] = sources
+                _write_cache(cachePath, cached)
+            return cached["compiled"]
+
+    compiled = compile_maps(_merge(paths))
+    _write_cache(cachePath, {"version": CACHE_VERSION,
+                             "sources": [_source_key(p) for p in paths],
+                             "compiled": compiled})
+    return compiled
+
+
+def source_paths():
+    """
+    Get the default map file followed by the overrides given by SHADERHELPER_MAPS.
+
+    Returns:
+        [list]: Absolute paths of the map files.
+    """
+    overrides = os.environ.get(ENV_MAPS, "")
+    return [DEFAULT_MAPS] + [os.path.abspath(p) for p in overrides.split(os.pathsep) if p]
+
+
+def compile_maps(data):
+    """
+    Expand the child attributes of the merged maps and index there relatives.
+
+    Args:
+        data ([Dict]): Merged map data as given by the JSON files.
+
+    Returns:
+        [Dict]: With the keys
+                    types - source types in order,
+                    destType - node type the maps convert to,
+                    maps - source type to populated attribute map,
+                    relatives - source type to attribute to frozenset of related attributes,
+                    transforms - source type to attribute to transform expression.
+    """
+    defaultChildren = data.get("childAttributes", {})
+    compiled = {"types": [], "destType": data.get("destType"),
+                "maps": {}, "relatives": {}, "transforms": {}}
+
+    for typ, entry in data["maps"].items():
+        children = entry.get("childAttributes", defaultChildren)
+        m = populate_childAttrs(entry.get("attributes", {}), children)
+
+        compiled["types"].append(typ)
+        compiled["maps"][typ] = m
+        compiled["relatives"][typ] = compile_relatives(m)
+        compiled["transforms"][typ] = populate_transforms(
+            m, entry.get("transforms", {}))
+
+    return compiled
+
+
+def populate_childAttrs(m, children):
+    """
+    Adds the child attributes of color and vector attributes to a map.
+
+    Args:
+        m ([Dict]): Map which should be populated.
+        children ([Dict]): RGB/ XYZ to the attributes which get those children,
+                           attributes with color in there name always get RGB children.
+
+    Returns:
+        [Dict]: The populated map.
+    """
+    rgb = set(a.lower() for a in children.get("RGB", ()))
+    xyz = set(a.lower() for a in children.get("XYZ", ()))
+
+    populated = dict(m)
+    for k, v in m.items():
+        if "color" in k.lower() or k.lower() in rgb:
+            suffixes = "RGB"
+        elif k.lower() in xyz:
+            suffixes = "XYZ"
+        else:
+            continue
+
+        for c in suffixes:
+            populated["%s%s" % (k, c)] = v + c
+    return populated
+
+
+def compile_relatives(m):
+    """
+    Build an index of every mapped attribute to itself, its parent and its child attributes.
+    Used to check in constant time if an attribute or a related compound is connected.
+
+    Args:
+        m ([Dict]): Map populated with child attributes.
+
+    Returns:
+        [Dict]: Attribute to frozenset of related attributes.
+    """
+    relatives = {k: set((k,)) for k in m}
+
+    for k in m:
+        parent = k[:-1]
+        if k[-1] in "RGBXYZ" and parent in m:
+            relatives[k].add(parent)
+            relatives[parent].add(k)
+
+    return {k: frozenset(v) for k, v in relatives.items()}
+
+
+def populate_transforms(m, t):
+    """
+    Give the child attributes of a map the transform expression of there parent.
+
+    Args:
+        m ([Dict]): Map populated with child attributes.
+        t ([Dict]): Attribute to transform expression.
+
+    Returns:
+        [Dict]: Attribute to transform expression.
+    """
+    populated = dict(t)
+    for k in m:
+        parent = k[:-1]
+        if k not in populated and k[-1] in "RGBXYZ" and parent in t:
+            populated[k] = t[parent]
+    return populated
+
+
+def validate(paths, schema):
+    """
+    Check the merged maps against the attribute lists of a schema.
+
+    Args:
+        paths ([list]): Map files, later ones are merged over earlier ones.
+        schema ([Dict]): Node type to list of its attribute names.
+
+    Returns:
+        [list]: Found problems as messages, empty if the maps are valid.
+    """
+    errors = []
+    data = _merge(paths)
+    compiled = compile_maps(data)
+    destType = compiled["destType"]
+    destAttrs = set(schema.get(destType, ()))
+
+    if destType not in schema:
+        errors.append("Destination type %s is not in the schema." % destType)
+
+    for typ in compiled["types"]:
+        if typ not in schema:
+            errors.append("Source type %s is not in the schema." % typ)
+            continue
+
+        srcAttrs = set(schema[typ])
+        for attr, newAttr in sorted(compiled["maps"][typ].items()):
+            if attr not in srcAttrs:
+                errors.append("%s.%s doesn't exist." % (typ, attr))
+            if destAttrs and newAttr not in destAttrs:
+                errors.append("%s.%s -> %s.%s doesn't exist." %
+                              (typ, attr, destType, newAttr))
+
+        for attr, expr in sorted(data["maps"][typ].get("transforms", {}).items()):
+            if attr not in compiled["maps"][typ]:
+                errors.append("%s.%s has a transform but isn't mapped." % (typ, attr))
+            try:
+                names = set(compile(expr, "<transform>", "eval").co_names)
+            except SyntaxError as e:
+                errors.append("%s.%s transform '%s': %s" % (typ, attr, expr, e))
+                continue
+
+            unknown = names - set(TRANSFORM_NAMES)
+            if unknown:
+                errors.append("%s.%s transform '%s' uses unknown names: %s" %
+                              (typ, attr, expr, ", ".join(sorted(unknown))))
+
+    return errors
+
+
+def _merge(paths):
+    """
+    Merge the map files, maps of later files update the attributes and transforms
+    of earlier ones, a null value removes the entry.
+
+    Args:
+        paths ([list]): Map files in merge order.
+
+    Returns:
+        [Dict]: The merged map data.
+    """
+    merged = None
+    for path in paths:
+        data = _read_json(path)
+        if data.get("version") != VERSION:
+            raise ValueError("Unsupported map version %s in %s." %
+                             (data.get("version"), path))
+
+        if merged is None:
+            merged = data
+            continue
+
+        for key in ("destType", "childAttributes"):
+            if key in data:
+                merged[key] = data[key]
+
+        for typ, entry in data.get("maps", {}).items():
+            target = merged["maps"].setdefault(typ, OrderedDict())
+            for key, value in entry.items():
+                if not isinstance(value, dict):
+                    target[key] = value
+                    continue
+
+                section = target.setdefault(key, OrderedDict())
+                for attr, newAttr in value.items():
+                    if newAttr is None:
+                        section.pop(attr, None)
+                    else:
+                        section[attr] = newAttr
+
+    return merged
+
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f, object_pairs_hook=OrderedDict)
+
+
+def _source_key(path, content=None):
+    """
+    Get the cache key of a map file.
+
+    Args:
+        path ([String]): Path of the map file.
+        content ([bytes], optional): Content of the file if already read. Defaults to None.
+
+    Returns:
+        [list]: Path, mtime and sha1 of the file.
+    """
+    if content is None:
+        with open(path, "rb") as f:
+            content = f.read()
+    return [path, os.path.getmtime(path), hashlib.sha1(content).hexdigest()]
+
+
+def _check_sources(sources, paths):
+    """
+    Check if the cached source files are still the same.
+    The mtime is checked first, the files are only hashed if it changed.
+
+    Args:
+        sources ([list]): Cached source keys.
+        paths ([list]): Current map files.
+
+    Returns:
+        [tuple]: The updated source keys or None if any file changed and
+                 whether the mtime of any file changed.
+    """
+    if [s[0] for s in sources] != list(paths):
+        return None, False
+
+    updated = []
+    dirty = False
+    for path, mtime, digest in sources:
+        try:
+            if os.path.getmtime(path) == mtime:
+                updated.append([path, mtime, digest])
+                continue
+
+            key = _source_key(path)
+        except (IOError, OSError):
+            return None, False
+
+        if key[2] != digest:
+            return None, False
+
+        updated.append(key)
+        dirty = True
+
+    return updated, dirty
+
+
+def _cache_path(paths):
+    # -marshal isn't compatible across python versions, so every version gets its own cache
+    name = hashlib.sha1(os.pathsep.join(paths).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, "maps_py%d%d_%s.cache" % (sys.version_info[0], sys.version_info[1], name))
+
+
+def _read_cache(cachePath):
+    try:
+        with open(cachePath, "rb") as f:
+            cached = marshal.load(f)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+        return None
+    return cached
+
+
+def _write_cache(cachePath, cached):
+    # -the cache is only an optimization, any failure to write it just means cold starts,
+    #   it runs on plugin load so nothing may escape
+    tmp = "%s.%d.tmp" % (cachePath, os.getpid())
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR)
+
+        with open(tmp, "wb") as f:
+            marshal.dump(cached, f)
+        if os.path.exists(cachePath):
+            os.remove(cachePath)
+        os.rename(tmp, cachePath)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+VERSION = 1
+CACHE_VERSION = 1
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+DEFAULT_MAPS = os.path.join(MAPS_DIR, "conversionMaps.json")
+DEFAULT_SCHEMA = os.path.join(MAPS_DIR, "schema.json")
+ENV_MAPS = "SHADERHELPER_MAPS"
+CACHE_DIR = os.environ.get("SHADERHELPER_CACHE_DIR",
+                           os.path.join(os.path.expanduser("~"), ".shaderHelper", "cache"))
+# -names usable in transform expressions, see bulkValues.TRANSFORM_NAMESPACE
+TRANSFORM_NAMES = ("x", "sqrt", "clip", "pow")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conversion map utilities.")
+    sub = parser.add_subparsers(dest="command")
+
+    validateParser = sub.add_parser(
+        "validate", help="Check the maps against the attribute lists of a schema.")
+    validateParser.add_argument("maps", nargs="*",
+                                help="Map files in merge order, defaults to the default maps plus %s." % ENV_MAPS)
+    validateParser.add_argument("--schema", default=DEFAULT_SCHEMA,
+                                help="JSON file of node type to attribute names.")
+
+    args = parser.parse_args(argv)
+    if args.command != "validate":
+        parser.print_help()
+        return 2
+
+    paths = [os.path.abspath(p) for p in args.maps] or source_paths()
+    schema = _read_json(args.schema)
+
+    errors = validate(paths, schema)
+    for e in errors:
+        print(e)
+
+    print("%d problem(s) found in %s." % (len(errors), ", ".join(paths)))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
+from baseClasses import BaseNode
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+
+
+class NodeRegistry(object):
+    """
+    Session wide cache of BaseNode instances keyed by their MObjectHandle hash.
+    Least recently used entries are evicted when max_size is exceeded.
+
+    The cache is only used while the DG callbacks are registered, they keep the
+    cached nodes in sync by dropping removed nodes, refreshing renamed nodes and
+    invalidating the connections of nodes whose connections changed.
+    Without callbacks every request returns a fresh BaseNode.
+
+    Args:
+        max_size ([int], optional): Maximum amount of cached nodes. Defaults to 10000.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._nodes = OrderedDict()
+        self._callbacks = []
+
+    def __len__(self):
+        return len(self._nodes)
+
+    @property
+    def active(self):
+        return bool(self._callbacks)
+
+    def get(self, node):
+        """
+        Get the cached BaseNode of the given node, create and cache it if it isn't known yet.
+
+        Args:
+            node ([MObject, String]): Maya object representing the Dependency Node or Name of it.
+
+        Returns:
+            [BaseNode]: The BaseNode representing the given node.
+        """
+        mobj = node if isinstance(node, api2.MObject) else MIO.get_mobj(node)
+
+        if not self._callbacks:
+            self.misses += 1
+            return BaseNode(mobj)
+
+        key = api2.MObjectHandle(mobj).hashCode()
+        cached = self._nodes.pop(key, None)
+
+        # -hash codes aren't unique, make sure it's the same node
+        if cached is not None and cached.mobject == mobj:
+            self.hits += 1
+        else:
+            self.misses += 1
+            cached = BaseNode(mobj)
+
+        # -(re)insert as most recently used and evict the oldest entries
+        self._nodes[key] = cached
+        while len(self._nodes) > self.max_size:
+            self._nodes.popitem(last=False)
+
+        return cached
+
+    def discard(self, mobj):
+        """
+        Remove the given node from the cache.
+
+        Args:
+            mobj ([MObject]): The node which should be removed.
+        """
+        self._nodes.pop(api2.MObjectHandle(mobj).hashCode(), None)
+
+    def clear(self):
+        """
+        Remove every cached node and reset the counters.
+        """
+        self._nodes.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Get the cache statistics.
+
+        Returns:
+            [Dict]: Size, hits, misses and hit rate of the cache.
+        """
+        requests = self.hits + self.misses
+        return {"size": len(self._nodes),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": float(self.hits) / requests if requests else 0.0}
+
+    # ----------------------------------Callbacks---------------------------------- #
+
+    def register_callbacks(self):
+        """
+        Register the DG callbacks which keep the cache in sync with the scene.
+        If one of them fails the ones already registered are kept, so deregister_callbacks removes them.
+        """
+        if self._callbacks:
+            return
+
+        self._callbacks.append(api2.MDGMessage.addNodeRemovedCallback(
+            self._nodeRemoved, "dependNode"))
+        self._callbacks.append(api2.MNodeMessage.addNameChangedCallback(
+            api2.MObject(), self._nameChanged))
+        self._callbacks.append(api2.MDGMessage.addConnectionCallback(self._connectionChanged))
+
+    def deregister_callbacks(self):
+        """
+        Remove the DG callbacks and clear the cache, it can't be kept in sync without them.
+        """
+        if self._callbacks:
+            api2.MMessage.removeCallbacks(self._callbacks)
+        self._callbacks = []
+        self.clear()
+
+    def _cached(self, mobj):
+        node = self._nodes.get(api2.MObjectHandle(mobj).hashCode())
+        if node is not None and node.mobject == mobj:
+            return node
+        return None
+
+    def _nodeRemoved(self, mobj, *_):
+        self.discard(mobj)
+
+    def _nameChanged(self, mobj, *_):
+        node = self._cached(mobj)
+        if node is not None:
+            node.name = node.nodeMfn.name()
+
+    def _connectionChanged(self, srcPlug, destPlug, *_):
+        for plug in (srcPlug, destPlug):
+            node = self._cached(plug.node())
+            if node is not None:
+                node.invalidate()
+
+
+# -per session registry, the callbacks get registered by the plug-in
+REGISTRY = NodeRegistry()
+
+
+def get_node(node):
+    """
+    Get the BaseNode of the given node from the session registry.
+
+    Args:
+        node ([MObject, String]): Maya object representing the Dependency Node or Name of it.
+
+    Returns:
+        [BaseNode]: The BaseNode representing the given node.
+    """
+    return REGISTRY.get(node)
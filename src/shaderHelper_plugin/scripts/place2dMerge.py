@@ -0,0 +1,123 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+import instrument
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+
+
+def signature(mobj):
+    """
+    Get the signature of a place2dTexture, placers with the same signature place there textures the same way.
+    It holds the values of SIGNATURE_ATTRS and the sources of every incoming connection.
+
+    Args:
+        mobj ([MObject]): The place2dTexture.
+
+    Returns:
+        [tuple]: Hashable signature of the placer.
+    """
+    mfn = api2.MFnDependencyNode(mobj)
+    values = tuple(_plugValue(mfn.findPlug(attr, False))
+                   for attr in SIGNATURE_ATTRS)
+
+    # -driven attributes only match if they are driven by the same plug
+    upstream = tuple(sorted((plug.partialName(useLongNames=True), plug.source().name())
+                            for plug in mfn.getConnections() if plug.isDestination))
+
+    return values, upstream
+
+
+@instrument.timed("place2d group")
+def group(place2ds, byAttributes=True):
+    """
+    Bucket the place2dTextures by there signature in a single pass.
+
+    Args:
+        place2ds ([iterable]): MObjects of the place2dTextures.
+        byAttributes (bool, optional): Bucket by signature, otherwise every placer lands
+                                       in one bucket. Defaults to True.
+
+    Returns:
+        [OrderedDict]: Signature to list of MObjects, in the order the placers were given.
+    """
+    groups = OrderedDict()
+    for mobj in place2ds:
+        key = signature(mobj) if byAttributes else None
+        groups.setdefault(key, []).append(mobj)
+    return groups
+
+
+@instrument.timed("place2d plan_merge")
+def plan_merge(groups):
+    """
+    Plan the collapse of every bucket into its first placer.
+    The outgoing connections of the other placers are moved to the same plug of the kept one,
+    every connection of a placer is only visited once, so it's linear in the amount of connections.
+
+    Args:
+        groups ([Dict]): Signature to list of MObjects, as given by group.
+
+    Returns:
+        [tuple]: (old source plug, source plug of the kept placer, destination plug) of every connection
+                 which should be moved and the MObjects of the placers which should be deleted.
+    """
+    moves = []
+    removed = []
+    mfn = api2.MFnDependencyNode()
+    # -every node is connected to its utility list by message, it's dropped with the placer
+    message = api2.MNodeClass("place2dTexture").attribute("message")
+
+    for mobjs in groups.values():
+        if len(mobjs) < 2:
+            continue
+
+        keep = api2.MFnDependencyNode(mobjs[0])
+        for mobj in mobjs[1:]:
+            mfn.setObject(mobj)
+            for plug in mfn.getConnections():
+                if not plug.isSource or plug.attribute() == message:
+                    continue
+
+                src = _counterpart(plug, keep)
+                for dest in plug.destinations():
+                    moves.append((plug, src, dest))
+
+            removed.append(mobj)
+
+    return moves, removed
+
+
+def _counterpart(plug, mfn):
+    """
+    Get the plug of the same attribute and logical index on another node of the same type.
+    """
+    if plug.isChild:
+        return _counterpart(plug.parent(), mfn).child(_childIndex(plug))
+    if plug.isElement:
+        return _counterpart(plug.array(), mfn).elementByLogicalIndex(plug.logicalIndex())
+    return mfn.findPlug(plug.attribute(), False)
+
+
+def _childIndex(plug):
+    parent = plug.parent()
+    for i in range(parent.numChildren()):
+        if parent.child(i).attribute() == plug.attribute():
+            return i
+    raise RuntimeError("%s isn't a child of %s." % (plug.name(), parent.name()))
+
+
+def _plugValue(plug):
+    if plug.isCompound:
+        return tuple(_plugValue(plug.child(i)) for i in range(plug.numChildren()))
+    # -rounded so float noise doesn't split otherwise equal placers
+    return round(plug.asDouble(), PRECISION)
+
+
+# -place2dTexture attributes which change the placement of the texture
+SIGNATURE_ATTRS = ("coverage", "translateFrame", "rotateFrame", "mirrorU", "mirrorV",
+                   "stagger", "wrapU", "wrapV", "repeatUV", "offset", "rotateUV",
+                   "noiseUV", "fast")
+PRECISION = 6
@@ -0,0 +1,171 @@
+####### Standard Library IMPORTS #######
+import json
+import os
+import pstats
+import tempfile
+import time
+
+
+class Report(object):
+    """
+    Result of a profiled operation, saves it for the developers and lists its hot functions.
+
+    Args:
+        operation ([String]): Name of the profiled operation, used in the file names.
+        profile ([cProfile.Profile]): The profiler which ran the operation.
+    """
+
+    def __init__(self, operation, profile):
+        self.operation = operation
+        self.created = time.localtime()
+        self.stats = pstats.Stats(profile)
+        self.paths = []
+
+    @property
+    def total(self):
+        return self.stats.total_tt
+
+    def save(self, directory=None):
+        """
+        Write the profile as .prof, readable by pstats and snakeviz,
+        and as speedscope JSON, which can be dropped onto https://www.speedscope.app.
+
+        Args:
+            directory ([String], optional): Folder the files are written to. Defaults to PROFILE_DIR.
+
+        Returns:
+            [list]: Paths of the written files.
+        """
+        directory = directory or PROFILE_DIR
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        base = os.path.join(directory, "%s_%s" % (
+            self.operation, time.strftime("%Y%m%d_%H%M%S", self.created)))
+
+        self.stats.dump_stats(base + ".prof")
+        with open(base + ".speedscope.json", "w") as f:
+            json.dump(speedscope(self.stats, self.operation), f)
+
+        self.paths = [base + ".prof", base + ".speedscope.json"]
+        return self.paths
+
+    def top(self, n=None, sort="tottime"):
+        """
+        Get the hottest functions of the profile.
+
+        Args:
+            n ([int], optional): Amount of functions. Defaults to None, which uses TOP_N.
+            sort ([String], optional): tottime for the time spent in the function itself,
+                                       cumtime to include its callees. Defaults to "tottime".
+
+        Returns:
+            [list]: (label, calls, tottime, cumtime) of the functions, hottest first.
+        """
+        n = n or TOP_N
+        index = 2 if sort == "tottime" else 3
+        rows = [(_label(func), nc, tt, ct)
+                for func, (cc, nc, tt, ct, _) in self.stats.stats.items()]
+        rows.sort(key=lambda r: r[index], reverse=True)
+        return rows[:n]
+
+    def summary(self, n=None):
+        """
+        Get a table of the hottest functions and where the profile was saved.
+
+        Args:
+            n ([int], optional): Amount of functions. Defaults to None, which uses TOP_N.
+
+        Returns:
+            [String]: The table.
+        """
+        rows = self.top(n)
+        width = max([len(r[0]) for r in rows] + [8])
+        lines = ["%s: %.3fs total" % (self.operation, self.total), "",
+                 "{0:<{w}} {1:>9} {2:>11} {3:>11}".format("function", "calls", "self ms", "cum ms", w=width)]
+        for label, calls, tt, ct in rows:
+            lines.append("{0:<{w}} {1:>9} {2:>11.2f} {3:>11.2f}".format(
+                label, calls, tt * 1000, ct * 1000, w=width))
+
+        if self.paths:
+            lines.append("")
+            lines.extend("Saved: %s" % p for p in self.paths)
+        return "\n".join(lines)
+
+
+def speedscope(stats, name):
+    """
+    Convert profile stats into a speedscope sampled profile.
+    cProfile only keeps the time per caller/ callee edge, not the full stacks,
+    so the stacks are rebuilt from the edges and a function called from several places
+    splits its time by what each caller spent in it, the same way snakeviz does.
+
+    Args:
+        stats ([pstats.Stats]): The profile.
+        name ([String]): Name shown by speedscope.
+
+    Returns:
+        [Dict]: Speedscope file content.
+    """
+    frames = []
+    frameIndex = {}
+    children = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        frameIndex[func] = len(frames)
+        frames.append({"name": func[2], "file": func[0], "line": func[1]})
+        for caller, edge in callers.items():
+            # -the edge holds (cc, nc, tt, ct) of func when called by the caller
+            children.setdefault(caller, []).append((func, edge[3]))
+
+    samples = []
+    weights = []
+
+    def walk(func, budget, stack):
+        cc, nc, tt, ct, _ = stats.stats[func]
+        share = budget / ct if ct else 0.0
+        stack.append(frameIndex[func])
+
+        if tt * share >= _MIN_WEIGHT:
+            samples.append(list(stack))
+            weights.append(tt * share)
+
+        if len(stack) < _MAX_DEPTH:
+            for child, edgeTime in children.get(func, ()):
+                # -recursion is folded into the first call, it would never end otherwise
+                if frameIndex[child] not in stack and edgeTime * share >= _MIN_WEIGHT:
+                    walk(child, edgeTime * share, stack)
+        stack.pop()
+
+    for func, (_, _, _, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, ct, [])
+
+    return {"$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "shaderHelper",
+            "name": name,
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [{"type": "sampled",
+                          "name": name,
+                          "unit": "seconds",
+                          "startValue": 0,
+                          "endValue": sum(weights),
+                          "samples": samples,
+                          "weights": weights}]}
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == "~":
+        # -builtins have no file
+        return name
+    return "%s (%s:%d)" % (name, os.path.basename(filename), line)
+
+
+# -hot functions shown after a profiled operation
+TOP_N = 25
+# -folder the profiles are saved to
+PROFILE_DIR = os.path.join(tempfile.gettempdir(), "shaderHelper_profiles")
+# -rebuilt stacks below this many seconds are dropped, so deep fan-outs stay small
+_MIN_WEIGHT = 1e-6
+_MAX_DEPTH = 128
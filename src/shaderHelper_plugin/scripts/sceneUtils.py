@@ -0,0 +1,135 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+
+def iter_nodes(mfnType, selection=None):
+    """
+    Iterate the nodes of a single type, the iterators are filtered by Maya
+    so nodes of other types are never visited.
+
+    Args:
+        mfnType ([int]): MFn type of the wanted nodes, eg. api2.MFn.kFileTexture.
+        selection ([MSelectionList], optional): Nodes which should be iterated.
+                                                Defaults to None and iterates the whole scene.
+
+    Yields:
+        [MObject]: The nodes of the given type.
+    """
+    if selection is None:
+        it = api2.MItDependencyNodes(mfnType)
+        current = it.thisNode
+    else:
+        it = api2.MItSelectionList(selection, mfnType)
+        current = it.getDependNode
+
+    while not it.isDone():
+        yield current()
+        it.next()
+
+
+def iter_fileTextures(selection=None):
+    """
+    Iterate the file texture nodes of the scene or selection.
+
+    Args:
+        selection ([MSelectionList], optional): Nodes which should be iterated. Defaults to None.
+
+    Yields:
+        [MObject]: The file nodes.
+    """
+    return iter_nodes(api2.MFn.kFileTexture, selection)
+
+
+def iter_place2dTextures(selection=None):
+    """
+    Iterate the place2dTexture nodes of the scene or selection.
+
+    Args:
+        selection ([MSelectionList], optional): Nodes which should be iterated. Defaults to None.
+
+    Yields:
+        [MObject]: The place2dTexture nodes.
+    """
+    return iter_nodes(api2.MFn.kPlace2dTexture, selection)
+
+
+def get_handles(selection):
+    """
+    Get handles of the nodes in a selection list.
+
+    Args:
+        selection ([MSelectionList]): The nodes.
+
+    Returns:
+        [list]: MObjectHandle of every node.
+    """
+    return [api2.MObjectHandle(selection.getDependNode(i))
+            for i in range(selection.length())]
+
+
+def get_selectionList(handles):
+    """
+    Build a selection list from handles, deleted nodes are skipped.
+
+    Args:
+        handles ([iterable]): MObjectHandles of the nodes.
+
+    Returns:
+        [MSelectionList]: The nodes.
+    """
+    sel = api2.MSelectionList()
+    for h in handles:
+        if h.isValid():
+            sel.add(h.object())
+    return sel
+
+
+def select(handles):
+    """
+    Replace the active selection with the nodes of the handles in a single call,
+    the nodes aren't looked up by name again.
+
+    Args:
+        handles ([iterable]): MObjectHandles of the nodes, deleted nodes are skipped.
+    """
+    api2.MGlobal.setActiveSelectionList(get_selectionList(handles))
+
+
+def exists(name):
+    """
+    Check if a node with the given name exists.
+
+    Args:
+        name ([String]): Name of the node.
+
+    Returns:
+        [Bool]: True if it exists.
+    """
+    try:
+        api2.MSelectionList().add(name)
+    except RuntimeError:
+        return False
+    return True
+
+
+def unique_name(name, reserved=()):
+    """
+    Get a name no node has yet, like Maya the trailing number is increased until it's free.
+
+    Args:
+        name ([String]): The wanted name.
+        reserved ([Container], optional): Names which count as taken, eg. ones handed out before. Defaults to ().
+
+    Returns:
+        [String]: The name or the first free numbered variant of it.
+    """
+    if name not in reserved and not exists(name):
+        return name
+
+    base = name.rstrip("0123456789")
+    number = int(name[len(base):] or 0)
+    while True:
+        number += 1
+        candidate = "%s%d" % (base, number)
+        if candidate not in reserved and not exists(candidate):
+            return candidate
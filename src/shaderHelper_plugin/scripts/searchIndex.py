@@ -0,0 +1,438 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+import sceneUtils
+
+####### Standard Library IMPORTS #######
+from collections import deque
+from operator import attrgetter
+import bisect
+import itertools
+import math
+
+
+class FieldIndex(object):
+    """
+    Substring and prefix index over the values of one field.
+    Every value is indexed by its trigrams, a substring query intersects the trigram sets
+    of the query and only verifies the remaining candidates, shorter queries scan the values.
+    Prefix queries bisect a sorted list of the values.
+    Values are compared case insensitive.
+    """
+    __slots__ = ("_keys", "_grams", "_sorted")
+
+    def __init__(self):
+        # -lower value -> set of entry keys
+        self._keys = {}
+        # -trigram -> set of lower values
+        self._grams = {}
+        # -sorted lower values for prefix queries
+        self._sorted = []
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key, value):
+        if not value:
+            return
+
+        value = value.lower()
+        keys = self._keys.get(value)
+        if keys is None:
+            keys = self._keys[value] = set()
+            for gram in _grams(value):
+                self._grams.setdefault(gram, set()).add(value)
+            bisect.insort(self._sorted, value)
+        keys.add(key)
+
+    def remove(self, key, value):
+        if not value:
+            return
+
+        value = value.lower()
+        keys = self._keys.get(value)
+        if keys is None:
+            return
+
+        keys.discard(key)
+        if keys:
+            return
+
+        del self._keys[value]
+        for gram in _grams(value):
+            values = self._grams.get(gram)
+            if values is not None:
+                values.discard(value)
+                if not values:
+                    del self._grams[gram]
+
+        i = bisect.bisect_left(self._sorted, value)
+        if i < len(self._sorted) and self._sorted[i] == value:
+            del self._sorted[i]
+
+    def substring(self, query):
+        """
+        Get the keys of all entries whose value contains the query.
+
+        Args:
+            query ([String]): The searched substring.
+
+        Returns:
+            [set]: Matching entry keys.
+        """
+        query = query.lower()
+        if len(query) < GRAM_SIZE:
+            values = [v for v in self._keys if query in v]
+        elif len(query) == GRAM_SIZE:
+            values = self._grams.get(query, ())
+        else:
+            # -intersect the smallest gram sets first, the rest only narrows it down
+            grams = sorted((self._grams.get(g, _EMPTY) for g in set(_grams(query))),
+                           key=len)
+            values = set(grams[0])
+            for g in grams[1:]:
+                if not values:
+                    break
+                values.intersection_update(g)
+            values = [v for v in values if query in v]
+
+        return self._collect(values)
+
+    def prefix(self, query):
+        """
+        Get the keys of all entries whose value starts with the query.
+
+        Args:
+            query ([String]): The searched prefix.
+
+        Returns:
+            [set]: Matching entry keys.
+        """
+        query = query.lower()
+        start = bisect.bisect_left(self._sorted, query)
+        end = start
+        while end < len(self._sorted) and self._sorted[end].startswith(query):
+            end += 1
+
+        return self._collect(self._sorted[start:end])
+
+    def _collect(self, values):
+        return set().union(*map(self._keys.__getitem__, values))
+
+
+class SearchIndex(object):
+    """
+    In-memory index of the node names, node types and the file texture paths and colorspaces
+    to answer keyword searches without walking the scene.
+
+    It's built on the first search and kept up to date by DG callbacks,
+    scene loads suspend the callbacks and rebuild the index afterwards.
+    """
+    # -fields searched per search mode, same order as the searchBy comboBox
+    MODES = (("name", "type"), ("path",), ("colorSpace",))
+
+    def __init__(self):
+        # -entry key -> _Entry, keys are unique per indexed node
+        self._entries = {}
+        # -MObjectHandle hash -> entry keys, hash codes aren't unique
+        self._buckets = {}
+        self._nextKey = itertools.count()
+        self._fields = {}
+        self._callbacks = []
+        self._sceneCallbacks = []
+        self._attrCallbacks = {}
+        self._suspended = False
+        self.built = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def build(self):
+        """
+        Index every node of the scene and register the callbacks which keep it up to date.
+        """
+        self.clear()
+        for mobj in sceneUtils.iter_nodes(api2.MFn.kDependencyNode):
+            self._add(mobj)
+
+        self.built = True
+        self.register_callbacks()
+
+    def clear(self):
+        """
+        Remove every entry, the attribute callbacks of the file nodes are removed with them.
+        """
+        if self._attrCallbacks:
+            api2.MMessage.removeCallbacks(list(self._attrCallbacks.values()))
+        self._attrCallbacks = {}
+        self._entries = {}
+        self._buckets = {}
+        self._fields = {field: FieldIndex()
+                        for mode in self.MODES for field in mode}
+        self.built = False
+
+    def search(self, keywords, mode=0, selection=None):
+        """
+        Get the names of the nodes matching any of the keywords.
+        Keywords match anywhere in the value, with a trailing * only at its start.
+        Like the *keyword* glob of the former keywordSelection, an empty keyword matches
+        every node with a value in the searched fields.
+
+        Args:
+            keywords ([iterable]): Keywords, eg. the comma separated text of the search lineEdit.
+            mode ([int], optional): Index into MODES, which fields are searched. Defaults to 0.
+            selection ([MSelectionList], optional): Only return nodes in this selection. Defaults to None.
+
+        Returns:
+            [list]: Sorted names of the matching nodes.
+        """
+        return sorted(self._entries[k].name for k in self._match(keywords, mode, selection))
+
+    def search_handles(self, keywords, mode=0, selection=None):
+        """
+        Get the handles of the nodes matching any of the keywords, see search.
+
+        Returns:
+            [list]: MObjectHandles of the matching nodes, sorted by name.
+        """
+        entries = sorted((self._entries[k] for k in self._match(keywords, mode, selection)),
+                         key=_byName)
+        return [e.handle for e in entries]
+
+    def _match(self, keywords, mode, selection):
+        if not self.built:
+            self.build()
+
+        keys = set()
+        for keyword in keywords:
+            for field in self.MODES[mode]:
+                index = self._fields[field]
+                if keyword.endswith("*"):
+                    keys.update(index.prefix(keyword[:-1]))
+                else:
+                    keys.update(index.substring(keyword))
+
+        if selection is not None:
+            keys.intersection_update(self._entry(selection.getDependNode(i))
+                                     for i in range(selection.length()))
+
+        return keys
+
+    # ----------------------------------Entries---------------------------------- #
+
+    def _add(self, mobj):
+        key = self._entry(mobj)
+        if key is not None:
+            self._remove(key)
+
+        handle = api2.MObjectHandle(mobj)
+        key = next(self._nextKey)
+        mfn = api2.MFnDependencyNode(mobj)
+        entry = _Entry(handle, handle.hashCode(), mfn.name(), mfn.typeName)
+        self._buckets.setdefault(entry.hashCode, []).append(key)
+
+        if mobj.hasFn(api2.MFn.kFileTexture):
+            entry.path = mfn.findPlug("fileTextureName", False).asString()
+            entry.colorSpace = mfn.findPlug("colorSpace", False).asString()
+            if self._callbacks:
+                self._watch(key, mobj)
+
+        self._entries[key] = entry
+        for field in _FIELDS:
+            self._fields[field].add(key, getattr(entry, field))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        # -the hash it was added with, an invalid handle has none anymore
+        bucket = self._buckets[entry.hashCode]
+        bucket.remove(key)
+        if not bucket:
+            del self._buckets[entry.hashCode]
+
+        for field in _FIELDS:
+            self._fields[field].remove(key, getattr(entry, field))
+
+        cb = self._attrCallbacks.pop(key, None)
+        if cb is not None:
+            api2.MMessage.removeCallback(cb)
+
+    def _update(self, key, field, value):
+        entry = self._entries[key]
+        self._fields[field].remove(key, getattr(entry, field))
+        setattr(entry, field, value)
+        self._fields[field].add(key, value)
+
+    def _entry(self, mobj):
+        """
+        Get the key of the entry of a node.
+
+        Returns:
+            [int, None]: The key or None if the node isn't indexed.
+        """
+        # -hash codes aren't unique, the bucket is checked for the same node
+        for key in self._buckets.get(api2.MObjectHandle(mobj).hashCode(), ()):
+            if self._entries[key].handle.object() == mobj:
+                return key
+        return None
+
+    # ----------------------------------Callbacks---------------------------------- #
+
+    def register_callbacks(self):
+        """
+        Register the callbacks which keep the index in sync with the scene.
+        """
+        if self._callbacks:
+            return
+
+        self._callbacks = [
+            api2.MDGMessage.addNodeAddedCallback(
+                self._nodeAdded, "dependNode"),
+            api2.MDGMessage.addNodeRemovedCallback(
+                self._nodeRemoved, "dependNode"),
+            api2.MNodeMessage.addNameChangedCallback(
+                api2.MObject(), self._nameChanged)]
+
+        for before, after in _SCENE_MESSAGES:
+            self._sceneCallbacks.append(api2.MSceneMessage.addCallback(
+                before, self._suspend))
+            self._sceneCallbacks.append(api2.MSceneMessage.addCallback(
+                after, self._resume))
+
+        for key, entry in self._entries.items():
+            if entry.path is not None:
+                self._watch(key, entry.handle.object())
+
+    def deregister_callbacks(self):
+        """
+        Remove every callback and clear the index, it can't be kept in sync without them.
+        """
+        if self._callbacks:
+            api2.MMessage.removeCallbacks(self._callbacks)
+        if self._sceneCallbacks:
+            api2.MMessage.removeCallbacks(self._sceneCallbacks)
+        self._callbacks = []
+        self._sceneCallbacks = []
+        self.clear()
+
+    def _watch(self, key, mobj):
+        self._attrCallbacks[key] = api2.MNodeMessage.addAttributeChangedCallback(
+            mobj, self._attributeChanged)
+
+    def _nodeAdded(self, mobj, *_):
+        if not self._suspended:
+            self._add(mobj)
+
+    def _nodeRemoved(self, mobj, *_):
+        if self._suspended:
+            return
+
+        key = self._entry(mobj)
+        if key is not None:
+            self._remove(key)
+
+    def _nameChanged(self, mobj, *_):
+        if self._suspended:
+            return
+
+        key = self._entry(mobj)
+        if key is not None:
+            self._update(key, "name", api2.MFnDependencyNode(mobj).name())
+
+    def _attributeChanged(self, msg, plug, *_):
+        if self._suspended or not msg & api2.MNodeMessage.kAttributeSet:
+            return
+
+        field = _WATCHED.get(plug.partialName(useLongNames=True))
+        if field is None:
+            return
+
+        key = self._entry(plug.node())
+        if key is not None:
+            self._update(key, field, plug.asString())
+
+    def _suspend(self, *_):
+        # -loading a scene adds nodes before there attributes are set,
+        #   so the index is rebuilt once it's done
+        self._suspended = True
+
+    def _resume(self, *_):
+        self._suspended = False
+        if self.built:
+            self.build()
+
+
+class LatencyStats(object):
+    """
+    Rolling window of query latencies.
+
+    Args:
+        size ([int], optional): Amount of kept samples. Defaults to 200.
+    """
+
+    def __init__(self, size=200):
+        self.samples = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+
+    def percentiles(self, ps=(50, 90, 99)):
+        """
+        Get the nearest-rank percentiles of the kept samples.
+
+        Args:
+            ps ([iterable], optional): Wanted percentiles. Defaults to (50, 90, 99).
+
+        Returns:
+            [list]: (percentile, seconds) pairs, empty without samples.
+        """
+        ordered = sorted(self.samples)
+        if not ordered:
+            return []
+        return [(p, ordered[max(int(math.ceil(p / 100.0 * len(ordered))) - 1, 0)])
+                for p in ps]
+
+    def summary(self):
+        return ", ".join("p%d %.2fms" % (p, secs * 1000) for p, secs in self.percentiles())
+
+
+class _Entry(object):
+    __slots__ = ("handle", "hashCode", "name", "type", "path", "colorSpace")
+
+    def __init__(self, handle, hashCode, name, type):
+        self.handle = handle
+        self.hashCode = hashCode
+        self.name = name
+        self.type = type
+        self.path = None
+        self.colorSpace = None
+
+
+def _grams(value):
+    """
+    Get every GRAM_SIZE long substring of the value.
+    """
+    for i in range(len(value) - GRAM_SIZE + 1):
+        yield value[i:i + GRAM_SIZE]
+
+
+GRAM_SIZE = 3
+_byName = attrgetter("name")
+_EMPTY = frozenset()
+_FIELDS = ("name", "type", "path", "colorSpace")
+# -file node attribute -> indexed field
+_WATCHED = {"fileTextureName": "path", "colorSpace": "colorSpace"}
+# -scene operations during which the index is suspended and rebuilt afterwards
+_SCENE_MESSAGES = ((api2.MSceneMessage.kBeforeNew, api2.MSceneMessage.kAfterNew),
+                   (api2.MSceneMessage.kBeforeOpen, api2.MSceneMessage.kAfterOpen),
+                   (api2.MSceneMessage.kBeforeImport, api2.MSceneMessage.kAfterImport),
+                   (api2.MSceneMessage.kBeforeCreateReference, api2.MSceneMessage.kAfterCreateReference))
+
+# -per session index, built on the first search
+INDEX = SearchIndex()
@@ -3,6 +3,10 @@ from maya import cmds
 from maya.api import OpenMaya as api2
 from PySide2 import QtCore
 
+############ CUSTOM IMPORTS ############
+import bulkValues
+import mapLoader
+
 ####### Standard Library IMPORTS #######
 from contextlib import contextmanager
 from functools import partial
@@ -12,99 +16,36 @@ from functools import partial
 # --------------------------------------------------------------------- #
 
 
-mappingLambert = {
-    "diffuse": "base",
-    "color": "baseColor",
-    "normalCamera": "normalCamera",
-    "incandescence": "emissionColor",
-    "translucence": "subsurface",
-    "transparency": "opacity"
-}
-
-mappingBlinn = {
-    "diffuse": "base",
-    "color": "baseColor",
-    "specularRollOff": "specular",
-    "specularColor": "specularColor",
-    "reflectivity": "coat",
-    "reflectedColor": "coatColor",
-    "eccentricity": "specularRoughness",
-    "normalCamera": "normalCamera",
-    "incandescence": "emissionColor",
-    "transparency": "opacity",
-    "translucence": "subsurface"
-}
-
-mappingPhong = {
-    "diffuse": "base",
-    "color": "baseColor",
-    "reflectedColor": "coatColor",
-    "specularColor": "specularColor",
-    "reflectivity": "coat",
-    "normalCamera": "normalCamera",
-    "incandescence": "emissionColor",
-    "translucence": "subsurface"
-}
-# -Not tested
-mappingMia = {
-    "diffuse_weight": "base",
-    "diffuse": "baseColor",
-    "diffuse_roughness": "diffuseRoughness",
-    "refl_color": "specularColor",
-    "reflectivity": "specular",
-    "refr_ior": "coat_IOR",
-    "refr_color": "coatColor",
-    "transparency": "transmission",
-    "anisotropy_rotation": "anisotropyRotation",
-    "cutout_opacity": "opacity"
-}
-# -Not tested
-mappingDielectric = {
-    "ior": "IOR",
-    "col": "transmittance"
-}
-
-
-def _populate_childAttrs(m):
+def _compile_transforms(t):
     """
-    Populate map with child attributes like colorR, colorB, colorG.
+    Compile the transform expressions of a map once,
+    attributes with the same expression share the callable.
 
     Args:
-        m ([Dict]): Map which should be populated.
+        t ([Dict]): Attribute to transform expression.
 
     Returns:
-        [Dict]: Changed map.
+        [Dict]: Attribute to transform callable, taking and returning the values of a batch.
     """
-    for k in m.keys():
-        if "color" in k.lower() or k.lower() in _RGB:
-            for c in "RGB":
-                m["%s%s" % (k, c)] = m[k]+c
-
-        elif k.lower() in _XYZ:
-            for c in "XYZ":
-                m["%s%s" % (k, c)] = m[k]+c
-    return m
+    compiled = {}
+    for expr in set(t.values()):
+        compiled[expr] = bulkValues.compile_transform(expr)
+    return {k: compiled[expr] for k, expr in t.items()}
 
 
-# -attributes in these maps will get child attributes with there corrosponding aliases
-_RGB = ("transparency", "incandescence")
-_XYZ = ("normalcamera")
-# -temp map list
-_MAPS = (mappingLambert, mappingBlinn, mappingPhong,
-         mappingMia, mappingDielectric)
+# -compiled maps from scripts/maps, cached between sessions, see mapLoader
+_COMPILED = mapLoader.load()
 
-
-MAPS = tuple(_populate_childAttrs(m) for m in _MAPS)
-LEGALTYPES = ("lambert", "blinn", "phong", "mia_material_x_passes",
-              "mia_material_x", "dielectric_material")
+LEGALTYPES = tuple(_COMPILED["types"])
 NON_DELETEABLES = ("lambert1", "particleCloud1",
                    "shaderGlow1", "standardSurface1")
-LEGALTYPES_MAPS = {typ: maps for typ, maps in zip(LEGALTYPES, MAPS)}
+LEGALTYPES_MAPS = _COMPILED["maps"]
+LEGALTYPES_RELATIVES = _COMPILED["relatives"]
+LEGALTYPES_TRANSFORMS = {typ: _compile_transforms(t)
+                         for typ, t in _COMPILED["transforms"].items()}
 
 
 # --------------------- Build QT Interface Information ---------------- #
 # --------------------------------------------------------------------- #
 
-CONVERT_TO = {"aiStandardSurface": "ai"}
-
 COLORSPACES = partial(cmds.colorManagementPrefs, q=True, inputSpaceNames=True)
@@ -0,0 +1,5 @@
+"""
+Conversion target for Arnold's aiStandardSurface, the base maps are written for it.
+"""
+NODE_TYPE = "aiStandardSurface"
+PREFIX = "ai"
@@ -0,0 +1,25 @@
+"""
+Conversion target for Redshift's RedshiftMaterial.
+"""
+NODE_TYPE = "RedshiftMaterial"
+PREFIX = "rs"
+
+RENAME = {
+    "base": "diffuse_weight",
+    "baseColor": "diffuse_color",
+    "diffuseRoughness": "diffuse_roughness",
+    "specular": "refl_weight",
+    "specularColor": "refl_color",
+    "specularRoughness": "refl_roughness",
+    "specularRotation": "refl_aniso_rotation",
+    "coat": "coat_weight",
+    "coatColor": "coat_color",
+    "coatIOR": "coat_ior",
+    "transmission": "refr_weight",
+    "transmissionColor": "refr_color",
+    "specularIOR": "refr_ior",
+    "opacity": "opacity_color",
+    "emissionColor": "emission_color",
+    "subsurface": "ms_amount",
+    "normalCamera": "bump_input"
+}
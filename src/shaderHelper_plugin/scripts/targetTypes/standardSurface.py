@@ -0,0 +1,5 @@
+"""
+Conversion target for Maya's standardSurface, it shares the attribute names of aiStandardSurface.
+"""
+NODE_TYPE = "standardSurface"
+PREFIX = "ss"
@@ -0,0 +1,28 @@
+"""
+Conversion target for the usdPreviewSurface of the maya-usd plugin.
+"""
+NODE_TYPE = "usdPreviewSurface"
+PREFIX = "usd"
+
+RENAME = {
+    "base": None,
+    "baseColor": "diffuseColor",
+    "diffuseRoughness": None,
+    "specular": None,
+    "specularRoughness": "roughness",
+    "specularRotation": None,
+    "coat": "clearcoat",
+    "coatColor": None,
+    "coatIOR": None,
+    "transmission": None,
+    "transmissionColor": None,
+    "specularIOR": "ior",
+    # -opacity is a single float, the red channel of the transparency drives it
+    "opacity": None,
+    "opacityR": "opacity",
+    "opacityG": None,
+    "opacityB": None,
+    "emissionColor": "emissiveColor",
+    "subsurface": None,
+    "normalCamera": "normal"
+}
@@ -0,0 +1,160 @@
+"""
+Registry of the shader types legacy shaders can be converted to.
+
+Targets are registered by the module which describes them and only imported and
+compiled on first use, so registering a target doesn't cost anything on plugin startup.
+The modules live in the targetTypes package, a target module provides:
+    NODE_TYPE ([String]): Node type of the destination shader.
+    PREFIX ([String]): Prefix for the names of newly created shaders.
+    RENAME ([Dict], optional): Destination attribute of the base maps to the attribute
+                               on this target, None drops the attribute.
+                               Child attributes are renamed with there parent.
+"""
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+import conversionPlan
+import mapLoader
+import static_lib
+
+####### Standard Library IMPORTS #######
+from collections import OrderedDict
+import importlib
+
+
+class Target(object):
+    """
+    Compiled conversion target.
+
+    Args:
+        nodeType ([String]): Node type of the destination shader.
+        prefix ([String]): Prefix for the names of newly created shaders.
+        rename ([Dict], optional): Destination attribute renames on top of the base maps. Defaults to None.
+    """
+    __slots__ = ("nodeType", "prefix", "nodeClass", "source", "maps", "relatives")
+
+    def __init__(self, nodeType, prefix, rename=None):
+        self.nodeType = nodeType
+        self.prefix = prefix
+        self.nodeClass = api2.MNodeClass(nodeType)
+
+        # -base maps the target is compiled from, reloaded maps compile it again
+        self.source = static_lib.LEGALTYPES_MAPS
+
+        rename = rename or {}
+        try:
+            self.maps = {typ: self._compile_map(m, rename)
+                         for typ, m in static_lib.LEGALTYPES_MAPS.items()}
+        except RuntimeError:
+            raise RuntimeError(
+                "Node type %s is unknown, is its plugin loaded?" % nodeType)
+
+        # -indexed on the base maps, so a parent dropped by the renames still
+        #   relates to the children which are mapped on there own
+        self.relatives = {}
+        for typ, m in self.maps.items():
+            relatives = mapLoader.compile_relatives(static_lib.LEGALTYPES_MAPS[typ])
+            self.relatives[typ] = {attr: relatives[attr] for attr in m}
+
+    @classmethod
+    def from_module(cls, module):
+        return cls(module.NODE_TYPE, module.PREFIX, getattr(module, "RENAME", None))
+
+    def _compile_map(self, m, rename):
+        """
+        Rename the destination attributes of a base map and drop the ones
+        which don't exist on the node type.
+
+        Args:
+            m ([Dict]): Base map populated with child attributes.
+            rename ([Dict]): Destination attribute renames.
+
+        Returns:
+            [Dict]: The map of this target.
+        """
+        compiled = {}
+        for attr, newAttr in m.items():
+            if newAttr in rename:
+                newAttr = rename[newAttr]
+            elif newAttr[-1] in "RGBXYZ" and newAttr[:-1] in rename:
+                parent = rename[newAttr[:-1]]
+                newAttr = parent + newAttr[-1] if parent else None
+
+            if newAttr and self.nodeClass.hasAttribute(newAttr):
+                compiled[attr] = newAttr
+
+        return compiled
+
+    def get_map(self, srcType):
+        return self.maps[srcType]
+
+    def get_relatives(self, srcType):
+        return self.relatives[srcType]
+
+
+def register_target(name, module):
+    """
+    Register a conversion target without importing it.
+    Registering a name again replaces the target, the templates of the old one are dropped.
+
+    Args:
+        name ([String]): Name the target is looked up by, the convTo value.
+        module ([String]): Module describing the target, relative to the targetTypes package
+                           if it starts with a dot.
+    """
+    _REGISTERED[name] = module
+    _COMPILED.pop(name, None)
+    conversionPlan.TEMPLATES.clear()
+
+
+def get_target(name):
+    """
+    Get the compiled conversion target, its module is imported on first use.
+    The target is compiled again if the maps were reloaded since.
+
+    Args:
+        name ([String]): Name the target was registered with.
+
+    Raises:
+        NotImplementedError: If no target is registered with this name.
+
+    Returns:
+        [Target]: The compiled target.
+    """
+    target = _COMPILED.get(name)
+    if target is not None and target.source is static_lib.LEGALTYPES_MAPS:
+        return target
+
+    module = _REGISTERED.get(name)
+    if module is None:
+        raise NotImplementedError(
+            "No conversion target registered for %s." % name)
+
+    target = _COMPILED[name] = Target.from_module(
+        importlib.import_module(module, _TYPES_PACKAGE))
+    return target
+
+
+def names():
+    """
+    Get the names of all registered targets, no target gets imported.
+
+    Returns:
+        [list]: Target names in registration order.
+    """
+    return list(_REGISTERED.keys())
+
+
+DEFAULT = "aiStandardSurface"
+
+# -package of the target modules, next to this module
+_TYPES_PACKAGE = __name__.rpartition(".")[0] + ".targetTypes"
+# -target name -> module, compiled targets are cached by name
+_REGISTERED = OrderedDict()
+_COMPILED = {}
+
+register_target("aiStandardSurface", ".arnold")
+register_target("standardSurface", ".standardSurface")
+register_target("RedshiftMaterial", ".redshift")
+register_target("usdPreviewSurface", ".usdPreview")
@@ -0,0 +1,256 @@
+############# MAYA IMPORTS #############
+from maya.api import OpenMaya as api2
+
+############ CUSTOM IMPORTS ############
+import sceneUtils
+
+####### Standard Library IMPORTS #######
+from multiprocessing.pool import ThreadPool
+import threading
+import fnmatch
+import glob
+import re
+import os
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+
+class TextureRecord(object):
+    """
+    Plain snapshot of a file texture node.
+    The rules only read its strings, so it can be analysed outside of the main thread
+    without touching the Maya API.
+
+    Args:
+        handle ([MObjectHandle]): Handle of the file node, only used on the main thread.
+        name ([String]): Name of the file node.
+        path ([String]): Its fileTextureName.
+        colorSpace ([String]): Its colorSpace.
+    """
+    __slots__ = ("handle", "name", "path", "colorSpace")
+
+    def __init__(self, handle, name, path, colorSpace):
+        self.handle = handle
+        self.name = name
+        self.path = path
+        self.colorSpace = colorSpace
+
+
+def snapshot(selection=None):
+    """
+    Read the file texture nodes of the scene or selection, must be called on the main thread.
+    Only file nodes are visited, the iterators are filtered by kFileTexture.
+
+    Args:
+        selection ([MSelectionList], optional): Nodes which should be read. Defaults to None and reads the whole scene.
+
+    Returns:
+        [list]: TextureRecord of every file node.
+    """
+    records = []
+    mfn = api2.MFnDependencyNode()
+    for mobj in sceneUtils.iter_fileTextures(selection):
+        mfn.setObject(mobj)
+        records.append(TextureRecord(api2.MObjectHandle(mobj), mfn.name(),
+                                     mfn.findPlug("fileTextureName", False).asString(),
+                                     mfn.findPlug("colorSpace", False).asString()))
+
+    return records
+
+
+# ----------------------------------Rules---------------------------------- #
+# -rules take a TextureRecord and return the reason why it's flagged or None,
+#   they run in the worker threads so they must not touch the Maya API
+
+
+def colorspace_rule(check):
+    """
+    Flag textures whose colorspace doesn't contain the check word.
+
+    Args:
+        check ([String]): Word the colorspace should contain, eg. ACES.
+    """
+    def rule(record):
+        if check not in record.colorSpace:
+            return "colorspace: %s" % record.colorSpace
+        return None
+    return rule
+
+
+def pattern_rule(patterns):
+    """
+    Flag textures whose file name matches a pattern but not its expected colorspace.
+
+    Args:
+        patterns ([iterable]): (file name glob, word the colorspace should contain) pairs, case insensitive.
+    """
+    compiled = tuple((re.compile(fnmatch.translate(p.lower())), cs)
+                     for p, cs in patterns)
+
+    def rule(record):
+        fileName = os.path.basename(record.path).lower()
+        for regex, cs in compiled:
+            if regex.match(fileName) and cs not in record.colorSpace:
+                return "expects %s colorspace" % cs
+        return None
+    return rule
+
+
+def missing_rule(record):
+    """
+    Flag textures whose file doesn't exist, tokens like <UDIM> match any tile.
+    """
+    if not record.path:
+        return "no file"
+
+    path = _TOKEN.sub("*", record.path)
+    if path != record.path:
+        exists = bool(glob.glob(path))
+    else:
+        exists = os.path.exists(path)
+
+    return None if exists else "missing file"
+
+
+def default_rules(check):
+    return (colorspace_rule(check), pattern_rule(DATA_PATTERNS), missing_rule)
+
+
+# ----------------------------------Audit---------------------------------- #
+
+
+class TextureAudit(object):
+    """
+    Runs the rules over a snapshot in a thread pool.
+    Flagged textures are collected in a queue, poll it from the main thread
+    to receive them while the audit is still running.
+
+    Args:
+        records ([list]): TextureRecords as given by snapshot.
+        rules ([iterable]): Rules which should be checked.
+        workers ([int], optional): Threads of the pool. Defaults to WORKERS.
+        chunkSize ([int], optional): Records per task. Defaults to CHUNK_SIZE.
+    """
+
+    def __init__(self, records, rules, workers=None, chunkSize=None):
+        self.records = records
+        self.rules = tuple(rules)
+        self.workers = workers or WORKERS
+        self.chunkSize = chunkSize or CHUNK_SIZE
+
+        self._results = queue.Queue()
+        self._cancelled = threading.Event()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def done(self):
+        return self._pending == 0
+
+    def start(self):
+        """
+        Hand the records to the pool in chunks.
+
+        Returns:
+            [TextureAudit]: This audit.
+        """
+        chunks = [self.records[i:i + self.chunkSize]
+                  for i in range(0, len(self.records), self.chunkSize)]
+        self._pending = len(chunks)
+        if not chunks:
+            return self
+
+        self._pool = ThreadPool(min(self.workers, len(chunks)))
+        for chunk in chunks:
+            self._pool.apply_async(self._check, (chunk,),
+                                   callback=self._finished)
+        self._pool.close()
+        return self
+
+    def poll(self):
+        """
+        Get the flagged textures found since the last poll, doesn't block.
+        The pool is joined by the first poll after every chunk finished.
+
+        Returns:
+            [list]: (TextureRecord, reasons) of every flagged texture.
+        """
+        # -results are queued before a chunk counts as finished, so none are missed after done
+        done = self.done
+
+        results = []
+        while True:
+            try:
+                results.extend(self._results.get_nowait())
+            except queue.Empty:
+                break
+
+        if done and self._pool is not None:
+            # -every task finished, the workers only have to exit
+            self._pool.join()
+            self._pool = None
+        return results
+
+    def wait(self):
+        """
+        Block until the audit is done.
+
+        Returns:
+            [list]: (TextureRecord, reasons) of every flagged texture which wasn't polled yet.
+        """
+        if self._pool is not None:
+            self._pool.join()
+        return self.poll()
+
+    def cancel(self):
+        """
+        Stop the audit without blocking, running chunks stop before their next record
+        and the ones left return right away. The pool is already closed by start,
+        keep polling until the audit is done so it gets joined.
+        """
+        self._cancelled.set()
+
+    def _check(self, chunk):
+        flagged = []
+        for record in chunk:
+            if self._cancelled.is_set():
+                break
+
+            # -the pool drops the callback of a failed task, so a failing rule
+            #   is reported instead of raising and stalling the audit
+            reasons = []
+            for rule in self.rules:
+                try:
+                    reason = rule(record)
+                except Exception as e:
+                    reason = "rule failed: %s" % e
+                if reason:
+                    reasons.append(reason)
+
+            if reasons:
+                flagged.append((record, reasons))
+        return flagged
+
+    def _finished(self, flagged):
+        if flagged and not self._cancelled.is_set():
+            self._results.put(flagged)
+
+        with self._lock:
+            self._pending = max(self._pending - 1, 0)
+
+
+# -tokens maya resolves per tile or frame, eg. <UDIM>, <f>, <u>_<v>
+_TOKEN = re.compile(r"<[^>]+>")
+# -data textures which shouldn't be color managed
+DATA_PATTERNS = (("*_nrm*", "Raw"), ("*_normal*", "Raw"),
+                 ("*_rough*", "Raw"), ("*_disp*", "Raw"),
+                 ("*_bump*", "Raw"), ("*_mask*", "Raw"))
+WORKERS = 4
+CHUNK_SIZE = 256
@@ -7,15 +7,27 @@ from PySide2 import QtCore, QtWidgets
 # -import mayapyUtils from namespace and the rest from the package
 from mayapyUtils.basicMayaIO import MIO_BasicIO as MIO
 from mayapyUtils import mahelper
-from mayapyUtils import customTypes
 from scripts import baseClasses
+from scripts import conversionJob
+from scripts import conversionPlan
+from scripts import instrument
+from scripts import nodeRegistry
+from scripts import profiling
+from scripts import sceneUtils
+from scripts import searchIndex
 from scripts import static_lib
+from scripts import targets
+from scripts import textureAudit
 
 ############# Ui IMPORTS ###############
 from ui.shaderHelper_ui import Ui_ShaderHelper
 
 ####### Standard Library IMPORTS #######
-from functools import partial
+from collections import OrderedDict
+from functools import partial, wraps
+import cProfile
+import hashlib
+import time
 
 
 class ShaderHelper(object):
@@ -27,92 +39,213 @@ class ShaderHelper(object):
 
     # ----------------------------------Selection---------------------------------- #
 
-    def get_nonACESTextureNodes(self):
+    def get_nonACESTextureNodes(self, selection=None):
         """
         Go over entire scene and look for fileTexture nodes.
         Get the colorspace and check if it doesn't contain the check-word.
         If yes, return it.
 
         Checks for "ACES" if OCIO-Config isn't enabled and "Utility" if it is.
+        Blocks until the audit is done, use audit_nonACESTextures to receive the nodes while it runs.
+
+        Args:
+            selection ([MSelectionList], optional): Nodes which should be checked. Defaults to None and checks all Nodes.
 
         Returns:
             [MSelectionList]: All found nodes or empty if none can be found.
         """
-        config = cmds.colorManagementPrefs(q=True, cmConfigFileEnabled=True)
-        check = "Utility" if config else "ACES"
-        nodes = MIO.get_selectionIter()
+        flagged = self.audit_nonACESTextures(selection).wait()
+        return sceneUtils.get_selectionList(record.handle for record, _ in flagged)
 
-        sel = api2.MSelectionList()
+    def audit_nonACESTextures(self, selection=None):
+        """
+        Start an audit for file textures which aren't in an ACES colorspace.
 
-        for n in nodes:
-            node = baseClasses.BaseNode(n.getDependNode())
+        Args:
+            selection ([MSelectionList], optional): Nodes which should be checked. Defaults to None and checks all Nodes.
 
-            if self._fileTexture_check(mobj=node.mobject):
-                space = MIO.get_colorSpace(node.mobject, node.nodeMfn)
+        Returns:
+            [TextureAudit]: The running audit.
+        """
+        rules = (textureAudit.colorspace_rule(self._colorspace_checkWord()),)
+        return self.audit_textures(selection, rules=rules)
 
-                if check not in space:
-                    sel.add(node.mobject)
+    def audit_textures(self, selection=None, rules=None):
+        """
+        Start an audit of the file textures.
+        The nodes are read on the main thread, the rules are checked in a thread pool.
 
-        return sel
+        Args:
+            selection ([MSelectionList], optional): Nodes which should be checked. Defaults to None and checks all Nodes.
+            rules ([iterable], optional): Rules which should be checked.
+                                          Defaults to the colorspace, file name pattern and missing file rules.
+
+        Returns:
+            [TextureAudit]: The running audit.
+        """
+        if rules is None:
+            rules = textureAudit.default_rules(self._colorspace_checkWord())
+
+        records = textureAudit.snapshot(selection)
+        return textureAudit.TextureAudit(records, rules).start()
 
     # ----------------------------------Conversion---------------------------------- #
 
-    def convert_all(self, force=False):
+    def convert_all(self, force=False, dedupe=False):
         """
         Convert all legal shaders by creating new shaders for every convertable.
+        Blocks until all are converted in a single batch, use stream_convertAll to convert them in chunks.
+
+        Args:
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+            dedupe (bool, optional): Determine if identical shaders should share one new shader. Defaults to False.
+        """
+        job = self.stream_convertAll(force=force, dedupe=dedupe)
+        if job is not None:
+            job.run()
+
+    def stream_convertAll(self, force=False, dedupe=False, chunkSize=None):
+        """
+        Get a job which converts all legal shaders in chunks by creating new shaders for every convertable.
 
         Args:
-            force (bool, optional): [description]. Defaults to False.
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+            dedupe (bool, optional): Determine if identical shaders should share one new shader. Defaults to False.
+            chunkSize ([int], optional): Shaders per chunk. Defaults to None, which converts all in one chunk.
+
+        Returns:
+            [ConversionJob, None]: The job, nothing is converted before it's stepped or run.
+                                   None if there is nothing to convert.
         """
         partialCheck = partial(self._legalType_check, isDefault=True)
         names = MIO.get_names(check=partialCheck)
 
         if not names:
             api2.MGlobal.displayError("No supported shaders selected.")
-            return
+            return None
 
-        src_dest = self._create_new(names)
-        self.convert_shaders(src_dest, force=force)
+        return self._new_job(names, force=force, dedupe=dedupe, chunkSize=chunkSize)
 
-    def convert_selection(self, force=False, new=True):
+    def convert_selection(self, force=False, new=True, dedupe=False):
         """
         Convert the current selection, 
         either by creating new shaders for every convertable shader or 
         by suppling shaders in the selection to which they should be converted.
+        Blocks until all are converted in a single batch, use stream_convertSelection to convert them in chunks.
+
+        Args:
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+            new (bool, optional): Determine if new shaders should be created. Defaults to True.
+            dedupe (bool, optional): Determine if identical shaders should share one new shader,
+                                     only used with new. Defaults to False.
+
+        """
+        job = self.stream_convertSelection(force=force, new=new, dedupe=dedupe)
+        if job is not None:
+            job.run()
+
+    def stream_convertSelection(self, force=False, new=True, dedupe=False, chunkSize=None):
+        """
+        Get a job which converts the current selection in chunks, like convert_selection.
 
         Args:
             force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
             new (bool, optional): Determine if new shaders should be created. Defaults to True.
+            dedupe (bool, optional): Determine if identical shaders should share one new shader,
+                                     only used with new. Defaults to False.
+            chunkSize ([int], optional): Shaders, or pairs if not new, per chunk.
+                                         Defaults to None, which converts all in one chunk.
 
+        Returns:
+            [ConversionJob, None]: The job, nothing is converted before it's stepped or run.
+                                   None if there is nothing to convert.
         """
-        # -check for legalTypes and aiStandardSurface if new is disables
+        # -check for legalTypes and conversion targets if new is disables
         check = self._legalType_check if new else partial(
-            self._legalType_check, ai=True)
+            self._legalType_check, target=True)
         names = MIO.get_names(MIO.get_selection(), check=check)
 
         if not names:
             api2.MGlobal.displayError("No supported shaders selected.")
-            return
+            return None
 
         if new:
-            src_dest = self._create_new(names)
-        else:
-            # -check that there are at least n*2 items in the list
-            if len(names) % 2 != 0:
-                api2.MGlobal.displayError(
-                    "Not enough Nodes given to convert properly.")
-                return
+            return self._new_job(names, force=force, dedupe=dedupe, chunkSize=chunkSize)
+
+        # -check that there are at least n*2 items in the list
+        if len(names) % 2 != 0:
+            api2.MGlobal.displayError(
+                "Not enough Nodes given to convert properly.")
+            return None
+
+        # -retrieve source, dest items by looping over the names and
+        #   grouping n'th item plus the next item. Skip the next iteration.
+        src_dest = tuple(((n, names[i+1])
+                          for i, n in enumerate(names) if not i % 2))
+
+        return conversionJob.ConversionJob(src_dest, partial(self._convert_pairs, force=force),
+                                           chunkSize=chunkSize, finished=self._select_destinations)
+
+    def plan_conversion(self, src_dest=None):
+        """
+        Evaluate a conversion without changing the scene.
+        Without src_dest every legal shader is planned against a new, not yet created,
+        shader like convert_all would create, named so it doesn't resolve to an existing node.
+
+        Args:
+            src_dest ([iterable], optional): List containing the source and destination shaders as strings.
+                                             Defaults to None.
+
+        Returns:
+            [ConversionPlan, None]: The plan of the conversion or None if nothing can be converted.
+        """
+        if src_dest is None:
+            partialCheck = partial(self._legalType_check, isDefault=True)
+            names = MIO.get_names(check=partialCheck)
+
+            prefix = targets.get_target(self.convTo).prefix
+            taken = set()
+            src_dest = []
+            for n in names:
+                dest = sceneUtils.unique_name(mahelper.prefix_name(n, prefix), taken)
+                taken.add(dest)
+                src_dest.append((n, dest))
+
+        if not src_dest:
+            api2.MGlobal.displayError("No supported shaders selected.")
+            return None
+
+        try:
+            result = cmds.nodeConvert(pair=[(src, dest) for src, dest in src_dest],
+                                      dryRun=True, destType=self.convTo)
+        except Exception as e:
+            api2.MGlobal.displayError(e.args[0].split("\n")[0])
+            return None
 
-            # -retrieve source, dest items by looping over the names and
-            #   grouping n'th item plus the next item. Skip the next iteration.
-            src_dest = tuple(((n, names[i+1])
-                              for i, n in enumerate(names) if not i % 2))
+        return conversionPlan.ConversionPlan.from_json(result)
 
-        self.convert_shaders(src_dest, force=force)
+    def apply_plan(self, plan, force=False):
+        """
+        Apply a plan made by plan_conversion in a single batch.
+        Destinations which didn't exist when it was planned are created first,
+        even if a node of that name was added in the meantime.
 
-    def convert_shaders(self, src_dest, force=False):
+        Args:
+            plan ([ConversionPlan]): The plan which should be applied.
+            force (bool, optional): Determines if source shaders should be deleted. Defaults to False.
+        """
+        for pair in plan:
+            if pair.create or not cmds.objExists(pair.dest):
+                pair.dest = self._create_shader(pair.dest, pair.destType)
+
+        src_dest = tuple(((pair.source, pair.dest) for pair in plan))
+        self.convert_shaders(src_dest, force=force, plan=plan)
+
+    @instrument.timed("convert_shaders")
+    def convert_shaders(self, src_dest, force=False, plan=None, select=True):
         """
         Convert the given shaders with the custom nodeConvert command.
+        All pairs are handed over in one call, so they are converted in a single batch.
 
         #INFO#
         Only impliments conversion to arnold surface shader for the time being.
@@ -123,16 +256,27 @@ class ShaderHelper(object):
                                    Sources are shaders which should be converted, 
                                    destinations are shaders to which it should be converted.
             force (bool, optional): Determines if source shaders should be deleted. Defaults to False.
+            plan ([ConversionPlan], optional): Apply this plan of the src_dest pairs 
+                                               instead of evaluating them. Defaults to None.
+            select (bool, optional): Determines if the destinations should be selected. Defaults to True.
+
+        Returns:
+            [Bool]: True if the shaders were converted.
         """
         try:
-            for src, dest in src_dest:
-                cmds.nodeConvert(src, dest)
+            if plan is not None:
+                cmds.nodeConvert(applyPlan=plan.to_json(),
+                                 verbose=self.verbose)
+            else:
+                cmds.nodeConvert(pair=[(src, dest) for src, dest in src_dest],
+                                 verbose=self.verbose)
         except Exception as e:
             # -split on first message and display
             if "\n" in e.message:
                 e.message = e.args[0].split("\n")[0]
 
             api2.MGlobal.displayError(e.message)
+            return False
         else:
             if force:
                 # - if True get all source nodes and delete them
@@ -151,12 +295,16 @@ class ShaderHelper(object):
                 statement = "".join(statements)
 
                 print("\n{0}").format(statement)
+                print("Node registry: {hits} hits, {misses} misses, {size}/{maxSize} cached.").format(
+                    **nodeRegistry.REGISTRY.stats())
 
-            sel = (dest for _, dest in src_dest)
-            MIO.multiSelect(sel)
+            if select:
+                self._select_destinations(src_dest)
+            return True
 
     # ----------------------------------Editing---------------------------------- #
 
+    @instrument.timed("renameFileNodesToFileNames")
     def renameFileNodesToFileNames(self, selection=None):
         """
         Rename FileTextureNodes to there corresponding FileTextureNames.
@@ -167,19 +315,9 @@ class ShaderHelper(object):
             selection ([MSelectionList], optional): An api2.MSelectionList which doesn't need to hold anything. 
                                                     Defaults to None and searches for all Nodes.
         """
-        # -get a MItSelectionList to iterate over the nodes
-        selection = MIO.get_selectionIter(selection)
-
-        for s in selection:
-            mobj = s.getDependNode()
-
-            # -if the selected node isn't a fileTexture
-            #   continue to the next iteration of the loop
-            if mobj.apiType() != 497:
-                continue
-
-            # TODO make BaseNode use String; get_names and do the rest with BaseNode
-            node = baseClasses.BaseNode(mobj)
+        # -only the fileTextures of the selection or scene are visited
+        for mobj in sceneUtils.iter_fileTextures(selection):
+            node = nodeRegistry.get_node(mobj)
             oldname = node.name
             newname = MIO.get_fileTextureName(mobj, node.nodeMfn)
 
@@ -188,6 +326,7 @@ class ShaderHelper(object):
             if self.verbose:
                 print("Renamed {} --> {}.").format(oldname, newname)
 
+    @instrument.timed("changeColorspace")
     def changeColorspace(self, colorspace, selection=None):
         """
         Change the colorspace of multiple nodes to the given colorspace.
@@ -197,18 +336,9 @@ class ShaderHelper(object):
             selection ([MSelectionList], optional): An api2.MSelectionList which doesn't need to hold anything. 
                                                     Defaults to None and searches for all Nodes.
         """
-        # -get a MItSelectionList to iterate over the nodes
-        selection = MIO.get_selectionIter(selection)
-
-        for s in selection:
-            mobj = s.getDependNode()
-
-            # -if the selected node isn't a fileTexture
-            #   continue to the next iteration of the loop
-            if mobj.apiType() != 497:
-                continue
-
-            node = baseClasses.BaseNode(mobj)
+        # -only the fileTextures of the selection or scene are visited
+        for mobj in sceneUtils.iter_fileTextures(selection):
+            node = nodeRegistry.get_node(mobj)
             csPlug = node.get_plugFrStr("colorSpace")
             oldColorspace = MIO.get_plugValue(csPlug)
 
@@ -222,65 +352,32 @@ class ShaderHelper(object):
                 print("Changed {0}: {1} --> {2}").format(
                     csPlug, oldColorspace, colorspace)
 
-    def replacePlace2DNodes(self, selection=None):
+    @instrument.timed("replacePlace2DNodes")
+    def replacePlace2DNodes(self, selection=None, byAttributes=True):
         """
         Replace duplicated place2DNodes with a single, existing place2DNode.
 
-        It searches for the first place2DNode in either the given selection or all existing nodes
-        and reconnects the connections from every other place2DNode to the first.
-        It deletes the leftover place2DNodes. 
+        The place2DNodes of either the given selection or all existing nodes are bucketed
+        by the signature of there placement attributes, every bucket collapses into its first node.
+        The outgoing connections of the other nodes are reconnected to it and they are deleted.
 
         Args:
             selection ([MSelectionList], optional): An api2.MSelectionList which doesn't need to hold anything. 
                                                     Defaults to None and searches for all Nodes.
+            byAttributes (bool, optional): Only merge place2DNodes with the same placement,
+                                           otherwise all collapse into the first. Defaults to True.
         """
-        # -get a MItSelectionList to iterate over the nodes
-        selection = MIO.get_selectionIter(selection)
-
-        # -collect all place2DNodes from the selection
-        placeNodes = customTypes.LinkedList()
-        for s in selection:
-            mobj = s.getDependNode()
-
-            if self._apiType_check(mobj=mobj, apiType=454):
-                placeNodes.append(baseClasses.BaseNode(mobj))
-
-        # -get the first place2DNode
-        first = placeNodes.pop(0)
-
-        # -get the connected filenodes from every other place2DNode
-        filenodes = customTypes.Array([MIO.get_mobj(node) for placer in placeNodes for node in placer.connectedNodes if self._fileTexture_check(
-            mobj=MIO.get_mobj(node))])
-
-        # -get the attribute plugs from the first place2DNode that are connected to a filenode
-        connectFromPlugs = customTypes.Array([
-            s for s, d in first.outgoingConnections for o in d if o.node().apiType() == 497])
-
-        # -get the attributes which need to be connected on the filenode
-        connectToAttrs = customTypes.Array([o.partialName(
-            useLongNames=True) for _, d in first.outgoingConnections for o in d if self._fileTexture_check(mobj=MIO.get_mobj(o.node()))])
-
-        # -get a list of lists containing all the plugs from every filenode
-        plugs = self._build_connection_plugs(filenodes, connectToAttrs)
-
-        # -zip every the first place2DNode plugs with every other filenodes plugs
-        # -build src-dest lists to be used with multiConnect
-        connections = customTypes.Array(
-            [zip(connectFromPlugs, p) for p in plugs])
+        # -the merge runs as one command, so it's a single undo step
+        names = MIO.get_names(selection) if selection is not None else []
+        if selection is not None and not names:
+            return
 
         try:
-            with mahelper.undo_chunk():
-                for conn in connections:
-                    MIO.multiConnect(conn, force=True)
-                    print("\n")
+            oldNodes = cmds.replacePlace2D(*names, mergeAll=not byAttributes,
+                                           verbose=self.verbose) or []
         except Exception as e:
             print(e)
         else:
-            # -get the name of every other place2DNode and delete them
-            oldNodes = customTypes.Array(
-                [placer.name for placer in placeNodes])
-            cmds.delete(*oldNodes)
-
             if self.verbose:
                 print("Deleted:")
                 for n in oldNodes:
@@ -288,6 +385,181 @@ class ShaderHelper(object):
 
     # ----------------------------------Helpers---------------------------------- #
 
+    def _new_job(self, names, force=False, dedupe=False, chunkSize=None):
+        """
+        Get a job which converts the given shaders to newly created shaders.
+        With dedupe only one shader per group of identical shaders is converted,
+        the shading groups of the duplicates are reassigned to its new shader.
+        The groups are built up front, so a group never spans two chunks.
+
+        Args:
+            names ([iterable]): List containing shader names.
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+            dedupe (bool, optional): Determine if identical shaders should share one new shader. Defaults to False.
+            chunkSize ([int], optional): Shaders, or groups with dedupe, per chunk. Defaults to None.
+
+        Returns:
+            [ConversionJob]: The job.
+        """
+        if not dedupe:
+            return conversionJob.ConversionJob(names, partial(self._convert_new, force=force),
+                                               chunkSize=chunkSize, finished=self._select_destinations)
+
+        groups = self._group_duplicates(names)
+        return conversionJob.ConversionJob(groups.values(), partial(self._convert_groups, force=force),
+                                           chunkSize=chunkSize, finished=self._select_destinations)
+
+    def _convert_new(self, names, force=False):
+        """
+        Convert a chunk of shaders to newly created shaders.
+        If the conversion fails the new shaders are deleted again, so the scene is left as it was.
+
+        Args:
+            names ([iterable]): List containing shader names.
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+
+        Returns:
+            [tuple, None]: The converted source and destination names, None if the conversion failed.
+        """
+        src_dest = self._create_new(names)
+        if not self.convert_shaders(src_dest, force=force, select=False):
+            cmds.delete(*[dest for _, dest in src_dest])
+            return None
+        return src_dest
+
+    def _convert_groups(self, groups, force=False):
+        """
+        Convert the first shader of every group of identical shaders
+        and reassign the shading groups of the others to its new shader.
+
+        Args:
+            groups ([iterable]): Lists of identical shader names, as grouped by _group_duplicates.
+            force (bool, optional): Determine if source nodes should be deleted. Defaults to False.
+
+        Returns:
+            [tuple, None]: The converted source and destination names, None if the conversion failed.
+        """
+        src_dest = self._convert_new([g[0] for g in groups], force=force)
+        if src_dest is None:
+            return None
+
+        for group, (rep, dest) in zip(groups, src_dest):
+            self._reassign_shadingGroups(group[1:], rep, dest)
+
+        duplicates = [n for g in groups for n in g[1:]]
+        if force:
+            force = [n for n in duplicates if n not in static_lib.NON_DELETEABLES]
+            if force:
+                cmds.delete(*force)
+
+        if self.verbose:
+            print("Deduplicated {0} shaders into {1} new shaders.").format(
+                len(duplicates) + len(groups), len(groups))
+        return src_dest
+
+    def _convert_pairs(self, src_dest, force=False):
+        """
+        Convert a chunk of source, destination pairs.
+
+        Returns:
+            [list, None]: The given pairs, None if the conversion failed.
+        """
+        if not self.convert_shaders(src_dest, force=force, select=False):
+            return None
+        return src_dest
+
+    @staticmethod
+    def _select_destinations(src_dest):
+        """
+        Select the destinations of the converted pairs.
+        They are only known by name, each is added once and the whole list applied in one call.
+        """
+        sel = api2.MSelectionList()
+        for _, dest in src_dest:
+            try:
+                sel.add(dest)
+            except RuntimeError:
+                # -chunks can be undone while the conversion is still running
+                continue
+        api2.MGlobal.setActiveSelectionList(sel)
+
+    @instrument.timed("group duplicates")
+    def _group_duplicates(self, names):
+        """
+        Group the given shaders by a hash of there type, mapped attribute values and upstream connections.
+
+        Args:
+            names ([iterable]): List containing shader names.
+
+        Returns:
+            [OrderedDict]: First shader of every group to all shaders of the group, including itself.
+        """
+        groups = OrderedDict()
+        for name in names:
+            groups.setdefault(self._shader_signature(name), []).append(name)
+
+        return OrderedDict((g[0], g) for g in groups.values())
+
+    def _shader_signature(self, name):
+        """
+        Build the content hash of a legacy shader.
+        Shaders with the same type, mapped attribute values and upstream connections share a hash,
+        the attributes are mapped to the current conversion target.
+
+        Args:
+            name ([String]): Name of the shader.
+
+        Returns:
+            [String]: The hash of the shader.
+        """
+        node = nodeRegistry.get_node(name)
+
+        # -connected attributes are covered by the upstream connections,
+        #   reading them would only trigger an evaluation of the upstream nodes
+        connected = set(destPlug.partialName(useLongNames=True)
+                        for _, destPlug in node.incomingConnections)
+        relatives = node.get_relatives(self.convTo)
+
+        values = tuple(sorted((attr, MIO.get_plugValue(node.get_plugFrStr(attr)))
+                              for attr in node.get_map(self.convTo) if connected.isdisjoint(relatives[attr])))
+        upstream = tuple(sorted((destPlug.partialName(useLongNames=True),
+                                 tuple(sorted(p.partialName(includeNodeName=True, useLongNames=True)
+                                              for p in srcPlugs)))
+                                for srcPlugs, destPlug in node.incomingConnections))
+
+        return hashlib.md5(repr((str(node.type), values, upstream)).encode("utf-8")).hexdigest()
+
+    def _reassign_shadingGroups(self, duplicates, rep, dest):
+        """
+        Connect the converted shader of a representative to the shading groups of its duplicates.
+
+        Args:
+            duplicates ([iterable]): Names of the duplicated shaders.
+            rep ([String]): Name of the converted representative.
+            dest ([String]): Name of the new shader of the representative.
+        """
+        for dup in duplicates:
+            node = nodeRegistry.get_node(dup)
+
+            for srcPlug, destPlugs in node.outgoingConnections:
+                sgPlugs = [p for p in destPlugs
+                           if p.node().apiType() == api2.MFn.kShadingEngine]
+                if not sgPlugs:
+                    continue
+
+                newAttr = baseClasses.get_corrospondingAttrName(
+                    node, srcPlug.partialName(useLongNames=True), self.convTo)
+                if not newAttr:
+                    continue
+
+                for p in sgPlugs:
+                    cmds.connectAttr("%s.%s" % (dest, newAttr),
+                                     p.partialName(includeNodeName=True, useLongNames=True), force=True)
+
+            if self.verbose:
+                print("Reassigned {0} --> {1} (duplicate of {2}).").format(dup, dest, rep)
+
+    @instrument.timed("create shaders")
     def _create_new(self, names):
         """
         Create a new shader for every given node and name them appropriately.
@@ -298,31 +570,24 @@ class ShaderHelper(object):
         Returns:
             [tuple]: List containing a list of source and destination names.
         """
-        prefix = static_lib.CONVERT_TO[self.convTo]
-        src_dest = tuple(((n, MIO.create_node(mahelper.prefix_name(n, prefix), shading=True, string=True))
+        prefix = targets.get_target(self.convTo).prefix
+        src_dest = tuple(((n, self._create_shader(mahelper.prefix_name(n, prefix)))
                           for n in names))
         return src_dest
 
-    @staticmethod
-    def _build_connection_plugs(nodes, attrs):
+    def _create_shader(self, name, nodeType=None):
         """
-        Build an array containing all the connected plugs on the given nodes.
+        Create a shader of the node type of a conversion target.
 
         Args:
-            nodes ([iterable]): Traversable sequence containing the nodes from which
-                                the connections should be retrieved.
-            attrs ([iterable]): Traversable sequence containing all the connected attributes.
+            name ([String]): Name of the new shader.
+            nodeType ([String], optional): Conversion target. Defaults to the current convTo.
 
         Returns:
-            [Array]: Custom Array containing all the connected plugs.
+            [String]: Name of the created shader.
         """
-        plugs = customTypes.Array(len(nodes))
-        for i, n in enumerate(nodes):
-            mfn = api2.MFnDependencyNode(n)
-            plugs[i] = customTypes.Array(
-                (MIO.get_plug(n, mfn, attr) for attr in attrs))
-
-        return plugs
+        target = targets.get_target(nodeType or self.convTo)
+        return cmds.shadingNode(target.nodeType, asShader=True, name=name)
 
     @staticmethod
     def _legalType_check(**kwargs):
@@ -338,13 +603,25 @@ class ShaderHelper(object):
             [Bool]: Status if it can be converted.
         """
         mfn = kwargs["mfn"]
-        ai = "aiStandardSurface" if kwargs.get("ai") else None
-        if mfn.typeName in static_lib.LEGALTYPES or mfn.typeName == ai:
+        target = kwargs.get("target") and mfn.typeName in targets.names()
+        if mfn.typeName in static_lib.LEGALTYPES or target:
             if kwargs.get("isDefault", None):
                 return bool(mfn.name() not in static_lib.NON_DELETEABLES)
             return True
         return False
 
+    @staticmethod
+    def _colorspace_checkWord():
+        """
+        Get the word a colorspace of a managed texture contains,
+        "ACES" if OCIO-Config isn't enabled and "Utility" if it is.
+
+        Returns:
+            [String]: The check-word.
+        """
+        config = cmds.colorManagementPrefs(q=True, cmConfigFileEnabled=True)
+        return "Utility" if config else "ACES"
+
     @staticmethod
     def _fileTexture_check(**kwargs):
         """
@@ -382,6 +659,36 @@ class ShaderHelper(object):
         return False
 
 
+def _profiled(operation):
+    """
+    Decorator for the slots of the ShaderHelper_app.
+    If "Profile Next Operation" is checked the call is profiled, the action is unchecked again
+    and the profile is saved and its hot functions shown.
+    If the slot started a conversion its chunks are profiled too and the profile is shown once it stops.
+
+    Args:
+        operation ([String]): Name of the operation, used in the file names.
+    """
+    def decorator(slot):
+        @wraps(slot)
+        def wrapper(self, *args, **kwargs):
+            if not self.profile_next.isChecked():
+                return slot(self, *args, **kwargs)
+
+            self.profile_next.setChecked(False)
+            running = self.conversion
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(slot, self, *args, **kwargs)
+            finally:
+                if self.conversion is not None and self.conversion is not running:
+                    self.conversion_profile = (operation, profile)
+                else:
+                    self.report_profile(profiling.Report(operation, profile))
+        return wrapper
+    return decorator
+
+
 class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
 
     UI_NAME = "ShaderHelper"
@@ -436,6 +743,10 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
             self.cmConfigChanged, "colorMgtConfigChanged")
 
         self.logic = ShaderHelper()
+        self.audit = None
+        self.cancelled_audits = []
+        self.conversion = None
+        self.conversion_profile = None
         self.setupUi(self)
         self.setupControlls()
         self.setupConnections()
@@ -444,11 +755,15 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
 
     def __del__(self):
         MIO.deregisterCallback(self.cmConfigChanged_callback)
+        self.stop_audit()
+        self.stop_conversion()
 
     def setupControlls(self, asSlot=False):
         # -controls which need to be updated if any function is called
         self.logic.convTo = self.convTo_comboBox.currentText()
         self.logic.verbose = self.activate_verbosity.isChecked()
+        # -verbose mode also records the per-phase timings of the convert and edit paths
+        instrument.INSTRUMENT.enabled = self.logic.verbose
 
         colorspace = self.changeColorSpace_radioBTN.isChecked()
         self.colorSpace_comboBox.setEnabled(colorspace)
@@ -456,11 +771,30 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         if asSlot:
             return
 
-        self.selection_model = QtCore.QStringListModel([])
+        # -results are kept as node handles, names are only resolved for the shown rows
+        self.selection_model = baseClasses.HandleListModel(
+            self, batch=SEARCH_CHUNK)
         self.selection_listView.setModel(self.selection_model)
         self.selection_listView.setSelectionMode(
             QtWidgets.QAbstractItemView.ExtendedSelection)
 
+        # -filter and sort the shown results without searching again
+        self.results_layout = QtWidgets.QHBoxLayout()
+        self.results_layout.setObjectName("results_layout")
+        self.filter_lineEdit = QtWidgets.QLineEdit(self.t1_selection)
+        self.filter_lineEdit.setObjectName("filter_lineEdit")
+        self.filter_lineEdit.setPlaceholderText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Filter results", None, -1))
+        self.results_layout.addWidget(self.filter_lineEdit)
+        self.sort_checkBox = QtWidgets.QCheckBox(self.t1_selection)
+        self.sort_checkBox.setObjectName("sort_checkBox")
+        self.sort_checkBox.setText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Sort", None, -1))
+        self.sort_checkBox.setToolTip(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Sort the results by name.", None, -1))
+        self.results_layout.addWidget(self.sort_checkBox)
+        self.t1_gridLayout.addLayout(self.results_layout, 7, 0, 1, 1)
+
         # -initialize colorspace comboBox
         self.cmConfigChanged()
 
@@ -477,23 +811,99 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         self.search_lineEdit.setToolTip(QtWidgets.QApplication.translate(
             "ShaderHelper", "Keywords seperated by comma.", None, -1))
 
+        self.searchAction_comboBox.addItem(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Texture Audit", None, -1))
+
+        # -debounces the keyword search, every new input restarts it
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE)
+
+        self.search_latency = searchIndex.LatencyStats()
+
+        # -polls the running audit and streams its results into the listView
+        self.audit_timer = QtCore.QTimer(self)
+        self.audit_timer.setInterval(AUDIT_POLL_INTERVAL)
+
+        # -fill the conversion targets from the registry, without importing them
+        self.convTo_comboBox.clear()
+        self.convTo_comboBox.addItems(targets.names())
+        self.logic.convTo = self.convTo_comboBox.currentText()
+
+        self.dedupe_checkBox = QtWidgets.QCheckBox(self.t2_conversion)
+        self.dedupe_checkBox.setObjectName("dedupe_checkBox")
+        self.dedupe_checkBox.setMaximumSize(QtCore.QSize(75, 16777215))
+        self.t2_controls_gridLayout.addWidget(self.dedupe_checkBox, 2, 5, 1, 1)
+        self.dedupe_checkBox.setText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Dedupe", None, -1))
+        self.dedupe_checkBox.setToolTip(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Convert identical shaders only once and\nreassign the shading groups of the duplicates.", None, -1))
+
+        # -progress of the running conversion, only shown while it runs
+        self.conversion_progressBar = QtWidgets.QProgressBar(self.t2_conversion)
+        self.conversion_progressBar.setObjectName("conversion_progressBar")
+        self.conversion_progressBar.setVisible(False)
+        self.t2_controls_gridLayout.addWidget(
+            self.conversion_progressBar, 3, 0, 1, 5)
+        self.cancelConversion_BTN = QtWidgets.QPushButton(self.t2_conversion)
+        self.cancelConversion_BTN.setObjectName("cancelConversion_BTN")
+        self.cancelConversion_BTN.setVisible(False)
+        self.t2_controls_gridLayout.addWidget(
+            self.cancelConversion_BTN, 3, 5, 1, 1)
+        self.cancelConversion_BTN.setText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Cancel", None, -1))
+        self.cancelConversion_BTN.setToolTip(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Stop after the current chunk, converted chunks are kept.", None, -1))
+
+        # -converts the next chunk of the running conversion whenever maya is idle
+        self.conversion_timer = QtCore.QTimer(self)
+        self.conversion_timer.setInterval(CONVERT_INTERVAL)
+
+        # -per-phase timings of the last conversion or edit, recorded in verbose mode
+        self.show_phaseSummary = QtWidgets.QAction(self)
+        self.show_phaseSummary.setObjectName("show_phaseSummary")
+        self.show_phaseSummary.setText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Show Timings", None, -1))
+        self.options_menu.addAction(self.show_phaseSummary)
+        self.phase_summary = None
+
+        # -profiles the next conversion, edit or search, unchecks itself afterwards
+        self.profile_next = QtWidgets.QAction(self)
+        self.profile_next.setObjectName("profile_next")
+        self.profile_next.setCheckable(True)
+        self.profile_next.setText(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Profile Next Operation", None, -1))
+        self.profile_next.setToolTip(QtWidgets.QApplication.translate(
+            "ShaderHelper", "Save a profile of the next conversion, edit or search and show its hot functions.", None, -1))
+        self.options_menu.addAction(self.profile_next)
+        self.profile_report = None
+
     def setupConnections(self):
         # -----------TAB1 Selection------------ #
+        # -keyword searches are debounced, only return triggers them immediately
         self.searchBy_comboBox.currentIndexChanged.connect(
-            lambda: self.search_slot(state=None))
+            lambda: self.schedule_search())
 
         self.search_lineEdit.textChanged.connect(
-            lambda: self.search_slot(state=None))
+            lambda: self.schedule_search())
         self.search_lineEdit.returnPressed.connect(self.search_slot)
-        self.search_lineEdit.focusChange.connect(self.search_slot)
+        self.search_lineEdit.focusChange.connect(
+            lambda: self.schedule_search())
 
         self.searchSelection_checkBox.stateChanged.connect(
+            lambda: self.schedule_search())
+        self.search_timer.timeout.connect(
             lambda: self.search_slot(state=None))
 
         self.searchAction_comboBox.currentIndexChanged.connect(
             lambda: self.search_slot(state=True))
 
         self.selection_listView.clicked.connect(self.select_slot)
+        self.filter_lineEdit.textChanged.connect(self.selection_model.set_filter)
+        self.sort_checkBox.toggled.connect(
+            lambda state: self.selection_model.sort(0 if state else -1))
+
+        self.audit_timer.timeout.connect(self.audit_slot)
 
         # -----------TAB2 Conversion----------- #
         self.convTo_comboBox.currentTextChanged.connect(
@@ -501,6 +911,9 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         self.convertSelection_BTN.pressed.connect(
             lambda: self.convert_slot(False))
         self.convertAll_BTN.pressed.connect(lambda: self.convert_slot(True))
+        self.cancelConversion_BTN.pressed.connect(self.stop_conversion)
+
+        self.conversion_timer.timeout.connect(self.conversionStep_slot)
 
         # -----------TAB3 Editing-------------- #
         self.editSelection_BTN.pressed.connect(
@@ -513,27 +926,75 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         # -------------MENU Options------------ #
         self.activate_verbosity.triggered.connect(
             lambda: self.setupControlls(asSlot=True))
+        self.show_phaseSummary.triggered.connect(self.phaseSummary_slot)
 
     # ----------------------------------Connection Slots---------------------------------- #
 
+    @_profiled("search")
     def search_slot(self, state=None):
         """
         Manages the incoming search requests.
-        Gets the names from the selected searching Method and displays them in the listView.
+        Gets the nodes from the selected searching Method and displays them in the listView,
+        the listView fetches the rows in batches while it's scrolled.
         SwitchSelection does the actual work and checks the ui for current inputs.
 
         Args:
             state ([Bool], optional): Determines if a action or keyword-search is used. Defaults to None.
         """
+        start = time.time()
         selection = None
+        self.search_timer.stop()
+        self.stop_audit()
 
         if self.searchSelection_checkBox.isChecked():
             selection = MIO.get_selection()
 
-        sel = self.switchSelection(selection, state)
-        names = MIO.get_names(sel)
+        index = self.searchAction_comboBox.currentIndex()
+        if state and index in _audit_funcs:
+            self.search_lineEdit.clearFocus()
+            self.start_audit(_audit_funcs[index](self.logic, selection))
+            return
+
+        handles = self.switchSelection(selection, state)
+        self.selection_model.set_handles(handles)
+
+        latency = time.time() - start
+        self.search_latency.record(latency)
+
+        if self.logic.verbose:
+            print("Search: {0} results in {1:.2f}ms ({2} over {3} searches)").format(
+                len(handles), latency * 1000, self.search_latency.summary(), len(self.search_latency))
 
-        self.selection_model.setStringList(names)
+    def audit_slot(self):
+        """
+        Append the textures the running audit flagged since the last call to the listView.
+        """
+        # -cancelled audits are kept until they drained, polling them then joins there pools
+        for audit in [a for a in self.cancelled_audits if a.done]:
+            audit.poll()
+            self.cancelled_audits.remove(audit)
+
+        if self.audit is None:
+            if not self.cancelled_audits:
+                self.audit_timer.stop()
+            return
+
+        done = self.audit.done
+        flagged = self.audit.poll()
+
+        if flagged:
+            self.selection_model.append_handles(
+                [record.handle for record, _ in flagged])
+
+            if self.logic.verbose:
+                for record, reasons in flagged:
+                    print("{0}: {1}").format(record.name, ", ".join(reasons))
+
+        if done:
+            if self.logic.verbose:
+                print("Audited {0} textures, {1} flagged.").format(
+                    len(self.audit), len(self.selection_model))
+            self.stop_audit()
 
     def select_slot(self):
         """
@@ -541,27 +1002,53 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         """
         selInds = self.selection_listView.selectedIndexes()
 
-        sel = tuple((self.selection_model.data(i) for i in selInds))
-
-        MIO.multiSelect(sel)
+        # -select straight from the handles, the names aren't resolved again
+        sceneUtils.select(self.selection_model.handles(selInds))
 
+    @_profiled("convert")
     def convert_slot(self, mode):
         """
         Manages the conversion of nodes.
+        The shaders are converted in chunks of CONVERT_CHUNK while maya is idle,
+        every chunk undoes as a unit.
 
         Args:
             mode ([Bool]): Determines which conversion mode is used. 
         """
         force = self.force_checkBox.isChecked()
+        dedupe = self.dedupe_checkBox.isChecked()
+        self.stop_conversion()
+        instrument.INSTRUMENT.reset()
 
         if mode:
-            with mahelper.undo_chunk():
-                self.logic.convert_all(force=force)
+            job = self.logic.stream_convertAll(
+                force=force, dedupe=dedupe, chunkSize=CONVERT_CHUNK)
         else:
             new = self.convNew_radioBTN.isChecked()
-            with mahelper.undo_chunk():
-                self.logic.convert_selection(force=force, new=new)
+            job = self.logic.stream_convertSelection(
+                force=force, new=new, dedupe=dedupe, chunkSize=CONVERT_CHUNK)
+
+        if job is not None:
+            self.start_conversion(job)
+
+    def conversionStep_slot(self):
+        """
+        Convert the next chunk of the running conversion and update the progress.
+        """
+        job = self.conversion
+        if job is None:
+            return
+
+        if self.conversion_profile is not None:
+            self.conversion_profile[1].runcall(job.step)
+        else:
+            job.step()
 
+        self.conversion_progressBar.setValue(job.position)
+        if job.done:
+            self.stop_conversion()
+
+    @_profiled("edit")
     def editing_slot(self, selection=False):
         """
         Manages the editing of nodes.
@@ -580,11 +1067,129 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
         if self.colorSpace_comboBox.isEnabled():
             kwargs["colorspace"] = self.colorSpace_comboBox.currentText()
 
+        instrument.INSTRUMENT.reset()
         with mahelper.undo_chunk():
             func(self.logic, **kwargs)
 
+        self.report_phases()
+
+    def phaseSummary_slot(self):
+        """
+        Show the panel with the per-phase timings of the last conversion or edit.
+        """
+        if self.phase_summary is None:
+            self.phase_summary = baseClasses.PhaseSummary(self)
+        self.phase_summary.refresh()
+        self.phase_summary.show()
+
     # ----------------------------------UI Logic---------------------------------- #
 
+    def schedule_search(self):
+        """
+        (Re)start the debounce of the keyword search.
+        """
+        self.search_timer.start()
+
+    def report_phases(self):
+        """
+        Print the per-phase timings of the last operation in verbose mode and refresh the open panel.
+        """
+        if not self.logic.verbose:
+            return
+
+        print("\n{0}").format(instrument.INSTRUMENT.summary())
+        if self.phase_summary is not None and self.phase_summary.isVisible():
+            self.phase_summary.refresh()
+
+    def report_profile(self, report):
+        """
+        Save the profile of an operation and show its hot functions.
+
+        Args:
+            report ([profiling.Report]): The profiled operation.
+        """
+        try:
+            report.save()
+        except (IOError, OSError) as e:
+            api2.MGlobal.displayError("Profile couldn't be saved: {0}".format(e))
+
+        print("\n{0}").format(report.summary())
+        if self.profile_report is None:
+            self.profile_report = baseClasses.ProfileReport(self)
+        self.profile_report.set_report(report)
+        self.profile_report.show()
+
+    def start_conversion(self, job):
+        """
+        Show the progress and convert the chunks of the job while maya is idle.
+
+        Args:
+            job ([ConversionJob]): The conversion which should run.
+        """
+        self.conversion = job
+        self.conversion_progressBar.setRange(0, len(job))
+        self.conversion_progressBar.setValue(0)
+        self.set_conversionControls(running=True)
+        self.conversion_timer.start()
+
+    def stop_conversion(self):
+        """
+        Stop and cancel the running conversion, if any. Converted chunks are kept.
+        """
+        self.conversion_timer.stop()
+        job = self.conversion
+        if job is None:
+            return
+
+        if not job.done:
+            job.cancel()
+        self.conversion = None
+        self.set_conversionControls(running=False)
+
+        if self.logic.verbose:
+            state = " (cancelled)" if job.cancelled else " (failed)" if job.failed else ""
+            print("Converted {0} of {1} in {2} chunks{3}.").format(
+                job.position, len(job), job.chunks, state)
+        self.report_phases()
+
+        if self.conversion_profile is not None:
+            operation, profile = self.conversion_profile
+            self.conversion_profile = None
+            self.report_profile(profiling.Report(operation, profile))
+
+    def set_conversionControls(self, running):
+        """
+        Swap the convert buttons for the progress and cancel button while a conversion runs.
+        """
+        self.convertAll_BTN.setEnabled(not running)
+        self.convertSelection_BTN.setEnabled(not running)
+        self.conversion_progressBar.setVisible(running)
+        self.cancelConversion_BTN.setVisible(running)
+
+    def start_audit(self, audit):
+        """
+        Clear the listView and stream the results of the audit into it.
+
+        Args:
+            audit ([TextureAudit]): The running audit.
+        """
+        self.selection_model.set_handles([])
+        self.audit = audit
+        self.audit_timer.start()
+
+    def stop_audit(self):
+        """
+        Cancel the running audit, if any.
+        Polling goes on until every cancelled audit drained.
+        """
+        if self.audit is not None and not self.audit.done:
+            self.audit.cancel()
+            self.cancelled_audits.append(self.audit)
+        self.audit = None
+
+        if not self.cancelled_audits:
+            self.audit_timer.stop()
+
     def switchSelection(self, selection, state):
         """
         Swtich between keyword-search or search action.
@@ -595,8 +1200,10 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
             state ([Bool]): True when searchAction is used, determines which widgets should be changed.
 
         Returns:
-            [type]: [description]
+            [list]: MObjectHandles of the found nodes.
         """
+        handles = []
+
         # -when keyword-search calls set the searchAction comboBox empty
         # -if signal isn't blocked when function gets called again and comboBox
         #   isn't turned blank
@@ -609,19 +1216,20 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
             self.search_lineEdit.clearFocus()
 
             index = self.searchAction_comboBox.currentIndex()
-            if index >= 0:
+            if index in _selection_funcs:
                 # -get the corrosponding function if the index is valid
-                sel = _selection_funcs[self.searchAction_comboBox.currentIndex()](
-                    self.logic)
+                sel = _selection_funcs[index](self.logic)
+                handles = sceneUtils.get_handles(sel)
         else:
             mode = self.searchBy_comboBox.currentIndex()
             text = self.search_lineEdit.text()
             keywords = tuple((key.strip() for key in text.split(",")))
 
-            sel = MIO.keywordSelection(
+            # -answered from the in-memory index, it's built on the first search
+            handles = searchIndex.INDEX.search_handles(
                 keywords, mode=mode, selection=selection)
 
-        return sel
+        return handles
 
     def cmConfigChanged(self, *_, **__):
         """
@@ -640,8 +1248,24 @@ class ShaderHelper_app(QtWidgets.QMainWindow, Ui_ShaderHelper):
 
 # ShaderHelper_app Switch-Case dictionaries
 # -private dictinaries, only used within the ShaderHelper_app class
-# -used to determine which selection action should be called
-_selection_funcs = {0: ShaderHelper.get_nonACESTextureNodes}
+# -used to determine which selection action should be called, keyed on the searchAction comboBox index
+# -the indexes of the audit actions are taken, they are checked first
+_selection_funcs = {}
+
+# -used to determine which selection action runs as an audit and streams its results
+_audit_funcs = {0: ShaderHelper.audit_nonACESTextures,
+                1: ShaderHelper.audit_textures}
+
+# -milliseconds between two polls of a running audit
+AUDIT_POLL_INTERVAL = 50
+# -shaders, or groups of identical shaders, converted per chunk
+CONVERT_CHUNK = 50
+# -milliseconds between two chunks of a running conversion, 0 runs them whenever maya is idle
+CONVERT_INTERVAL = 0
+# -milliseconds without input before a keyword search runs
+SEARCH_DEBOUNCE = 150
+# -search result rows the listView fetches at once
+SEARCH_CHUNK = 500
 
 # -used to determine which editing function should be called
 _editing_funcs = {"renamefiletextures": ShaderHelper.renameFileNodesToFileNames,
@@ -0,0 +1,33 @@
+"""
+Start the shaderHelper plug-in once per test run.
+
+Tests run headless against the in-memory stand-in of benchmarks/standin unless
+SHADERHELPER_STANDIN is set to 0, eg. when they are run with mayapy:
+    python -m unittest discover -s tests -t .
+"""
+####### Standard Library IMPORTS #######
+import os
+import sys
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+if BENCHMARKS not in sys.path:
+    sys.path.insert(0, BENCHMARKS)
+os.environ.setdefault("SHADERHELPER_STANDIN", "1")
+
+############ CUSTOM IMPORTS ############
+import _bootstrap
+
+_initialized = False
+
+
+def initialize():
+    """
+    Start the session and load the plug-in, without mtoa so the default target isn't available.
+    """
+    global _initialized
+    if not _initialized:
+        _bootstrap.initialize(plugins=())
+        _initialized = True
+
+
+new_scene = _bootstrap.new_scene
@@ -0,0 +1,9 @@
+"""
+standardSurface target which moves the base color onto the subsurface color, registered by the tests.
+"""
+NODE_TYPE = "standardSurface"
+PREFIX = "ss"
+
+RENAME = {
+    "baseColor": "subsurfaceColor"
+}
@@ -0,0 +1,72 @@
+"""
+Lazy connection information and related attributes of BaseNode.
+"""
+####### Standard Library IMPORTS #######
+import json
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class BaseNodeTest(unittest.TestCase):
+    """
+    A lambert converted to a standardSurface, with its color compound or one of its children connected.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.scripts import baseClasses
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.baseClasses = baseClasses
+        self.shader = cmds.shadingNode("lambert", asShader=True, name="matA")
+        self.file = _scene.build_fileTexture("fileA")[0]
+        cmds.shadingNode("standardSurface", asShader=True, name="ss_matA")
+
+    def values(self):
+        # -destination attributes of the values the plan sets
+        plan = json.loads(self.cmds.nodeConvert("matA", "ss_matA", dryRun=True))
+        return set(attr for attr, _ in plan["pairs"][0]["values"])
+
+    def test_relatives(self):
+        relatives = self.baseClasses.BaseNode("matA").get_relatives("standardSurface")
+        self.assertEqual(relatives["color"], frozenset(("color", "colorR", "colorG", "colorB")))
+        self.assertEqual(relatives["colorR"], frozenset(("colorR", "color")))
+
+    def test_parent_connected(self):
+        self.assertTrue(set(("baseColor", "baseColorR", "baseColorG", "baseColorB")) <= self.values())
+
+        self.cmds.connectAttr("%s.outColor" % self.file, "matA.color")
+        values = self.values()
+        self.assertTrue(values.isdisjoint(("baseColor", "baseColorR", "baseColorG", "baseColorB")))
+        self.assertIn("base", values)
+
+    def test_child_connected(self):
+        self.cmds.connectAttr("%s.outAlpha" % self.file, "matA.colorR")
+        values = self.values()
+        self.assertTrue(values.isdisjoint(("baseColor", "baseColorR")))
+        self.assertTrue(set(("baseColorG", "baseColorB")) <= values)
+
+    def test_invalidate(self):
+        node = self.baseClasses.BaseNode("matA")
+        self.assertEqual(node.incomingConnections, [])
+        self.assertEqual(node.connectedNodes, set())
+
+        self.cmds.connectAttr("%s.outColor" % self.file, "matA.color")
+        # -cached until invalidated
+        self.assertEqual(node.connectedNodes, set())
+
+        node.invalidate()
+        self.assertEqual([d.partialName(useLongNames=True) for _, d in node.incomingConnections], ["color"])
+        self.assertEqual(node.connectedNodes, set((self.file,)))
+
+
+if __name__ == "__main__":
+    unittest.main()
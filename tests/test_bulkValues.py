@@ -0,0 +1,60 @@
+"""
+Writing mapped attribute values through bulkValues.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class CompoundWriteTest(unittest.TestCase):
+    """
+    A scalar mapped onto a compound attribute is set on every child,
+    eg. the float cutout_opacity of a mia_material_x onto the color opacity.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import bulkValues
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+        self.bulkValues = bulkValues
+        self.dest = cmds.shadingNode("standardSurface", asShader=True, name="dest")
+
+    def plug(self, name):
+        return self.api2.MSelectionList().add(name).getPlug(0)
+
+    def assertOpacity(self, value):
+        for c in "RGB":
+            self.assertAlmostEqual(self.cmds.getAttr("dest.opacity%s" % c), value)
+
+    def test_writer(self):
+        modi = self.api2.MDGModifier()
+        self.bulkValues.write_values(modi, {"opacity": [(self.plug("dest.opacity"), 0.25)]})
+        modi.doIt()
+        self.assertOpacity(0.25)
+
+    def test_fallback(self):
+        modi = self.api2.MDGModifier()
+        self.bulkValues._newPlugValue(modi, self.plug("dest.opacity"), 0.5)
+        modi.doIt()
+        self.assertOpacity(0.5)
+
+    def test_convert(self):
+        src = self.cmds.shadingNode("mia_material_x", asShader=True, name="mia")
+        self.cmds.setAttr("%s.cutout_opacity" % src, 0.75)
+
+        self.cmds.nodeConvert(src, self.dest)
+        self.assertOpacity(0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
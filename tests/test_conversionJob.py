@@ -0,0 +1,109 @@
+"""
+Chunked conversion jobs, every chunk is its own undo chunk.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class ConversionJobTest(unittest.TestCase):
+    """
+    Drive the job step by step, like the timer of the UI does.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.scripts import conversionJob
+
+        _standin.new_scene()
+        cmds.undoInfo(flush=True)
+        self.cmds = cmds
+        self.conversionJob = conversionJob
+        self.finished = []
+        self.fail = None
+
+    def convert(self, chunk):
+        if self.fail in chunk:
+            if self.fail == "raise":
+                raise RuntimeError("failed chunk")
+            return None
+        return [(item, self.cmds.createNode("standardSurface", name=item + "_std")) for item in chunk]
+
+    def job(self, items):
+        return self.conversionJob.ConversionJob(items, self.convert, chunkSize=2,
+                                                finished=self.finished.append)
+
+    def test_chunks(self):
+        job = self.job(["a", "b", "c", "d", "e"])
+        self.assertEqual(job.step(), [("a", "a_std"), ("b", "b_std")])
+        self.assertEqual(self.finished, [])
+        job.step()
+        job.step()
+
+        self.assertTrue(job.done)
+        self.assertEqual(job.chunks, 3)
+        self.assertEqual(job.step(), [])
+        self.assertEqual(len(self.finished), 1)
+        self.assertEqual([src for src, _ in self.finished[0]], ["a", "b", "c", "d", "e"])
+
+        # -the last chunk undoes as a unit
+        self.cmds.undo()
+        self.assertFalse(self.cmds.objExists("e_std"))
+        self.assertTrue(self.cmds.objExists("d_std"))
+
+    def test_cancel(self):
+        job = self.job(["a", "b", "c", "d"])
+        job.step()
+        job.cancel()
+
+        self.assertTrue(job.done)
+        self.assertEqual(job.step(), [])
+        job.cancel()
+        self.assertEqual(job.position, 2)
+        self.assertEqual(self.finished, [[("a", "a_std"), ("b", "b_std")]])
+        self.assertFalse(self.cmds.objExists("c_std"))
+
+    def test_cancel_before_step(self):
+        job = self.job(["a", "b"])
+        job.cancel()
+        self.assertEqual(job.step(), [])
+        self.assertEqual(job.chunks, 0)
+        # -nothing was converted, so there is nothing to report
+        self.assertEqual(self.finished, [])
+
+    def test_failed(self):
+        self.fail = "c"
+        job = self.job(["a", "b", "c", "d"])
+        job.step()
+        self.assertEqual(job.step(), [])
+
+        self.assertTrue(job.failed)
+        self.assertEqual(job.position, 2)
+        self.assertEqual(job.run(), job)
+        self.assertEqual(self.finished, [[("a", "a_std"), ("b", "b_std")]])
+        self.assertTrue(self.cmds.objExists("b_std"))
+
+    def test_raised(self):
+        self.fail = "raise"
+        job = self.job(["a", "b", "raise", "d"])
+        job.step()
+        with self.assertRaises(RuntimeError):
+            job.step()
+
+        self.assertTrue(job.failed)
+        self.assertEqual(job.step(), [])
+        self.assertEqual(len(self.finished), 1)
+        # -the chunk which raised is closed, undo only rolls back the first one
+        self.cmds.undo()
+        self.assertFalse(self.cmds.objExists("a_std"))
+        self.assertFalse(self.cmds.objExists("b_std"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Dry-run conversion plans and applying them.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class PlanDestinationTest(unittest.TestCase):
+    """
+    A planned conversion creates new destinations like a direct one,
+    nodes which already carry the default destination name are left alone.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.shaderHelper_main import ShaderHelper
+        from shaderHelper_plugin.scripts import conversionPlan
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.conversionPlan = conversionPlan
+        _scene.build_shader(name="matA")
+        # -has the name convert_all would give the new shader of matA
+        self.existing = cmds.shadingNode("standardSurface", asShader=True, name="ss_matA")
+
+        self.logic = ShaderHelper()
+        self.logic.convTo = "standardSurface"
+
+    def created(self, before):
+        return set(self.cmds.ls(type="standardSurface")) - before
+
+    def test_plan(self):
+        plan = self.logic.plan_conversion()
+        pair = list(plan)[0]
+        self.assertNotEqual(pair.dest, self.existing)
+        self.assertTrue(pair.create)
+
+    def test_apply(self):
+        before = set(self.cmds.ls(type="standardSurface"))
+        self.logic.apply_plan(self.logic.plan_conversion())
+        created = self.created(before)
+        self.assertEqual(len(created), 1)
+        self.assertNotIn(self.existing, created)
+
+    def test_apply_taken_since(self):
+        plan = self.conversionPlan.ConversionPlan.from_json(self.logic.plan_conversion().to_json())
+        taken = self.cmds.shadingNode("standardSurface", asShader=True, name=list(plan)[0].dest)
+
+        before = set(self.cmds.ls(type="standardSurface"))
+        self.logic.apply_plan(plan)
+        self.assertEqual(len(self.created(before)), 1)
+        self.assertNotEqual(list(plan)[0].dest, taken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Deduplication of identical legacy shaders before conversion.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class DedupeTargetTest(unittest.TestCase):
+    """
+    Dedupe against a conversion target other than the default, with the default one unavailable.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.shaderHelper_main import ShaderHelper
+        from shaderHelper_plugin.scripts import targets
+        import _scene
+
+        # -like a session without mtoa, every lookup of the default target fails
+        self.targets = targets
+        self.registered = targets._REGISTERED.copy()
+        targets._REGISTERED.pop(targets.DEFAULT, None)
+        targets._COMPILED.pop(targets.DEFAULT, None)
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+        self.shaders = [_scene.build_shader(textures=0, name=n)
+                        for n in ("matA", "matB", "matC")]
+        cmds.setAttr("matC.diffuse", 0.25)
+
+        self.logic = ShaderHelper()
+        self.logic.convTo = "standardSurface"
+
+    def tearDown(self):
+        self.targets._REGISTERED.clear()
+        self.targets._REGISTERED.update(self.registered)
+
+    def test_groups(self):
+        groups = self.logic._group_duplicates(self.shaders)
+        self.assertEqual(sorted(groups.values()), [["matA", "matB"], ["matC"]])
+
+    def test_convert(self):
+        before = set(self.cmds.ls(type="standardSurface"))
+        self.logic.convert_all(dedupe=True)
+        created = set(self.cmds.ls(type="standardSurface")) - before
+        self.assertEqual(len(created), 2)
+
+        # -the duplicate's shading group is connected to the new shader of its representative
+        sel = self.api2.MSelectionList()
+        sel.add("matBSG.surfaceShader")
+        surface = self.api2.MFnDependencyNode(sel.getPlug(0).source().node())
+        self.assertEqual(surface.typeName, "standardSurface")
+
+
+if __name__ == "__main__":
+    unittest.main()
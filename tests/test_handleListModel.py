@@ -0,0 +1,114 @@
+"""
+The handle model behind the selection listView.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class HandleListModelTest(unittest.TestCase):
+    """
+    Filtering and sorting the rows of the model, including rows appended while an audit streams in.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import baseClasses
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+        self.model = baseClasses.HandleListModel(batch=2)
+
+    def handles(self, *names):
+        handles = []
+        for n in names:
+            self.cmds.createNode("multiplyDivide", name=n)
+            handles.append(self.api2.MObjectHandle(
+                self.api2.MSelectionList().add(n).getDependNode(0)))
+        return handles
+
+    def names(self):
+        return [self.model.data(self.model.index(r)) for r in range(self.model.rowCount())]
+
+    def fetchAll(self):
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def test_filter(self):
+        self.model.set_handles(self.handles("fileA", "placeA", "fileB"))
+        self.model.set_filter("FILE")
+        self.assertEqual(self.names(), ["fileA", "fileB"])
+
+        self.model.set_filter("")
+        self.fetchAll()
+        self.assertEqual(self.names(), ["fileA", "placeA", "fileB"])
+
+    def test_append_filtered(self):
+        self.model.set_handles(self.handles("fileA"))
+        self.model.set_filter("file")
+        self.model.append_handles(self.handles("placeA", "fileB"))
+        self.fetchAll()
+        self.assertEqual(self.names(), ["fileA", "fileB"])
+
+    def test_set_handles_keeps_filter(self):
+        self.model.set_filter("file")
+        self.model.set_handles(self.handles("placeA", "fileA"))
+        self.assertEqual(self.names(), ["fileA"])
+
+    def test_set_handles_copies(self):
+        handles = self.handles("fileA")
+        self.model.set_handles(handles)
+        self.model.append_handles(self.handles("fileB"))
+        self.assertEqual(len(handles), 1)
+
+    def test_sort(self):
+        from PySide2 import QtCore
+
+        self.model.set_handles(self.handles("fileB", "placeA", "fileA"))
+        self.model.sort(0)
+        self.fetchAll()
+        self.assertEqual(self.names(), ["fileA", "fileB", "placeA"])
+
+        self.model.sort(0, QtCore.Qt.DescendingOrder)
+        self.assertEqual(self.names(), ["placeA", "fileB", "fileA"])
+
+        # -like the sort toggle of the listView, a negative column restores the order of the search
+        self.model.sort(-1)
+        self.assertEqual(self.names(), ["fileB", "placeA", "fileA"])
+
+    def test_sort_filtered(self):
+        self.model.set_handles(self.handles("fileB", "placeA", "fileA"))
+        self.model.set_filter("file")
+        self.model.sort(0)
+        self.assertEqual(self.names(), ["fileA", "fileB"])
+
+        self.model.sort(-1)
+        self.assertEqual(self.names(), ["fileB", "fileA"])
+
+        self.model.set_filter("")
+        self.fetchAll()
+        self.assertEqual(self.names(), ["fileB", "placeA", "fileA"])
+
+    def test_append_sorted(self):
+        self.model.set_handles(self.handles("fileC", "fileA"))
+        self.model.sort(0)
+        self.model.append_handles(self.handles("fileB"))
+        self.fetchAll()
+        self.assertEqual(self.names(), ["fileA", "fileB", "fileC"])
+
+    def test_set_handles_keeps_sort(self):
+        self.model.sort(0)
+        self.model.set_handles(self.handles("fileB", "fileA"))
+        self.assertEqual(self.names(), ["fileA", "fileB"])
+
+
+if __name__ == "__main__":
+    unittest.main()
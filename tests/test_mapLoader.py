@@ -0,0 +1,231 @@
+"""
+Loading, caching and validating the conversion maps.
+"""
+####### Standard Library IMPORTS #######
+from StringIO import StringIO
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class MapLoaderTest(unittest.TestCase):
+    """
+    Base of the map tests, the cache is written to a temporary folder.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from shaderHelper_plugin.scripts import mapLoader
+
+        self.mapLoader = mapLoader
+        self.tmp = tempfile.mkdtemp()
+        self.cacheDir = mapLoader.CACHE_DIR
+        mapLoader.CACHE_DIR = os.path.join(self.tmp, "cache")
+
+    def tearDown(self):
+        self.mapLoader.CACHE_DIR = self.cacheDir
+        shutil.rmtree(self.tmp)
+
+    def cacheFiles(self):
+        if not os.path.isdir(self.mapLoader.CACHE_DIR):
+            return []
+        return os.listdir(self.mapLoader.CACHE_DIR)
+
+
+class CacheWriteTest(MapLoaderTest):
+    """
+    Writing the cache never breaks loading the maps.
+    """
+
+    def test_unmarshallable(self):
+        cachePath = os.path.join(self.mapLoader.CACHE_DIR, "maps.cache")
+        self.mapLoader._write_cache(cachePath, {"compiled": object()})
+        self.assertEqual(self.cacheFiles(), [])
+
+    def test_disabled(self):
+        self.mapLoader.CACHE_DIR = ""
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        try:
+            compiled = self.mapLoader.load([self.mapLoader.DEFAULT_MAPS])
+        finally:
+            os.chdir(cwd)
+
+        self.assertIn("lambert", compiled["types"])
+        self.assertEqual(os.listdir(self.tmp), [])
+
+
+class OverrideTest(MapLoaderTest):
+    """
+    Map files given by SHADERHELPER_MAPS are merged over the default maps.
+    """
+
+    def setUp(self):
+        super(OverrideTest, self).setUp()
+        self.override = self.write("override.json", {
+            "version": 1,
+            "maps": {"lambert": {"attributes": {"diffuse": None, "color": "subsurfaceColor"},
+                                 "transforms": {"transparency": None}},
+                     "customShader": {"attributes": {"color": "baseColor"}}}})
+
+        self.environ = os.environ.get(self.mapLoader.ENV_MAPS)
+        os.environ[self.mapLoader.ENV_MAPS] = self.override
+
+    def tearDown(self):
+        if self.environ is None:
+            os.environ.pop(self.mapLoader.ENV_MAPS, None)
+        else:
+            os.environ[self.mapLoader.ENV_MAPS] = self.environ
+        super(OverrideTest, self).tearDown()
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp, name)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def test_source_paths(self):
+        self.assertEqual(self.mapLoader.source_paths(), [self.mapLoader.DEFAULT_MAPS, self.override])
+
+    def test_merge(self):
+        compiled = self.mapLoader.load()
+        lambert = compiled["maps"]["lambert"]
+        self.assertNotIn("diffuse", lambert)
+        self.assertEqual(lambert["color"], "subsurfaceColor")
+        self.assertEqual(lambert["normalCamera"], "normalCamera")
+        self.assertNotIn("transparency", compiled["transforms"]["lambert"])
+        self.assertEqual(compiled["types"][-1], "customShader")
+
+        # -the default map file isn't changed by the merge
+        self.assertIn("diffuse", self.mapLoader.load([self.mapLoader.DEFAULT_MAPS], cache=False)["maps"]["lambert"])
+
+    def test_version(self):
+        path = self.write("future.json", {"version": 2, "maps": {}})
+        self.assertRaises(ValueError, self.mapLoader.load, [self.mapLoader.DEFAULT_MAPS, path])
+
+
+class CacheTest(MapLoaderTest):
+    """
+    The cache is used until a map file changes, only the mtime is checked until it does.
+    """
+
+    def setUp(self):
+        super(CacheTest, self).setUp()
+        self.path = os.path.join(self.tmp, "maps.json")
+        shutil.copy(self.mapLoader.DEFAULT_MAPS, self.path)
+
+        self.compiled = 0
+        self.compile_maps = self.mapLoader.compile_maps
+
+        def compile_maps(data):
+            self.compiled += 1
+            return self.compile_maps(data)
+        self.mapLoader.compile_maps = compile_maps
+
+    def tearDown(self):
+        self.mapLoader.compile_maps = self.compile_maps
+        super(CacheTest, self).tearDown()
+
+    def touch(self, offset=10):
+        mtime = os.path.getmtime(self.path) + offset
+        os.utime(self.path, (mtime, mtime))
+
+    def test_warm(self):
+        first = self.mapLoader.load([self.path])
+        self.assertEqual(len(self.cacheFiles()), 1)
+        self.assertEqual(self.mapLoader.load([self.path]), first)
+        self.assertEqual(self.compiled, 1)
+
+    def test_mtime_only(self):
+        self.mapLoader.load([self.path])
+        self.touch()
+        self.mapLoader.load([self.path])
+        self.assertEqual(self.compiled, 1)
+
+        # -the new mtime is written back, the file isn't hashed again
+        hashed = []
+        source_key = self.mapLoader._source_key
+        self.mapLoader._source_key = lambda *args: hashed.append(args) or source_key(*args)
+        try:
+            self.mapLoader.load([self.path])
+        finally:
+            self.mapLoader._source_key = source_key
+        self.assertEqual(hashed, [])
+        self.assertEqual(self.compiled, 1)
+
+    def test_changed(self):
+        self.mapLoader.load([self.path])
+        with open(self.path) as f:
+            data = json.load(f)
+        data["maps"]["lambert"]["attributes"]["color"] = "subsurfaceColor"
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        self.touch()
+
+        self.assertEqual(self.mapLoader.load([self.path])["maps"]["lambert"]["color"], "subsurfaceColor")
+        self.assertEqual(self.compiled, 2)
+
+    def test_corrupt(self):
+        self.mapLoader.load([self.path])
+        cachePath = os.path.join(self.mapLoader.CACHE_DIR, self.cacheFiles()[0])
+        with open(cachePath, "wb") as f:
+            f.write(b"not marshal")
+
+        self.assertIn("lambert", self.mapLoader.load([self.path])["types"])
+        self.assertEqual(self.compiled, 2)
+
+
+class ValidateTest(MapLoaderTest):
+    """
+    Validating the maps against the schema, also through the command line.
+    """
+
+    def setUp(self):
+        super(ValidateTest, self).setUp()
+        self.bad = os.path.join(self.tmp, "bad.json")
+        with open(self.bad, "w") as f:
+            json.dump({"version": 1,
+                       "maps": {"lambert": {"attributes": {"noSuchAttr": "base", "color": "noSuchDest"},
+                                            "transforms": {"color": "open(x)", "diffuse": "1.0 -"}}}}, f)
+
+    def run_main(self, *args):
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            code = self.mapLoader.main(["validate", "--schema", self.mapLoader.DEFAULT_SCHEMA] + list(args))
+            return code, sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+
+    def test_default(self):
+        schema = self.mapLoader._read_json(self.mapLoader.DEFAULT_SCHEMA)
+        self.assertEqual(self.mapLoader.validate([self.mapLoader.DEFAULT_MAPS], schema), [])
+
+    def test_problems(self):
+        schema = self.mapLoader._read_json(self.mapLoader.DEFAULT_SCHEMA)
+        errors = self.mapLoader.validate([self.mapLoader.DEFAULT_MAPS, self.bad], schema)
+        self.assertIn("lambert.noSuchAttr doesn't exist.", errors)
+        self.assertIn("lambert.color -> aiStandardSurface.noSuchDest doesn't exist.", errors)
+        self.assertIn("lambert.color transform 'open(x)' uses unknown names: open", errors)
+        self.assertTrue(any(e.startswith("lambert.diffuse transform '1.0 -'") for e in errors))
+
+    def test_main(self):
+        code, output = self.run_main(self.mapLoader.DEFAULT_MAPS)
+        self.assertEqual(code, 0)
+        self.assertIn("0 problem(s) found", output)
+
+        code, output = self.run_main(self.mapLoader.DEFAULT_MAPS, self.bad)
+        self.assertEqual(code, 1)
+        self.assertIn("lambert.noSuchAttr doesn't exist.", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
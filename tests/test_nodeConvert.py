@@ -0,0 +1,85 @@
+"""
+Arguments of the nodeConvert command.
+"""
+####### Standard Library IMPORTS #######
+import json
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class NodeConvertArgsTest(unittest.TestCase):
+    """
+    Pairs are given positionally or through the multi-use pair flag, a dry run plan can be applied later.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.scripts import instrument
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.instrument = instrument.INSTRUMENT
+        self.instrument.reset()
+        self.instrument.enabled = True
+
+        for n in ("matA", "matB", "matC"):
+            _scene.build_shader(textures=0, name=n)
+            cmds.setAttr("%s.color" % n, 0.5, 0.25, 0.125, type="double3")
+            cmds.shadingNode("standardSurface", asShader=True, name="ss_%s" % n)
+
+    def tearDown(self):
+        self.instrument.enabled = False
+        self.instrument.reset()
+
+    def converted(self, name):
+        return abs(self.cmds.getAttr("ss_%s.baseColorG" % name) - 0.25) < 1e-6
+
+    def pairs(self):
+        return self.instrument.stats()[1]["pairs"]
+
+    def test_positional(self):
+        self.cmds.nodeConvert("matA", "ss_matA", "matB", "ss_matB")
+        self.assertTrue(self.converted("matA"))
+        self.assertTrue(self.converted("matB"))
+        self.assertFalse(self.converted("matC"))
+        self.assertEqual(self.pairs(), 2)
+
+    def test_pair_flag(self):
+        self.cmds.nodeConvert("matA", "ss_matA", pair=[("matB", "ss_matB"), ("matC", "ss_matC")])
+        self.assertTrue(all(self.converted(n) for n in ("matA", "matB", "matC")))
+        self.assertEqual(self.pairs(), 3)
+
+    def test_uneven(self):
+        with self.assertRaises(RuntimeError):
+            self.cmds.nodeConvert("matA", "ss_matA", "matB")
+        self.assertFalse(self.converted("matA"))
+
+    def test_dryRun(self):
+        plan = self.cmds.nodeConvert(pair=[("matA", "ss_matA"), ("matB", "ss_matB")], dryRun=True)
+        self.assertEqual([(p["source"], p["dest"]) for p in json.loads(plan)["pairs"]],
+                         [("matA", "ss_matA"), ("matB", "ss_matB")])
+        self.assertFalse(self.converted("matA"))
+
+    def test_applyPlan(self):
+        plan = self.cmds.nodeConvert(pair=[("matA", "ss_matA"), ("matB", "ss_matB")], dryRun=True)
+        self.instrument.reset()
+
+        self.cmds.nodeConvert(applyPlan=plan)
+        self.assertTrue(self.converted("matA"))
+        self.assertTrue(self.converted("matB"))
+        self.assertEqual(self.pairs(), 2)
+
+    def test_applyPlan_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self.cmds.nodeConvert(applyPlan="{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
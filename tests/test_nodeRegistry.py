@@ -0,0 +1,93 @@
+"""
+The session cache of BaseNodes and the DG callbacks keeping it in sync.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class NodeRegistryTest(unittest.TestCase):
+    """
+    Removed nodes are evicted and renamed nodes refreshed, every test uses its own registry.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import nodeRegistry
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+        self.registry = nodeRegistry.NodeRegistry(max_size=2)
+        self.registry.register_callbacks()
+        for n in ("matA", "matB", "matC"):
+            cmds.shadingNode("lambert", asShader=True, name=n)
+
+    def tearDown(self):
+        self.registry.deregister_callbacks()
+
+    def test_cached(self):
+        node = self.registry.get("matA")
+        self.assertIs(self.registry.get("matA"), node)
+        self.assertEqual((self.registry.hits, self.registry.misses), (1, 1))
+
+    def test_max_size(self):
+        node = self.registry.get("matA")
+        self.registry.get("matB")
+        self.registry.get("matA")
+        self.registry.get("matC")
+
+        # -matB was the least recently used
+        self.assertEqual(len(self.registry), 2)
+        self.assertIs(self.registry.get("matA"), node)
+        self.assertEqual(self.registry.stats()["misses"], 3)
+
+    def test_removed(self):
+        self.registry.get("matA")
+        self.registry.get("matB")
+        self.cmds.delete("matA")
+        self.assertEqual(len(self.registry), 1)
+
+        self.cmds.shadingNode("lambert", asShader=True, name="matA")
+        self.assertEqual(self.registry.get("matA").type, "lambert")
+        self.assertEqual(self.registry.misses, 3)
+
+    def test_renamed(self):
+        node = self.registry.get("matA")
+        self.cmds.rename("matA", "matD")
+
+        self.assertEqual(node.name, "matD")
+        self.assertIs(self.registry.get("matD"), node)
+
+    def test_failed_callbacks(self):
+        self.registry.deregister_callbacks()
+        callbacks = self.api2._SCENE.callbacks._byId
+        registered = len(callbacks)
+        add = self.api2.MDGMessage.addConnectionCallback
+
+        def fail(*args):
+            raise RuntimeError("no callbacks")
+        self.api2.MDGMessage.addConnectionCallback = staticmethod(fail)
+        try:
+            with self.assertRaises(RuntimeError):
+                self.registry.register_callbacks()
+        finally:
+            self.api2.MDGMessage.addConnectionCallback = staticmethod(add)
+        self.registry.deregister_callbacks()
+        self.assertEqual(len(callbacks), registered)
+
+        # -without callbacks nothing is cached
+        self.assertFalse(self.registry.active)
+        self.assertIsNot(self.registry.get("matA"), self.registry.get("matA"))
+        self.assertEqual(len(self.registry), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Grouping and merging place2dTextures by there placement signature.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class Place2dMergeTest(unittest.TestCase):
+    """
+    Placers only share a bucket if they place there textures the same way.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import place2dMerge
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+        self.place2dMerge = place2dMerge
+        self.files, self.placers = zip(*[_scene.build_fileTexture("file%s" % c) for c in "ABC"])
+
+    def mobj(self, name):
+        return self.api2.MSelectionList().add(name).getDependNode(0)
+
+    def groups(self):
+        groups = self.place2dMerge.group([self.mobj(p) for p in self.placers])
+        return sorted(sorted(self.api2.MFnDependencyNode(m).name() for m in mobjs)
+                      for mobjs in groups.values())
+
+    def test_equal(self):
+        self.assertEqual(self.groups(), [sorted(self.placers)])
+
+    def test_rounded(self):
+        a, b, c = self.placers
+        self.cmds.setAttr("%s.repeatU" % a, 2.0)
+        self.cmds.setAttr("%s.repeatU" % b, 2.0000001)
+        self.cmds.setAttr("%s.repeatU" % c, 2.001)
+        self.assertEqual(self.groups(), [sorted([a, b]), [c]])
+
+    def test_upstream(self):
+        a, b, c = self.placers
+        driver = self.cmds.createNode("multiplyDivide", name="driver")
+        other = self.cmds.createNode("multiplyDivide", name="other")
+        self.cmds.connectAttr("%s.outputX" % driver, "%s.rotateUV" % a)
+        self.cmds.connectAttr("%s.outputX" % driver, "%s.rotateUV" % b)
+        self.cmds.connectAttr("%s.outputX" % other, "%s.rotateUV" % c)
+        self.assertEqual(self.groups(), [sorted([a, b]), [c]])
+
+    def test_plan_merge(self):
+        a, b, c = self.placers
+        self.cmds.setAttr("%s.repeatU" % c, 3.0)
+        # -a child plug is moved to the same child of the kept placer
+        target = self.cmds.createNode("multiplyDivide", name="target")
+        self.cmds.connectAttr("%s.outU" % b, "%s.input1X" % target)
+
+        groups = self.place2dMerge.group([self.mobj(p) for p in self.placers])
+        moves, removed = self.place2dMerge.plan_merge(groups)
+
+        self.assertEqual([self.api2.MFnDependencyNode(m).name() for m in removed], [b])
+        moved = sorted((old.partialName(includeNodeName=True, useLongNames=True),
+                        src.partialName(includeNodeName=True, useLongNames=True),
+                        dest.partialName(includeNodeName=True, useLongNames=True))
+                       for old, src, dest in moves)
+        self.assertIn(("%s.outU" % b, "%s.outU" % a, "target.input1X"), moved)
+        self.assertIn(("%s.outUV" % b, "%s.outUV" % a, "fileB.uvCoord"), moved)
+        self.assertTrue(all(src.startswith(a + ".") for _, src, _ in moved))
+        self.assertFalse(any(old.endswith(".message") for old, _, _ in moved))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Keyword search index over the scene.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class HashCollisionTest(unittest.TestCase):
+    """
+    Nodes whose MObjectHandles share a hash code are indexed side by side.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import searchIndex
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.api2 = api2
+
+        # -every node lands in the same bucket
+        self.hashCode = api2.MObjectHandle.hashCode
+        api2.MObjectHandle.hashCode = lambda handle: 1
+
+        self.index = searchIndex.SearchIndex()
+        self.index.build()
+        self.nodes = [cmds.createNode("multiplyDivide", name="collide%d" % i) for i in range(3)]
+
+    def tearDown(self):
+        self.index.deregister_callbacks()
+        self.api2.MObjectHandle.hashCode = self.hashCode
+
+    def test_search(self):
+        self.assertEqual(self.index.search(["collide"]), self.nodes)
+
+    def test_remove(self):
+        self.cmds.delete(self.nodes[1])
+        self.assertEqual(self.index.search(["collide"]), [self.nodes[0], self.nodes[2]])
+
+    def test_rename(self):
+        self.cmds.rename(self.nodes[0], "renamed")
+        self.assertEqual(self.index.search(["collide"]), self.nodes[1:])
+        self.assertEqual(self.index.search(["renamed"]), ["renamed"])
+
+    def test_selection(self):
+        sel = self.api2.MSelectionList()
+        sel.add(self.nodes[2])
+        self.assertEqual(self.index.search(["collide"], selection=sel), [self.nodes[2]])
+
+
+class KeywordTest(unittest.TestCase):
+    """
+    Substring, prefix and empty keywords against the name and type fields.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from maya.api import OpenMaya as api2
+        from shaderHelper_plugin.scripts import searchIndex
+
+        _standin.new_scene()
+        self.api2 = api2
+        self.index = searchIndex.SearchIndex()
+        self.nodes = [cmds.createNode("multiplyDivide", name=n) for n in ("redMult", "mult_red", "blueMult")]
+        self.index.build()
+
+    def tearDown(self):
+        self.index.deregister_callbacks()
+
+    def test_substring(self):
+        self.assertEqual(self.index.search(["red"]), ["mult_red", "redMult"])
+        self.assertEqual(self.index.search(["RED", "blue"]), ["blueMult", "mult_red", "redMult"])
+
+    def test_prefix(self):
+        self.assertEqual(self.index.search(["red*"]), ["redMult"])
+        self.assertEqual(self.index.search(["mult_*"]), ["mult_red"])
+        # -the type field is searched as well
+        self.assertEqual(self.index.search(["multiply*"]), sorted(self.nodes))
+
+    def test_empty(self):
+        everything = self.index.search(["*"])
+        self.assertTrue(set(self.nodes) <= set(everything))
+        self.assertEqual(self.index.search([""]), everything)
+
+        sel = self.api2.MSelectionList()
+        sel.add(self.nodes[0])
+        self.assertEqual(self.index.search([""], selection=sel), [self.nodes[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Conversion targets which drop attributes of the base maps.
+"""
+####### Standard Library IMPORTS #######
+import json
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class DroppedParentTest(unittest.TestCase):
+    """
+    The renames of the usdPreviewSurface target, compiled against the standardSurface of the stand-in.
+    The transparency compound is dropped, only transparencyR is mapped onto the opacity.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.scripts import targets
+        from shaderHelper_plugin.scripts.targetTypes import usdPreview
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.targets = targets
+        self.module = targets._REGISTERED["standardSurface"]
+        self.target = targets.Target("standardSurface", usdPreview.PREFIX, usdPreview.RENAME)
+
+        # -the destinations are standardSurfaces, so they are converted with this target
+        targets.register_target("standardSurface", self.module)
+        targets._COMPILED["standardSurface"] = self.target
+
+        cmds.shadingNode("lambert", asShader=True, name="matA")
+        cmds.setAttr("matA.transparency", 0.5, 0.5, 0.5, type="double3")
+        cmds.shadingNode("standardSurface", asShader=True, name="usd_matA")
+        self.file = _scene.build_fileTexture("fileA")[0]
+
+    def tearDown(self):
+        self.targets.register_target("standardSurface", self.module)
+
+    def values(self):
+        plan = json.loads(self.cmds.nodeConvert("matA", "usd_matA", dryRun=True))
+        return dict(plan["pairs"][0]["values"])
+
+    def test_map(self):
+        m = self.target.get_map("lambert")
+        self.assertEqual(m["transparencyR"], "opacity")
+        self.assertNotIn("transparency", m)
+        self.assertIn("transparency", self.target.get_relatives("lambert")["transparencyR"])
+
+    def test_unconnected(self):
+        self.assertAlmostEqual(self.values()["opacity"], 0.5)
+
+    def test_parent_connected(self):
+        self.cmds.connectAttr("%s.outColor" % self.file, "matA.transparency")
+        self.assertNotIn("opacity", self.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
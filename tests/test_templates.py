@@ -0,0 +1,63 @@
+"""
+Invalidation of the nodeConvert templates.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class TemplateTargetTest(unittest.TestCase):
+    """
+    Networks of the same shape share a template, until the target or the maps change.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from maya import cmds
+        from shaderHelper_plugin.scripts import static_lib
+        from shaderHelper_plugin.scripts import targets
+        import _scene
+
+        _standin.new_scene()
+        self.cmds = cmds
+        self.static_lib = static_lib
+        self.targets = targets
+        self.module = targets._REGISTERED["standardSurface"]
+
+        for n in ("matA", "matB"):
+            _scene.build_shader(textures=0, name=n)
+            cmds.setAttr("%s.color" % n, 0.5, 0.25, 0.125, type="double3")
+            cmds.shadingNode("standardSurface", asShader=True, name="ss_%s" % n)
+
+    def tearDown(self):
+        self.targets.register_target("standardSurface", self.module)
+
+    def test_register(self):
+        self.cmds.nodeConvert("matA", "ss_matA")
+        self.assertAlmostEqual(self.cmds.getAttr("ss_matA.baseColorG"), 0.25)
+
+        self.targets.register_target("standardSurface", "tests._target")
+        self.cmds.nodeConvert("matB", "ss_matB")
+        self.assertAlmostEqual(self.cmds.getAttr("ss_matB.subsurfaceColorG"), 0.25)
+        self.assertNotAlmostEqual(self.cmds.getAttr("ss_matB.baseColorG"), 0.25)
+
+    def test_reload_maps(self):
+        self.cmds.nodeConvert("matA", "ss_matA")
+
+        maps = self.static_lib.LEGALTYPES_MAPS
+        reloaded = dict(maps, lambert=dict(maps["lambert"], colorG="subsurfaceColorG"))
+        self.static_lib.LEGALTYPES_MAPS = reloaded
+        try:
+            self.cmds.nodeConvert("matB", "ss_matB")
+        finally:
+            self.static_lib.LEGALTYPES_MAPS = maps
+        self.assertAlmostEqual(self.cmds.getAttr("ss_matB.subsurfaceColorG"), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Running and cancelling texture audits.
+"""
+####### Standard Library IMPORTS #######
+import threading
+import time
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class CancelTest(unittest.TestCase):
+    """
+    Cancelling doesn't wait for the workers, the pool is joined by a later poll.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from shaderHelper_plugin.scripts import textureAudit
+
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.checked = []
+
+        def rule(record):
+            self.started.set()
+            self.gate.wait(5)
+            self.checked.append(record)
+            return "flagged"
+
+        self.audit = textureAudit.TextureAudit(range(4), [rule], workers=1, chunkSize=1).start()
+
+    def tearDown(self):
+        self.gate.set()
+        self.audit.wait()
+
+    def drain(self):
+        for _ in range(500):
+            if self.audit.done:
+                return
+            time.sleep(0.01)
+        self.fail("The audit didn't drain.")
+
+    def test_cancel(self):
+        self.started.wait(5)
+        start = time.time()
+        self.audit.cancel()
+        self.assertLess(time.time() - start, 1)
+        self.assertFalse(self.audit.done)
+
+        # -the running record finishes, the records left aren't checked
+        self.gate.set()
+        self.drain()
+        self.assertEqual(self.audit.poll(), [])
+        self.assertIsNone(self.audit._pool)
+        self.assertEqual(self.checked, [0])
+
+    def test_poll(self):
+        self.gate.set()
+        self.drain()
+        self.assertEqual(sorted(r for r, _ in self.audit.poll()), [0, 1, 2, 3])
+        self.assertIsNone(self.audit._pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Value transforms of the conversion maps.
+"""
+####### Standard Library IMPORTS #######
+import unittest
+
+############ CUSTOM IMPORTS ############
+from tests import _standin
+
+
+class TransformCase(unittest.TestCase):
+    """
+    Base of the transform tests, gets the compiled transforms of the shipped maps.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _standin.initialize()
+
+    def setUp(self):
+        from shaderHelper_plugin.scripts import bulkValues
+        from shaderHelper_plugin.scripts import static_lib
+
+        self.bulkValues = bulkValues
+        self.transforms = static_lib.LEGALTYPES_TRANSFORMS
+
+    def assertValues(self, values, expected):
+        self.assertEqual(len(values), len(expected))
+        for v, e in zip(values, expected):
+            if isinstance(e, list):
+                self.assertValues(v, e)
+            else:
+                self.assertAlmostEqual(v, e)
+
+
+class TransformTest(TransformCase):
+    """
+    The transforms evaluated value by value, like without NumPy.
+    """
+
+    def test_transparency(self):
+        transform = self.transforms["lambert"]["transparency"]
+        self.assertEqual(transform.expression, "1.0 - x")
+        self.assertValues(transform([0.25, 1.0]), [0.75, 0.0])
+        self.assertValues(transform([[0.1, 0.2, 0.3]]), [[0.9, 0.8, 0.7]])
+
+        # -the children of a compound share the transform of there parent
+        self.assertIs(self.transforms["lambert"]["transparencyR"], transform)
+
+    def test_eccentricity(self):
+        transform = self.transforms["blinn"]["eccentricity"]
+        self.assertValues(transform([0.25, 4.0, -1.0]), [0.5, 1.0, 0.0])
+
+    def test_cosinePower(self):
+        transform = self.transforms["phong"]["cosinePower"]
+        self.assertValues(transform([0.0, 30.0]), [1.0, (2.0 / 32.0) ** 0.25])
+
+    def test_builtins_blocked(self):
+        for expr in ("__import__('os').getcwd()", "open('x')", "abs(x)"):
+            transform = self.bulkValues.compile_transform(expr)
+            self.assertRaises(NameError, transform, [1.0])
+
+    def test_without_numpy(self):
+        numpy, self.bulkValues.numpy = self.bulkValues.numpy, None
+        try:
+            values = self.bulkValues.to_array([0.25, 1.0])
+            self.assertIsInstance(values, list)
+            values = self.transforms["lambert"]["transparency"](values)
+            self.assertValues(self.bulkValues.to_list(values), [0.75, 0.0])
+        finally:
+            self.bulkValues.numpy = numpy
+
+
+class NumpyTransformTest(TransformCase):
+    """
+    Whole arrays are transformed with the NumPy functions, they give the same values.
+    """
+
+    def setUp(self):
+        super(NumpyTransformTest, self).setUp()
+        if self.bulkValues.numpy is None:
+            self.skipTest("NumPy isn't available.")
+
+    def test_same_values(self):
+        values = [-1.0, 0.0, 0.25, 0.5, 1.0, 4.0, 30.0]
+        for transforms in self.transforms.values():
+            for transform in transforms.values():
+                array = transform(self.bulkValues.to_array(values))
+                self.assertValues(self.bulkValues.to_list(array), transform(values))
+
+    def test_compound(self):
+        transform = self.transforms["lambert"]["transparency"]
+        array = transform(self.bulkValues.to_array([[0.1, 0.2, 0.3], [1.0, 0.0, 0.5]]))
+        self.assertValues(self.bulkValues.to_list(array), [[0.9, 0.8, 0.7], [0.0, 1.0, 0.5]])
+
+    def test_builtins_blocked(self):
+        for expr in ("__import__('os').getcwd()", "open('x')", "abs(x)"):
+            transform = self.bulkValues.compile_transform(expr)
+            self.assertRaises(NameError, transform, self.bulkValues.to_array([1.0]))
+
+
+if __name__ == "__main__":
+    unittest.main()